@@ -0,0 +1,154 @@
+# asyncio 기반 동시 요청 검색 순위 체커
+import asyncio
+import time
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+from search_rank_checker import SearchRankChecker
+from rate_limiter import HostRateLimiter
+from page_scanner import PageScan
+from serp_specs import SERP_PAGING
+from fetch_guard import CircuitOpenError
+from http_client import async_get, create_async_session
+
+
+class AsyncSearchRankChecker(SearchRankChecker):
+    """요청을 동시에 max_concurrency 개까지 보내는 검색 순위 체커
+
+    요청마다 고정 지연 대신 호스트별 토큰 버킷으로 속도를 제한하므로 응답
+    대기와 지연 시간이 겹친다. 반환 레코드 형태는 SearchRankChecker 와 같다.
+    """
+
+    def __init__(self, config_module):
+        if aiohttp is None and config_module.SEARCH_SETTINGS.get('http_client', 'requests') != 'httpx':
+            raise ImportError("async 엔진을 사용하려면 aiohttp 패키지가 필요합니다. (pip install aiohttp)")
+        super().__init__(config_module)
+        self.max_concurrency = self.config.SEARCH_SETTINGS.get('max_concurrency', 4)
+        self.rate_limiter = HostRateLimiter.from_settings(self.config.SEARCH_SETTINGS)
+
+    def set_delay(self, delay):
+        """요청 간 지연을 같은 평균 속도의 호스트별 토큰 버킷으로 적용 (이 엔진은 고정 지연을 쓰지 않는다)"""
+        super().set_delay(delay)
+        self.rate_limiter = HostRateLimiter(1 / max(delay, 0.001), self.rate_limiter.burst)
+
+    def check_all_ranks(self, clinic_name, keywords, search_types=None):
+        """모든 검색 유형에 대한 순위 체크 (검색 유형과 키워드를 동시에 요청)"""
+        clinic = {'name': clinic_name, 'keywords': keywords}
+        return self.check_clinics_ranks([clinic], search_types)
+
+    def fetch_plan(self, plan, matcher, progress_callback=None, page_callback=None):
+        """검색 계획의 고유 쌍을 동시에 검색해 매칭 결과를 모음"""
+        pages, interrupted = asyncio.run(self._fetch_plan_async(plan, matcher, progress_callback, page_callback))
+        if interrupted is not None:
+            raise interrupted
+        return pages
+
+    async def _fetch_plan_async(self, plan, matcher, progress_callback, page_callback=None):
+        """이벤트 루프 안에서 검색 계획 실행 (매칭 결과, 콜백이 던진 KeyboardInterrupt/SystemExit) 반환
+
+        콜백은 작업 안이 아니라 여기서 완료 순서대로 부른다. 콜백 예외나 차단 중단으로 빠져나가도
+        남은 작업을 모두 취소하고 기다린 뒤 끝내며, KeyboardInterrupt/SystemExit 는 이벤트 루프를
+        바로 멈추게 해 작업이 정리되지 않으므로 잡아서 돌려주고 fetch_plan 이 루프 밖에서 다시 던진다.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        pages = {}
+        total = len(plan)
+        timings = self.timings
+        interrupted = None
+
+        async with create_async_session(self.http_backend, self.config, dict(self.session.headers)) as http:
+
+            async def fetch_html(keyword, search_type, page):
+                url = self.search_url(search_type, keyword, page)
+                cached = self.cached_page(url, search_type, keyword, page)
+                if cached and cached.fresh:
+                    return cached.body
+
+                def on_connect(seconds):
+                    timings.add(search_type, 'connect', seconds)
+
+                def on_wait(seconds):
+                    timings.add(search_type, 'wait', seconds)
+
+                async def request():
+                    # 세마포어와 토큰 버킷을 기다린 시간은 대기 단계로 잰다
+                    waited = time.perf_counter()
+                    async with semaphore:
+                        await self.rate_limiter.acquire_async(url, self.guard.slowdown)
+                        timings.add(search_type, 'wait', time.perf_counter() - waited)
+                        print(f"{search_type} 검색 중: {keyword} {page}페이지 (관심 치과 {len(plan[(keyword, search_type)])}곳)")
+                        started = time.perf_counter()
+                        status, body, headers, decode = await async_get(
+                            http, url, self.conditional_headers(cached), on_connect
+                        )
+                        elapsed = time.perf_counter() - started
+                        timings.add(search_type, 'download', elapsed, len(body))
+                        if self.on_request:
+                            self.on_request(elapsed, status)
+                    with timings.measure(search_type, 'decode'):
+                        text = decode()
+                    return status, text, headers
+
+                # 재시도 대기는 세마포어 밖에서 하므로 다른 요청을 막지 않는다
+                status, text, headers = await self.guard.call_async(url, request, on_wait)
+                return self.store_page(cached, url, search_type, keyword, status, text, headers, page)
+
+            async def fetch_one(keyword, search_type):
+                try:
+                    pages[(keyword, search_type)] = await scan_pages(keyword, search_type)
+                except CircuitOpenError:
+                    raise
+                except Exception as e:
+                    print(f"{search_type} 검색 중 오류 발생: {e}")
+                    pages[(keyword, search_type)] = e
+                return keyword, search_type
+
+            async def scan_pages(keyword, search_type):
+                # SearchRankChecker.fetch_matched_pages 와 같은 방식으로 페이지를 훑는다
+                scan = PageScan(SERP_PAGING[search_type]['paged_areas'], plan[(keyword, search_type)], self.max_pages)
+                html = await fetch_html(keyword, search_type, 1)
+                prefetch = None
+                try:
+                    while True:
+                        page = scan.page + 1
+                        prefetch = None
+                        if self.prefetch_pages and page >= 2 and page < scan.max_pages:
+                            prefetch = asyncio.create_task(fetch_html(keyword, search_type, page + 1))
+
+                        # 파싱은 스레드에서 실행해 다른 요청의 다운로드를 막지 않는다
+                        sections, ranked = await asyncio.to_thread(self.parse_page, search_type, html)
+                        scan.add_page(self.match_sections(search_type, sections, matcher), ranked)
+
+                        if not scan.needs_next_page():
+                            return scan.matched
+                        if prefetch is not None:
+                            html = await prefetch
+                        else:
+                            html = await fetch_html(keyword, search_type, page + 1)
+                finally:
+                    # 끝났거나 취소/오류로 빠져나갈 때 쓰지 않은 다음 페이지 요청을 정리한다
+                    if prefetch is not None and not prefetch.done():
+                        prefetch.cancel()
+                        await asyncio.gather(prefetch, return_exceptions=True)
+
+            tasks = [asyncio.create_task(fetch_one(keyword, search_type)) for keyword, search_type in plan]
+            try:
+                for done, finished in enumerate(asyncio.as_completed(tasks), 1):
+                    keyword, search_type = await finished
+                    try:
+                        if page_callback:
+                            page_callback(keyword, search_type, pages[(keyword, search_type)])
+                        if progress_callback:
+                            progress_callback(done, total, keyword, search_type)
+                    except (KeyboardInterrupt, SystemExit) as e:
+                        interrupted = e
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+        return pages, interrupted
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Streamlit 없이 cron 등에서 돌리는 배치 순위 체크 CLI
+#
+#   python batch_cli.py run --clinics clinics.json --types 블로그,웹 --workers 4 --out results.parquet
+#
+# 결과는 NDJSON(한 줄에 레코드 하나)으로 나오는 즉시 stdout 이나 파일에 쓰고, 진행 로그는
+# stderr 로 보낸다. 오류 비율이 --max-error-rate 를 넘으면 종료 코드 3, 차단/요청 제한이
+# 계속돼 검색을 중단하면 종료 코드 4 로 끝난다. 출력을 읽는 쪽이 먼저 닫으면(| head 등)
+# 검색을 멈추고 조용히 끝낸다.
+import argparse
+import contextlib
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+import pandas as pd
+
+import config
+from checker_factory import create_checker
+from fetch_guard import CircuitOpenError
+from rank_history import RankHistory
+from rank_record import RankStatus
+from result_export import EXPORT_FORMATS, export_frame
+from search_rank_checker import SEARCH_TYPES
+
+# 종료 코드
+EXIT_OK = 0
+EXIT_SETUP_ERROR = 1
+EXIT_ERROR_RATE = 3
+EXIT_BLOCKED = 4
+
+# 줄 단위로 바로 쓰는 출력 형식
+NDJSON_EXTENSIONS = ('.ndjson', '.jsonl')
+
+
+def parse_args(argv=None):
+    """명령행 옵션 파싱"""
+    parser = argparse.ArgumentParser(description="치과 검색노출 순위 배치 체크")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help="순위 체크 실행")
+    run.add_argument('--clinics', default='clinics.json',
+                     help="치과 목록 JSON (웹 앱의 clinics.json 형식, 기본 파일이 없으면 config.DENTAL_CLINICS)")
+    run.add_argument('--types', default=','.join(SEARCH_TYPES),
+                     help="검색 유형 (쉼표로 구분, 기본: 전체)")
+    run.add_argument('--workers', type=int,
+                     help="동시 요청 수 (1 보다 크면 엔진을 지정하지 않았을 때 thread 엔진 사용)")
+    run.add_argument('--engine', choices=['sync', 'thread', 'async'],
+                     help="검색 엔진 (기본: SEARCH_SETTINGS['engine'])")
+    run.add_argument('--out', default='-',
+                     help="결과 파일 (.ndjson/.jsonl 은 바로바로 기록, .parquet/.csv/.xlsx 는 끝나고 저장, - 는 stdout)")
+    run.add_argument('--stream', action='store_true',
+                     help="--out 이 표 형식 파일일 때도 NDJSON 을 stdout 으로 함께 출력")
+    run.add_argument('--max-error-rate', type=float, default=0.2,
+                     help="오류 검색 비율이 이 값을 넘으면 종료 코드 3 (기본 0.2)")
+    run.add_argument('--no-history', action='store_true',
+                     help="순위 기록 DB 에 추가하지 않음")
+    run.add_argument('--quiet', action='store_true',
+                     help="진행 로그를 출력하지 않음")
+    return parser.parse_args(argv)
+
+
+def load_clinics(path):
+    """치과 목록 로드 (웹 앱과 같이 기본 clinics.json 이 없으면 config 의 목록 사용)"""
+    if not os.path.exists(path):
+        if path == 'clinics.json':
+            return config.DENTAL_CLINICS
+        raise FileNotFoundError(f"치과 목록 파일이 없습니다: {path}")
+    with open(path, 'r', encoding='utf-8') as f:
+        clinics = json.load(f)
+    for clinic in clinics:
+        if not clinic.get('name') or not clinic.get('keywords'):
+            raise ValueError(f"치과 이름과 키워드가 필요합니다: {clinic}")
+    return clinics
+
+
+def parse_types(text):
+    """쉼표로 구분한 검색 유형 목록 검증"""
+    search_types = [search_type.strip() for search_type in text.split(',') if search_type.strip()]
+    unknown = [search_type for search_type in search_types if search_type not in SEARCH_TYPES]
+    if unknown or not search_types:
+        raise ValueError(f"알 수 없는 검색 유형: {', '.join(unknown) or text} (가능: {', '.join(SEARCH_TYPES)})")
+    return search_types
+
+
+def batch_config(engine=None, workers=None):
+    """config 모듈을 복사해 엔진과 동시 요청 수만 바꾼 설정"""
+    settings = {name: getattr(config, name) for name in dir(config) if name.isupper()}
+    search_settings = dict(config.SEARCH_SETTINGS)
+    if workers:
+        search_settings['max_concurrency'] = workers
+        if engine is None and workers > 1 and search_settings.get('engine', 'sync') == 'sync':
+            engine = 'thread'
+    if engine:
+        search_settings['engine'] = engine
+    settings['SEARCH_SETTINGS'] = search_settings
+    return SimpleNamespace(**settings)
+
+
+def output_format(path):
+    """--out 경로로 출력 형식 판단 ('ndjson', 'xlsx', 'csv', 'parquet')"""
+    if path == '-':
+        return 'ndjson'
+    extension = os.path.splitext(path)[1].lower()
+    if extension in NDJSON_EXTENSIONS:
+        return 'ndjson'
+    if extension.lstrip('.') in EXPORT_FORMATS:
+        return extension.lstrip('.')
+    raise ValueError(f"알 수 없는 출력 형식: {path} (.ndjson, .jsonl, {', '.join('.' + f for f in EXPORT_FORMATS)})")
+
+
+def error_rate(results):
+    """(치과, 키워드, 검색 유형) 검색 중 오류로 끝난 비율"""
+    pairs = {(r['clinic_name'], r['keyword'], r['search_type']) for r in results}
+    failed = {(r['clinic_name'], r['keyword'], r['search_type']) for r in results if r['rank'] == RankStatus.ERROR.value}
+    return len(failed) / len(pairs) if pairs else 0.0
+
+
+def run(args):
+    """배치 실행 후 종료 코드 반환"""
+    try:
+        clinics = load_clinics(args.clinics)
+        search_types = parse_types(args.types)
+        fmt = output_format(args.out)
+        checker = create_checker(batch_config(args.engine, args.workers))
+    except Exception as e:
+        print(f"설정 오류: {e}", file=sys.stderr)
+        return EXIT_SETUP_ERROR
+
+    stdout = sys.stdout
+    stream = None
+    if fmt == 'ndjson':
+        stream = stdout if args.out == '-' else open(args.out, 'w', encoding='utf-8')
+    elif args.stream:
+        stream = stdout
+
+    def on_results(clinic_name, keyword, search_type, results):
+        # 검색이 끝나는 즉시 한 줄에 하나씩 내보낸다
+        if stream is None:
+            return
+        for result in results:
+            stream.write(json.dumps(result, ensure_ascii=False) + '\n')
+        stream.flush()
+
+    # 체커의 진행 로그가 NDJSON 출력에 섞이지 않도록 stderr 로 보낸다
+    log = open(os.devnull, 'w') if args.quiet else sys.stderr
+    try:
+        with contextlib.redirect_stdout(log):
+            results = checker.check_clinics_ranks(clinics, search_types, result_callback=on_results)
+            if fmt != 'ndjson':
+                export_frame(pd.DataFrame(results), os.path.splitext(args.out)[0], fmt)
+            run_id = None
+            if not args.no_history:
+                history = RankHistory.from_config(checker.config)
+                if history is not None:
+                    run_id = history.append_run(results, clinics=clinics, fetched_at=checker.reused_fetched_at)
+                    history.close()
+                    print(f"순위 기록이 추가되었습니다: {history.db_path} (실행 {run_id})")
+            checker.save_metrics(run_id)
+    except BrokenPipeError:
+        # 종료할 때 stdout 을 비우다 같은 오류가 다시 나지 않도록 /dev/null 로 돌린다
+        os.dup2(os.open(os.devnull, os.O_WRONLY), stdout.fileno())
+        return EXIT_OK
+    except CircuitOpenError as e:
+        print(f"검색 중단: {e}", file=sys.stderr)
+        return EXIT_BLOCKED
+    finally:
+        checker.close()
+        if stream is not None and stream is not stdout:
+            stream.close()
+        if log is not sys.stderr:
+            log.close()
+
+    rate = error_rate(results)
+    print(f"검색 {len(results)}건, 오류 비율 {rate:.1%}", file=sys.stderr)
+    if rate > args.max_error_rate:
+        print(f"오류 비율이 기준({args.max_error_rate:.1%})을 넘었습니다.", file=sys.stderr)
+        return EXIT_ERROR_RATE
+    return EXIT_OK
+
+
+def main(argv=None):
+    """배치 CLI 진입점"""
+    args = parse_args(argv)
+    if args.command == 'run':
+        return run(args)
+    return EXIT_SETUP_ERROR
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# 픽스처 페이지로 파싱/추출/매칭 시간과 메모리를 재는 오프라인 벤치마크
+#
+#   python benchmark.py --save-baseline      # 기준값 저장 (변경 전)
+#   python benchmark.py                      # 기준값과 비교, 처리량이 떨어지면 종료 코드 3
+#
+# 검색 유형(check_blog_rank / check_web_rank / check_place_rank 경로)과 파서 백엔드마다
+# 페이지당 파싱, 추출, 매칭 시간과 파싱+추출 중 최대 메모리를 재고, 픽스처 전체를
+# check_clinics_ranks 로 검색하는 시간(전체 경로)도 잰다. 기준값은 기계마다 다르므로
+# 같은 기계에서 저장한 기준값과 비교해야 한다. 저장소의 data/benchmark_baseline.json 은
+# 합성 픽스처로 잰 참고값이며, 허용 하락폭(threshold)도 함께 저장해 비교에 쓴다.
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+from clinic_matcher import ClinicMatcher
+from html_backend import PARSER_BACKENDS
+from serp_fixtures import FIXTURE_DIR, FixtureChecker, FixtureCorpus, fixture_config
+
+# 종료 코드 (batch_cli 와 같은 규칙)
+EXIT_OK = 0
+EXIT_SETUP_ERROR = 1
+EXIT_REGRESSION = 3
+
+DEFAULT_BASELINE = os.path.join('data', 'benchmark_baseline.json')
+
+# 기준값과 비교하는 처리량 지표 (클수록 좋다, checks 는 치과 × 키워드 검색 수)
+THROUGHPUT_METRICS = ('pages_per_sec', 'checks_per_sec')
+
+# 처리량 허용 하락폭 기본값 (같은 기계에서도 반복 측정이 ±30% 정도 흔들린다)
+DEFAULT_THRESHOLD = 0.35
+
+
+def parse_args(argv=None):
+    """명령행 옵션 파싱"""
+    parser = argparse.ArgumentParser(description="검색 결과 파서/매처 벤치마크")
+    parser.add_argument('--fixtures', default=FIXTURE_DIR, help=f"픽스처 폴더 (기본: {FIXTURE_DIR})")
+    parser.add_argument('--backends', default=','.join(PARSER_BACKENDS),
+                        help="파서 백엔드 (쉼표로 구분, 기본: 전체)")
+    parser.add_argument('--full-parsing', action='store_true', help="부분 파싱 대신 전체 문서 파싱")
+    parser.add_argument('--repeat', type=int, default=7, help="측정 반복 횟수 (가장 짧은 시간 사용)")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help=f"기준값 파일 (기본: {DEFAULT_BASELINE})")
+    parser.add_argument('--save-baseline', action='store_true', help="이번 결과를 기준값으로 저장")
+    parser.add_argument('--threshold', type=float,
+                        help=f"처리량이 기준값보다 이 비율 넘게 떨어지면 실패 "
+                             f"(기본: 기준값 파일에 저장된 값, 없으면 {DEFAULT_THRESHOLD})")
+    parser.add_argument('--json', help="측정 결과를 JSON 으로 저장할 경로")
+    return parser.parse_args(argv)
+
+
+def best_time(func, repeat, min_sample=0.02):
+    """func() 한 번에 걸리는 가장 짧은 시간(초)과 반환값
+
+    timeit 처럼 한 표본이 min_sample 초 이상이 되도록 여러 번 묶어 실행하고, 측정 중에는
+    GC 를 끄고, repeat 개 표본 중 최솟값을 쓴다 (다른 프로세스 탓에 늘어난 시간을 뺀다).
+    """
+    result = func()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        number = 1
+        while True:
+            started = time.perf_counter()
+            for _ in range(number):
+                func()
+            elapsed = time.perf_counter() - started
+            if elapsed >= min_sample:
+                break
+            number *= 2
+        samples = [elapsed]
+        for _ in range(repeat - 1):
+            started = time.perf_counter()
+            for _ in range(number):
+                func()
+            samples.append(time.perf_counter() - started)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return min(samples) / number, result
+
+
+def peak_memory(func):
+    """func() 실행 중 늘어난 최대 메모리 (바이트, tracemalloc 이 추적하는 파이썬 할당 기준)"""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_search_type(corpus, pages, search_type, backend, partial_parsing, repeat):
+    """검색 유형 하나의 모든 픽스처 페이지를 파싱/추출/매칭한 측정값"""
+    checker = FixtureChecker(fixture_config(backend, partial_parsing, corpus.max_pages()), pages)
+    extractor = checker.extractor
+    matcher = ClinicMatcher(corpus.clinics)
+    parse_s = extract_s = match_s = 0.0
+    peak = 0
+    page_count = 0
+    try:
+        for (page_type, keyword, _), html in pages.items():
+            if page_type != search_type:
+                continue
+            page_count += 1
+            seconds, doc = best_time(lambda: extractor.parse(search_type, html), repeat)
+            parse_s += seconds
+            seconds, (sections, _) = best_time(lambda: extractor.extract_doc(search_type, doc), repeat)
+            extract_s += seconds
+
+            def match():
+                matched = checker.match_sections(search_type, sections, matcher)
+                return [checker.build_results(name, keyword, search_type, matched) for name in corpus.clinics]
+
+            seconds, _ = best_time(match, repeat)
+            match_s += seconds
+            peak = max(peak, peak_memory(lambda: extractor.extract(search_type, html)))
+
+        # 전체 경로: 픽스처의 모든 키워드를 치과 목록 전체로 검색 (페이지 넘김, 레코드 생성 포함)
+        keywords = [keyword for case_type, keyword in corpus.cases() if case_type == search_type]
+        clinics = [{'name': name, 'keywords': keywords} for name in corpus.clinics]
+        with contextlib.redirect_stdout(io.StringIO()):
+            check_s, _ = best_time(lambda: checker.check_clinics_ranks(clinics, [search_type]), repeat)
+    finally:
+        checker.close()
+
+    total_s = parse_s + extract_s + match_s
+    return {
+        'pages': page_count,
+        'parse_ms': parse_s / page_count * 1000,
+        'extract_ms': extract_s / page_count * 1000,
+        'match_ms': match_s / page_count * 1000,
+        'peak_kb': peak / 1024,
+        'pages_per_sec': page_count / total_s if total_s else 0.0,
+        'checks': len(keywords) * len(clinics),
+        'check_ms': check_s * 1000,
+        'checks_per_sec': len(keywords) * len(clinics) / check_s if check_s else 0.0,
+    }
+
+
+def run_benchmark(corpus, backends, partial_parsing, repeat):
+    """{'백엔드/검색 유형': 측정값}"""
+    pages = corpus.pages()
+    search_types = list(dict.fromkeys(search_type for search_type, _ in corpus.cases()))
+    results = {}
+    for backend in backends:
+        for search_type in search_types:
+            try:
+                measured = bench_search_type(corpus, pages, search_type, backend, partial_parsing, repeat)
+            except ImportError as e:
+                print(f"⏭️ {backend}: 건너뜀 ({e})", file=sys.stderr)
+                break
+            results[f"{backend}/{search_type}"] = measured
+    return results
+
+
+def print_report(results, baseline):
+    """측정 결과 표 (기준값이 있으면 처리량 변화율도 표시)"""
+    print(f"{'백엔드/검색 유형':<22} {'페이지':>4} {'파싱ms':>8} {'추출ms':>8} {'매칭ms':>8} "
+          f"{'메모리KB':>9} {'페이지/초':>9} {'전체ms':>8} {'검색/초':>9} {'변화':>7}")
+    for key, m in results.items():
+        change = ''
+        if key in baseline and baseline[key].get('pages_per_sec'):
+            change = f"{m['pages_per_sec'] / baseline[key]['pages_per_sec'] - 1:+.0%}"
+        print(f"{key:<22} {m['pages']:>6} {m['parse_ms']:>10.2f} {m['extract_ms']:>10.2f} {m['match_ms']:>10.2f} "
+              f"{m['peak_kb']:>11.0f} {m['pages_per_sec']:>12.1f} {m['check_ms']:>10.1f} {m['checks_per_sec']:>12.0f} "
+              f"{change:>9}")
+
+
+def regressions(results, baseline, threshold):
+    """기준값보다 처리량이 threshold 비율 넘게 떨어진 [(키, 지표, 기준값, 측정값)]"""
+    found = []
+    for key, measured in results.items():
+        for metric in THROUGHPUT_METRICS:
+            base = baseline.get(key, {}).get(metric)
+            if base and measured[metric] < base * (1 - threshold):
+                found.append((key, metric, base, measured[metric]))
+    return found
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    corpus = FixtureCorpus(args.fixtures)
+    if not corpus.entries:
+        print(f"❌ 픽스처가 없습니다: {args.fixtures} (python serp_fixtures.py synth 또는 record 로 만드세요)",
+              file=sys.stderr)
+        return EXIT_SETUP_ERROR
+    backends = [b.strip() for b in args.backends.split(',') if b.strip()]
+    unknown = [b for b in backends if b not in PARSER_BACKENDS]
+    if unknown:
+        print(f"❌ 지원하지 않는 파서 백엔드: {', '.join(unknown)}", file=sys.stderr)
+        return EXIT_SETUP_ERROR
+
+    baseline = {}
+    threshold = DEFAULT_THRESHOLD
+    if os.path.exists(args.baseline) and not args.save_baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            saved = json.load(f)
+        baseline = saved.get('results', {})
+        threshold = saved.get('threshold', threshold)
+    if args.threshold is not None:
+        threshold = args.threshold
+
+    results = run_benchmark(corpus, backends, not args.full_parsing, max(1, args.repeat))
+    print_report(results, baseline)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'results': results}, f, ensure_ascii=False, indent=1)
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or '.', exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            saved = {'saved_at': time.strftime('%Y-%m-%dT%H:%M:%S'), 'threshold': threshold, 'results': results}
+            json.dump(saved, f, ensure_ascii=False, indent=1)
+        print(f"✅ 기준값을 저장했습니다: {args.baseline}")
+        return EXIT_OK
+
+    if not baseline:
+        print(f"ℹ️ 기준값이 없어 비교하지 않았습니다. (--save-baseline 으로 {args.baseline} 에 저장)")
+        return EXIT_OK
+
+    slower = regressions(results, baseline, threshold)
+    for key, metric, base, measured in slower:
+        print(f"❌ {key} {metric}: {base:.1f} → {measured:.1f} ({measured / base - 1:+.0%})")
+    if slower:
+        return EXIT_REGRESSION
+    print(f"✅ 처리량이 기준값보다 {threshold:.0%} 넘게 떨어진 항목이 없습니다.")
+    return EXIT_OK
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,19 @@
+# SEARCH_SETTINGS['engine'] 에 맞는 검색 순위 체커 생성
+from search_rank_checker import SearchRankChecker
+
+
+def create_checker(config_module):
+    """설정된 엔진의 검색 순위 체커 생성
+
+    engine: "sync"(기본, 순차 요청), "thread"(스레드 풀) 또는 "async"(asyncio)
+    """
+    engine = config_module.SEARCH_SETTINGS.get('engine', 'sync')
+    if engine == 'async':
+        from async_search_rank_checker import AsyncSearchRankChecker
+        return AsyncSearchRankChecker(config_module)
+    if engine == 'thread':
+        from threaded_search_rank_checker import ThreadedSearchRankChecker
+        return ThreadedSearchRankChecker(config_module)
+    if engine == 'sync':
+        return SearchRankChecker(config_module)
+    raise ValueError(f"알 수 없는 검색 엔진: {engine}")
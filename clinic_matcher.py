@@ -0,0 +1,79 @@
+# 여러 치과명을 한 번의 스캔으로 찾는 Aho-Corasick 매처
+from collections import deque
+
+# 제목과 본문을 한 번에 스캔할 때 쓰는 구분자 (치과명에 들어갈 수 없는 문자)
+FIELD_SEPARATOR = '\x00'
+
+
+class ClinicMatcher:
+    """치과명(및 별칭) 전체로 한 번 만들어 두고 검색 결과 항목마다 한 번만 스캔하는 매처
+
+    clinics 는 치과명 문자열 또는 {'name': ..., 'aliases': [...]} 형태의 치과 정보 목록이다.
+    """
+
+    def __init__(self, clinics):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [set()]
+        for clinic in clinics:
+            if isinstance(clinic, str):
+                name, aliases = clinic, []
+            else:
+                name, aliases = clinic['name'], clinic.get('aliases', [])
+            for pattern in [name, *aliases]:
+                if pattern:
+                    self._add_pattern(pattern, name)
+        self._build_failure_links()
+
+    def _add_pattern(self, pattern, clinic_name):
+        """트라이에 패턴 추가"""
+        state = 0
+        for char in pattern:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(set())
+            state = next_state
+        self._output[state].add(clinic_name)
+
+    def _build_failure_links(self):
+        """BFS 로 실패 링크를 만들고 출력 집합을 실패 링크를 따라 합친다"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def find(self, text):
+        """텍스트에 등장하는 모든 치과명 집합"""
+        found = set()
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+        return found
+
+    def first_matches(self, items, fields=('title', 'content')):
+        """항목 목록(순위 순)에서 치과별로 처음 매칭된 항목
+
+        항목마다 지정한 필드를 한 번에 스캔하며 {치과명: 항목} 을 반환한다.
+        """
+        matches = {}
+        for item in items:
+            text = FIELD_SEPARATOR.join(item.get(field, '') for field in fields)
+            for clinic_name in self.find(text):
+                if clinic_name not in matches:
+                    matches[clinic_name] = item
+        return matches
@@ -0,0 +1,224 @@
+# 응답 분류, 지터 백오프 재시도, 적응형 감속, 서킷 브레이커
+import asyncio
+import random
+import threading
+import time
+from enum import Enum
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# 네트워크 오류 (requests 예외는 OSError 의 하위 클래스)
+TRANSIENT_ERRORS = (
+    (OSError, asyncio.TimeoutError)
+    + ((aiohttp.ClientError,) if aiohttp is not None else ())
+    + ((httpx.TransportError,) if httpx is not None else ())
+)
+
+# 차단 확인(캡차) 페이지에 나오는 문구. 정상 검색 결과 페이지는 수백 KB 라
+# 이보다 작은 페이지에서만 찾는다 (검색 결과 본문에 같은 단어가 있어도 오탐하지 않도록).
+CAPTCHA_MARKERS = ('captcha', '자동입력 방지', '보안문자', '비정상적인 접근', '일시적으로 제한')
+CAPTCHA_MAX_LENGTH = 50_000
+
+
+class ResponseKind(Enum):
+    """응답 분류"""
+    OK = 'ok'
+    THROTTLED = 'throttled'  # 429: 요청이 너무 많음
+    BLOCKED = 'blocked'  # 403: 접근 차단
+    CAPTCHA = 'captcha'  # 200 이지만 차단 확인 페이지
+    TRANSIENT = 'transient'  # 5xx, 408, 네트워크 오류
+    ERROR = 'error'  # 그 밖의 4xx (다시 요청해도 같은 결과)
+
+
+# 잠시 후 다시 요청하면 성공할 수 있는 분류
+RETRYABLE = (ResponseKind.THROTTLED, ResponseKind.TRANSIENT)
+
+# 요청 속도를 늦추고 서킷 브레이커에 집계하는 분류
+PUSHBACK = (ResponseKind.THROTTLED, ResponseKind.BLOCKED, ResponseKind.CAPTCHA)
+
+
+class FetchError(Exception):
+    """재시도 후에도 검색 결과 페이지를 받지 못함"""
+
+    def __init__(self, kind, url, detail=''):
+        super().__init__(f"{kind.value}: {url} {detail}".strip())
+        self.kind = kind
+        self.url = url
+
+
+class CircuitOpenError(FetchError):
+    """차단이 계속돼 실행을 멈춤 (체크포인트에서 이어서 실행할 수 있다)"""
+
+    def __init__(self, message):
+        Exception.__init__(self, message)
+        self.kind = ResponseKind.BLOCKED
+        self.url = ''
+
+
+def classify_response(status_code, text):
+    """HTTP 상태 코드와 본문으로 응답 분류"""
+    if status_code == 429:
+        return ResponseKind.THROTTLED
+    if status_code == 403:
+        return ResponseKind.BLOCKED
+    if status_code == 408 or status_code >= 500:
+        return ResponseKind.TRANSIENT
+    if status_code >= 400:
+        return ResponseKind.ERROR
+    if text and len(text) < CAPTCHA_MAX_LENGTH:
+        lowered = text.lower()
+        if any(marker in lowered for marker in CAPTCHA_MARKERS):
+            return ResponseKind.CAPTCHA
+    return ResponseKind.OK
+
+
+class FetchGuard:
+    """모든 요청이 공유하는 재시도/감속/서킷 브레이커 상태
+
+    - THROTTLED/TRANSIENT 는 지터를 섞은 지수 백오프로 max_retries 번까지 다시 요청한다.
+    - THROTTLED/BLOCKED/CAPTCHA 가 오면 slowdown 을 두 배로 늘려 전체 요청 속도를 늦추고,
+      정상 응답마다 조금씩 원래 속도로 되돌린다.
+    - THROTTLED/BLOCKED/CAPTCHA 가 breaker_threshold 번 연속되면 서킷을 열어 cooldown 동안
+      모든 요청을 멈춘다. 다시 열릴 때마다 cooldown 이 두 배가 되고, breaker_max_trips 번을
+      넘으면 CircuitOpenError 로 실행을 멈춰 남은 키워드를 차단된 채로 소모하지 않는다.
+    - 멈춘 횟수는 breaker_reset 초 동안 THROTTLED/BLOCKED/CAPTCHA 가 없어야 0 으로 돌아간다
+      (기본: 가장 긴 cooldown). 동시 요청 중에는 차단 구간 사이사이에도 정상 응답이 섞여 오므로
+      정상 응답 하나로 되돌리면 차단이 반복돼도 멈춘 횟수가 쌓이지 않는다.
+    """
+
+    def __init__(self, max_retries=3, backoff_base=1.0, backoff_max=60.0, max_slowdown=8.0,
+                 breaker_threshold=3, breaker_cooldown=300.0, breaker_max_trips=3, breaker_reset=None):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_slowdown = max_slowdown
+        self.breaker_threshold = breaker_threshold
+        self.breaker_cooldown = breaker_cooldown
+        self.breaker_max_trips = breaker_max_trips
+        if breaker_reset is None:
+            breaker_reset = breaker_cooldown * (2 ** breaker_max_trips)
+        self.breaker_reset = breaker_reset
+        self.slowdown = 1.0
+        self._consecutive_pushback = 0
+        self._trips = 0
+        self._open_until = 0.0
+        self._last_pushback = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config_module):
+        """config 의 FETCH_SETTINGS 로 생성 (없으면 기본값)"""
+        settings = getattr(config_module, 'FETCH_SETTINGS', None) or {}
+        return cls(
+            max_retries=settings.get('max_retries', 3),
+            backoff_base=settings.get('backoff_base', 1.0),
+            backoff_max=settings.get('backoff_max', 60.0),
+            max_slowdown=settings.get('max_slowdown', 8.0),
+            breaker_threshold=settings.get('breaker_threshold', 3),
+            breaker_cooldown=settings.get('breaker_cooldown', 300.0),
+            breaker_max_trips=settings.get('breaker_max_trips', 3),
+            breaker_reset=settings.get('breaker_reset'),
+        )
+
+    def pause(self):
+        """서킷이 열려 있으면 기다려야 할 시간(초), 너무 여러 번 열렸으면 CircuitOpenError"""
+        with self._lock:
+            if self._trips > self.breaker_max_trips:
+                raise CircuitOpenError(f"차단/요청 제한으로 {self._trips}번 멈춘 뒤에도 계속돼 검색을 중단합니다.")
+            return max(0.0, self._open_until - time.monotonic())
+
+    def record(self, kind):
+        """응답 분류를 반영해 감속과 서킷 상태 갱신"""
+        with self._lock:
+            now = time.monotonic()
+            if kind is ResponseKind.OK:
+                self._consecutive_pushback = 0
+                # 서킷이 다시 열린 뒤로 breaker_reset 초 동안 막힌 적이 없을 때만 멈춘 횟수를 되돌린다
+                if self._trips and now - max(self._last_pushback, self._open_until) >= self.breaker_reset:
+                    self._trips = 0
+                self.slowdown = max(1.0, self.slowdown * 0.9)
+                return
+            if kind not in PUSHBACK:
+                return
+            self._last_pushback = now
+            self.slowdown = min(self.max_slowdown, self.slowdown * 2)
+            self._consecutive_pushback += 1
+            if self._consecutive_pushback >= self.breaker_threshold and now >= self._open_until:
+                cooldown = self.breaker_cooldown * (2 ** self._trips)
+                self._trips += 1
+                self._open_until = now + cooldown
+                # 다시 열린 뒤 첫 요청이 또 막히면 바로 다시 닫히도록
+                self._consecutive_pushback = self.breaker_threshold - 1
+                print(f"⏸️ 차단/요청 제한이 계속돼 {cooldown:.0f}초 동안 요청을 멈춥니다. ({kind.value})")
+
+    def retry_delay(self, attempt):
+        """attempt 번째 재시도 전 대기 시간 (full jitter 지수 백오프, 감속 배율 적용)"""
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, ceiling) * self.slowdown
+
+    def should_retry(self, kind, attempt):
+        """재시도 여부"""
+        return kind in RETRYABLE and attempt < self.max_retries
+
+    def call(self, url, request, on_wait=None):
+        """request() -> (상태 코드, 본문, 헤더) 를 분류하며 재시도하고 마지막 결과를 반환
+
+        on_wait(초) 가 있으면 서킷 대기와 재시도 대기 시간을 알린다 (단계별 소요 시간 계측용).
+        """
+        attempt = 0
+        while True:
+            wait = self.pause()
+            if wait > 0:
+                time.sleep(wait)
+                if on_wait:
+                    on_wait(wait)
+            try:
+                response = request()
+                kind = classify_response(response[0], response[1])
+                detail = f"(HTTP {response[0]})"
+            except TRANSIENT_ERRORS as e:
+                kind, detail = ResponseKind.TRANSIENT, f"({e})"
+            self.record(kind)
+            if kind is ResponseKind.OK:
+                return response
+            if not self.should_retry(kind, attempt):
+                raise FetchError(kind, url, detail)
+            delay = self.retry_delay(attempt)
+            time.sleep(delay)
+            if on_wait:
+                on_wait(delay)
+            attempt += 1
+
+    async def call_async(self, url, request, on_wait=None):
+        """call 의 asyncio 버전 (request 는 코루틴 함수)"""
+        attempt = 0
+        while True:
+            wait = self.pause()
+            if wait > 0:
+                await asyncio.sleep(wait)
+                if on_wait:
+                    on_wait(wait)
+            try:
+                response = await request()
+                kind = classify_response(response[0], response[1])
+                detail = f"(HTTP {response[0]})"
+            except TRANSIENT_ERRORS as e:
+                kind, detail = ResponseKind.TRANSIENT, f"({e})"
+            self.record(kind)
+            if kind is ResponseKind.OK:
+                return response
+            if not self.should_retry(kind, attempt):
+                raise FetchError(kind, url, detail)
+            delay = self.retry_delay(attempt)
+            await asyncio.sleep(delay)
+            if on_wait:
+                on_wait(delay)
+            attempt += 1
@@ -0,0 +1,220 @@
+# 검색 결과 HTML 파서 백엔드 (html.parser / lxml / selectolax)
+import bisect
+import re
+
+import soupsieve
+from bs4 import BeautifulSoup
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# SEARCH_SETTINGS['parser'] 로 선택할 수 있는 백엔드
+PARSER_BACKENDS = ('html.parser', 'lxml', 'selectolax')
+
+# 태그 이름별 여는/닫는 태그 패턴
+_TAG_PATTERNS = {}
+_CLASS_ATTR = re.compile(r'''\bclass\s*=\s*(?:"([^"]*)"|'([^']*)')''', re.IGNORECASE)
+
+# 태그로 해석되지 않는 구간(주석, <script>/<style> 본문)의 시작과 끝
+_RAW_TEXT_START = re.compile(r'<!--|<(script|style)\b[^>]*>', re.IGNORECASE)
+_RAW_TEXT_END = {
+    'script': re.compile(r'</script\s*>', re.IGNORECASE),
+    'style': re.compile(r'</style\s*>', re.IGNORECASE),
+}
+
+
+class SoupNode:
+    """BeautifulSoup 요소 래퍼 (html.parser, lxml 백엔드)"""
+
+    __slots__ = ('_tag',)
+
+    def __init__(self, tag):
+        self._tag = tag
+
+    def select(self, selector):
+        """CSS 선택자(문자열 또는 compile_selector 결과)와 일치하는 하위 요소 목록"""
+        if isinstance(selector, str):
+            tags = self._tag.select(selector)
+        else:
+            tags = selector.select(self._tag)
+        return [SoupNode(tag) for tag in tags]
+
+    def select_one(self, selector):
+        """CSS 선택자와 일치하는 첫 하위 요소 (없으면 None)"""
+        if isinstance(selector, str):
+            tag = self._tag.select_one(selector)
+        else:
+            tag = selector.select_one(self._tag)
+        return SoupNode(tag) if tag is not None else None
+
+    def text(self):
+        """텍스트 조각마다 공백을 제거해 이어 붙인 텍스트 (get_text(strip=True))"""
+        return self._tag.get_text(strip=True)
+
+    def attr(self, name):
+        """속성 값 (없으면 빈 문자열)"""
+        return self._tag.get(name) or ''
+
+
+class LexborNode:
+    """selectolax(lexbor) 노드 래퍼, SoupNode 와 같은 결과를 낸다"""
+
+    __slots__ = ('_node',)
+
+    def __init__(self, node):
+        self._node = node
+
+    def select(self, selector):
+        """CSS 선택자와 일치하는 하위 요소 목록"""
+        return [LexborNode(node) for node in self._node.css(selector)]
+
+    def select_one(self, selector):
+        """CSS 선택자와 일치하는 첫 하위 요소 (없으면 None)"""
+        node = self._node.css_first(selector)
+        return LexborNode(node) if node is not None else None
+
+    def text(self):
+        """텍스트 조각마다 공백을 제거해 이어 붙인 텍스트 (get_text(strip=True) 와 동일)"""
+        return self._node.text(deep=True, separator='', strip=True)
+
+    def attr(self, name):
+        """속성 값 (없으면 빈 문자열)"""
+        return self._node.attributes.get(name) or ''
+
+
+def compile_selector(selector, backend='html.parser'):
+    """백엔드에 맞게 CSS 선택자를 미리 컴파일
+
+    BeautifulSoup 백엔드는 soupsieve 로 컴파일하고, selectolax 는 lexbor 가
+    선택자를 직접 처리하므로 문자열을 그대로 쓴다.
+    """
+    if backend == 'selectolax':
+        return selector
+    return soupsieve.compile(selector)
+
+
+def parse_html(html, backend='html.parser'):
+    """선택한 백엔드로 HTML 을 파싱해 문서 노드 반환"""
+    if backend == 'selectolax':
+        if LexborHTMLParser is None:
+            raise ImportError("selectolax 파서를 사용하려면 selectolax 패키지가 필요합니다. (pip install selectolax)")
+        return LexborNode(LexborHTMLParser(html))
+    if backend in ('html.parser', 'lxml'):
+        return SoupNode(BeautifulSoup(html, backend))
+    raise ValueError(f"알 수 없는 파서 백엔드: {backend}")
+
+
+def _tag_pattern(tag):
+    """<tag ...> 와 </tag> 를 찾는 정규식 (태그별로 한 번만 컴파일)"""
+    pattern = _TAG_PATTERNS.get(tag)
+    if pattern is None:
+        pattern = _TAG_PATTERNS[tag] = re.compile(rf'<(/?){tag}\b([^>]*)>', re.IGNORECASE)
+    return pattern
+
+
+class RawTextSpans:
+    """HTML 원문에서 주석과 <script>/<style> 본문 구간 (position in spans 로 확인)
+
+    파서는 이 구간 안의 '<div ...>' 같은 문자열을 태그로 보지 않는다. 확인한 위치까지만
+    앞에서부터 찾아 두므로 결과 영역 뒤쪽의 큰 스크립트는 훑지 않는다. 닫히지 않은 구간은
+    문서 끝까지로 본다.
+    """
+
+    __slots__ = ('_html', '_starts', '_ends', '_scanned')
+
+    def __init__(self, html):
+        self._html = html
+        self._starts = []
+        self._ends = []
+        self._scanned = 0
+
+    def __contains__(self, position):
+        while self._scanned <= position:
+            self._scan_next()
+        index = bisect.bisect_right(self._starts, position) - 1
+        return index >= 0 and position < self._ends[index]
+
+    def _scan_next(self):
+        """다음 구간 하나를 찾아 추가"""
+        html = self._html
+        match = _RAW_TEXT_START.search(html, self._scanned)
+        if match is None:
+            self._scanned = len(html) + 1
+            return
+        if match.group(1) is None:
+            end = html.find('-->', match.end())
+            end = len(html) if end < 0 else end + 3
+        else:
+            close = _RAW_TEXT_END[match.group(1).lower()].search(html, match.end())
+            end = close.end() if close else len(html)
+        self._starts.append(match.start())
+        self._ends.append(end)
+        self._scanned = end
+
+
+def find_elements(html, tag, classes, exact=False, first_only=True, spans=None):
+    """HTML 원문에서 클래스가 일치하는 <tag> 요소의 원문 조각 목록
+
+    exact 가 True 면 class 속성이 classes 와 같아야 하고, 아니면 classes 의
+    클래스를 모두 포함하면 된다. 여는 태그를 찾았는데 짝이 맞는 닫는 태그가
+    없으면 조각을 믿을 수 없으므로 None 을 반환한다. 스크립트 문자열이나 주석 안의
+    태그는 파서가 태그로 보지 않으므로 건너뛴다 (spans: 같은 html 의 RawTextSpans).
+    """
+    if spans is None:
+        spans = RawTextSpans(html)
+    wanted = classes.split()
+    pattern = _tag_pattern(tag)
+    fragments = []
+    pos = 0
+    while True:
+        start = None
+        for match in pattern.finditer(html, pos):
+            if match.group(1) or match.start() in spans:
+                continue
+            class_attr = _CLASS_ATTR.search(match.group(2))
+            if class_attr is None:
+                continue
+            tokens = (class_attr.group(1) if class_attr.group(1) is not None else class_attr.group(2)).split()
+            if (tokens == wanted) if exact else set(wanted).issubset(tokens):
+                start = match
+                break
+        if start is None:
+            return fragments
+
+        # 같은 태그의 중첩을 세어 짝이 맞는 닫는 태그 찾기
+        depth = 1
+        end = None
+        for match in pattern.finditer(html, start.end()):
+            if match.start() in spans:
+                continue
+            depth += -1 if match.group(1) else 1
+            if depth == 0:
+                end = match.end()
+                break
+        if end is None:
+            return None
+
+        fragments.append(html[start.start():end])
+        if first_only:
+            return fragments
+        pos = end
+
+
+def parse_scoped(html, targets, backend='html.parser'):
+    """결과 영역 조각만 파싱한 문서 노드
+
+    targets 는 (태그, 클래스, exact, first_only) 목록이다. 어느 영역도 찾지 못했거나
+    조각을 믿을 수 없으면 전체 문서를 파싱한다.
+    """
+    fragments = []
+    spans = RawTextSpans(html)
+    for tag, classes, exact, first_only in targets:
+        found = find_elements(html, tag, classes, exact, first_only, spans)
+        if found is None:
+            return parse_html(html, backend)
+        fragments.extend(found)
+    if not fragments:
+        return parse_html(html, backend)
+    return parse_html(''.join(fragments), backend)
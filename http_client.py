@@ -0,0 +1,265 @@
+# 검색 결과 페이지를 받는 HTTP 클라이언트 (requests 또는 httpx 백엔드)
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import h2  # noqa: F401  (httpx 의 HTTP/2 지원에 필요)
+except ImportError:
+    h2 = None
+
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+# SEARCH_SETTINGS['http_client'] 에 쓸 수 있는 값
+HTTP_BACKENDS = ('requests', 'httpx')
+
+
+def http_backend(config_module):
+    """설정된 HTTP 클라이언트 백엔드 (httpx 가 없으면 오류)"""
+    backend = config_module.SEARCH_SETTINGS.get('http_client', 'requests')
+    if backend not in HTTP_BACKENDS:
+        raise ValueError(f"지원하지 않는 HTTP 클라이언트입니다: {backend} ({', '.join(HTTP_BACKENDS)} 중 선택)")
+    if backend == 'httpx' and httpx is None:
+        raise ImportError("httpx HTTP 클라이언트를 사용하려면 httpx 패키지가 필요합니다. (pip install 'httpx[http2,brotli]')")
+    return backend
+
+
+# Accept-Encoding 에 넣을 압축 방식 (선호 순서)
+CONTENT_ENCODINGS = ('gzip', 'deflate', 'br', 'zstd')
+
+
+def supported_encodings(backend):
+    """백엔드가 응답 본문을 실제로 풀 수 있는 압축 방식
+
+    패키지가 설치돼 있어도 클라이언트 버전에 따라 디코더가 없을 수 있으므로(httpx 0.27.0,
+    urllib3 1.x, aiohttp 3.12 미만은 zstd 를 풀지 못함) import 여부 대신 각 클라이언트의
+    디코더 목록을 본다. backend 는 'requests'(urllib3), 'httpx', 'aiohttp' 중 하나.
+    """
+    if backend == 'httpx':
+        from httpx._decoders import SUPPORTED_DECODERS
+        return set(SUPPORTED_DECODERS)
+    if backend == 'aiohttp':
+        from aiohttp import compression_utils
+        encodings = {'gzip', 'deflate'}
+        if getattr(compression_utils, 'HAS_BROTLI', False):
+            encodings.add('br')
+        if getattr(compression_utils, 'HAS_ZSTD', False):
+            encodings.add('zstd')
+        return encodings
+    from urllib3.response import HTTPResponse
+    return set(HTTPResponse.CONTENT_DECODERS)
+
+
+def accept_encoding(backend):
+    """백엔드가 풀 수 있는 압축 방식만 담은 Accept-Encoding 헤더 값"""
+    supported = supported_encodings(backend)
+    return ', '.join(encoding for encoding in CONTENT_ENCODINGS if encoding in supported)
+
+
+def fetch_timeouts(config_module):
+    """(연결 제한 시간, 응답 대기 제한 시간) 초"""
+    settings = getattr(config_module, 'FETCH_SETTINGS', None) or {}
+    read_timeout = settings.get('request_timeout', 30)
+    return settings.get('connect_timeout', read_timeout), read_timeout
+
+
+def request_timeout(backend, config_module):
+    """백엔드의 get(timeout=...) 에 넘길 제한 시간"""
+    connect_timeout, read_timeout = fetch_timeouts(config_module)
+    if backend == 'httpx':
+        return httpx.Timeout(read_timeout, connect=connect_timeout)
+    return connect_timeout, read_timeout
+
+
+def pool_size(config_module):
+    """호스트별로 유지할 연결 수"""
+    settings = getattr(config_module, 'FETCH_SETTINGS', None) or {}
+    return settings.get('pool_size', 10)
+
+
+def use_http2(config_module):
+    """httpx 백엔드에서 HTTP/2 를 쓸지 여부 (h2 패키지가 없으면 HTTP/1.1)"""
+    settings = getattr(config_module, 'FETCH_SETTINGS', None) or {}
+    if not settings.get('http2', True):
+        return False
+    if h2 is None:
+        print("⚠️ h2 패키지가 없어 HTTP/1.1 로 요청합니다. (pip install 'httpx[http2]')")
+        return False
+    return True
+
+
+# requests 백엔드에서 지금 스레드의 요청이 새 연결을 맺을 때 부를 콜백 (http_get 이 설정)
+_connect_listener = threading.local()
+
+
+class _TimedConnectionMixin:
+    """connect() (DNS 조회, TCP 연결, TLS 핸드셰이크) 시간을 지금 스레드의 콜백에 알리는 urllib3 연결"""
+
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        callback = getattr(_connect_listener, 'callback', None)
+        if callback:
+            callback(time.perf_counter() - started)
+
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """새 연결을 맺는 시간을 잴 수 있는 HTTPAdapter (프록시 연결은 재지 않는다)"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': _TimedHTTPConnectionPool,
+            'https': _TimedHTTPSConnectionPool,
+        }
+
+
+class ConnectTrace:
+    """httpx(httpcore) trace 확장으로 요청 하나의 연결 시간(TCP 연결 + TLS 핸드셰이크) 누적
+
+    연결 풀에서 이미 맺은 연결을 재사용하면 seconds 는 0 이다.
+    동기 Client 에는 trace, AsyncClient 에는 atrace 를 넘긴다.
+    """
+
+    EVENTS = ('connection.connect_tcp', 'connection.start_tls')
+
+    def __init__(self):
+        self.seconds = 0.0
+        self._started = None
+
+    def trace(self, event_name, info):
+        name, _, phase = event_name.rpartition('.')
+        if name not in self.EVENTS:
+            return
+        if phase == 'started':
+            self._started = time.perf_counter()
+        elif self._started is not None:
+            self.seconds += time.perf_counter() - self._started
+            self._started = None
+
+    async def atrace(self, event_name, info):
+        self.trace(event_name, info)
+
+
+def http_get(session, url, headers=None, timeout=None, on_connect=None):
+    """동기 세션으로 GET 요청 (on_connect(초) 가 있으면 새 연결을 맺는 데 걸린 시간을 알린다)"""
+    if httpx is not None and isinstance(session, httpx.Client):
+        if on_connect is None:
+            return session.get(url, headers=headers, timeout=timeout)
+        trace = ConnectTrace()
+        response = session.get(url, headers=headers, timeout=timeout, extensions={'trace': trace.trace})
+        if trace.seconds:
+            on_connect(trace.seconds)
+        return response
+    _connect_listener.callback = on_connect
+    try:
+        return session.get(url, headers=headers, timeout=timeout)
+    finally:
+        _connect_listener.callback = None
+
+
+def create_session(backend, config_module, headers):
+    """동기 HTTP 세션 생성
+
+    requests 는 호스트별 연결 풀 크기를 pool_size 로 맞춘 HTTPAdapter 를 쓰고,
+    httpx 는 HTTP/2 로 하나의 연결에 여러 요청을 다중화하므로 스레드끼리 공유해도 된다.
+    """
+    size = pool_size(config_module)
+    if backend == 'httpx':
+        return httpx.Client(
+            headers=headers,
+            http2=use_http2(config_module),
+            limits=httpx.Limits(max_connections=size, max_keepalive_connections=size),
+            timeout=request_timeout(backend, config_module),
+            follow_redirects=True,
+        )
+    session = requests.Session()
+    adapter = TimedHTTPAdapter(pool_connections=size, pool_maxsize=size)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update(headers)
+    return session
+
+
+def create_async_session(backend, config_module, headers):
+    """async 엔진용 HTTP 세션 (httpx 는 AsyncClient, requests 백엔드는 aiohttp)"""
+    size = pool_size(config_module)
+    connect_timeout, read_timeout = fetch_timeouts(config_module)
+    if backend == 'httpx':
+        return httpx.AsyncClient(
+            headers=headers,
+            http2=use_http2(config_module),
+            limits=httpx.Limits(max_connections=size, max_keepalive_connections=size),
+            timeout=httpx.Timeout(read_timeout, connect=connect_timeout),
+            follow_redirects=True,
+        )
+    import aiohttp
+    headers = dict(headers, **{'Accept-Encoding': accept_encoding('aiohttp')})
+    return aiohttp.ClientSession(
+        headers=headers,
+        connector=aiohttp.TCPConnector(limit_per_host=size),
+        timeout=aiohttp.ClientTimeout(total=read_timeout, sock_connect=connect_timeout),
+        trace_configs=[_aiohttp_connect_trace(aiohttp)],
+    )
+
+
+def _aiohttp_connect_trace(aiohttp):
+    """새 연결(DNS 조회, TCP 연결, TLS 핸드셰이크) 시간을 요청의 trace_request_ctx['on_connect'] 에 알리는 TraceConfig"""
+
+    async def on_start(session, context, params):
+        context.connect_started = time.perf_counter()
+
+    async def on_end(session, context, params):
+        on_connect = (context.trace_request_ctx or {}).get('on_connect')
+        if on_connect:
+            on_connect(time.perf_counter() - context.connect_started)
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_start.append(on_start)
+    trace_config.on_connection_create_end.append(on_end)
+    return trace_config
+
+
+async def async_get(session, url, headers=None, on_connect=None):
+    """async 세션으로 GET 요청해 (상태 코드, 본문 바이트, 헤더, 본문 디코딩 함수) 반환
+
+    디코딩을 따로 불러야 다운로드와 디코딩 시간을 나눠 잴 수 있다.
+    on_connect(초) 가 있으면 새 연결을 맺는 데 걸린 시간을 알린다.
+    """
+    if httpx is not None and isinstance(session, httpx.AsyncClient):
+        if on_connect is None:
+            response = await session.get(url, headers=headers)
+        else:
+            trace = ConnectTrace()
+            response = await session.get(url, headers=headers, extensions={'trace': trace.atrace})
+            if trace.seconds:
+                on_connect(trace.seconds)
+        return response.status_code, response.content, response.headers, lambda: response.text
+    context = {'on_connect': on_connect} if on_connect else None
+    async with session.get(url, headers=headers, trace_request_ctx=context) as response:
+        body = await response.read()
+        encoding = response.get_encoding()
+        return response.status, body, response.headers, lambda: body.decode(encoding, errors='replace')
@@ -0,0 +1,58 @@
+# 바뀐 부분만 다시 검색하는 증분 실행
+from datetime import datetime, timedelta
+
+from rank_record import RankStatus, frame_to_dicts
+from search_planner import SEARCH_TYPES, build_search_plan
+
+
+def find_reusable(history, clinics, search_types, freshness_hours, now=None):
+    """기록 DB 의 최근 결과로 대신할 수 있는 (키워드, 검색 유형) 쌍 찾기
+
+    관심 치과 모두에게 freshness_hours 안에 오류 없이 검색한 결과가 있고, 지난 실행 이후
+    별칭이 바뀌지 않았을 때만 재사용한다. 새 치과나 새 키워드는 기록이 없으므로 다시 검색된다.
+    ({(키워드, 검색 유형): {치과명: [결과 dict]}}, {(치과명, 키워드, 검색 유형): 검색 시각}) 반환
+    """
+    now = now or datetime.now()
+    latest = history.latest_results(since=now - timedelta(hours=freshness_hours))
+
+    # 지난 실행 이후 매칭 기준(별칭)이 바뀐 치과
+    previous = {clinic['name']: clinic for clinic in history.last_roster()}
+    changed = {
+        clinic['name'] for clinic in clinics
+        if clinic['name'] in previous
+        and sorted(clinic.get('aliases', [])) != sorted(previous[clinic['name']].get('aliases', []))
+    }
+
+    records = {}
+    fetched_at = {}
+    failed = set()
+    for record, checked_at in zip(frame_to_dicts(latest), latest['checked_at']):
+        key = (record['clinic_name'], record['keyword'], record['search_type'])
+        if record['rank'] == RankStatus.ERROR.value:
+            failed.add(key)
+        areas = records.setdefault(key, {})
+        # 같은 키워드가 중복 등록돼 있던 실행이면 영역별로 한 건만 남긴다
+        areas.setdefault(record['search_area'], record)
+        fetched_at[key] = checked_at.to_pydatetime()
+
+    reuse = {}
+    reused_at = {}
+    for (keyword, search_type), interested in build_search_plan(clinics, search_types).items():
+        keys = [(clinic_name, keyword, search_type) for clinic_name in interested]
+        if all(key in records and key not in failed and key[0] not in changed for key in keys):
+            reuse[(keyword, search_type)] = {key[0]: list(records[key].values()) for key in keys}
+            reused_at.update({key: fetched_at[key] for key in keys})
+    return reuse, reused_at
+
+
+def check_clinics_incremental(checker, history, clinics, search_types=None, freshness_hours=24,
+                              progress_callback=None, journal=None, result_callback=None):
+    """최근 결과가 있는 쌍은 재사용하고 나머지만 검색해 전체 결과를 만든다
+
+    재사용한 레코드는 save_results 가 기록 DB 에 실행 시각 대신 실제 검색 시각으로 저장한다.
+    """
+    if search_types is None:
+        search_types = SEARCH_TYPES
+    reuse, reused_at = find_reusable(history, clinics, search_types, freshness_hours)
+    return checker.check_clinics_ranks(clinics, search_types, progress_callback, reuse=reuse, reused_at=reused_at,
+                                       journal=journal, result_callback=result_callback)
@@ -0,0 +1,374 @@
+# 웹 앱의 검색을 Streamlit 스크립트 밖에서 실행하는 백그라운드 작업 큐
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import datetime, timedelta
+
+from checker_factory import create_checker
+from incremental import check_clinics_incremental
+from rank_history import RankHistory
+from run_journal import RunJournal
+
+# 작업 상태
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+ACTIVE_STATUSES = (QUEUED, RUNNING)
+
+# 대기열을 읽지 못할 때 다시 시도하기 전 최대 대기 시간 (초)
+MAX_CLAIM_BACKOFF = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    started_at TEXT,
+    finished_at TEXT,
+    params TEXT NOT NULL,
+    done INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 0,
+    message TEXT NOT NULL DEFAULT '',
+    result_path TEXT,
+    results TEXT,
+    error TEXT,
+    owner TEXT,
+    heartbeat_at TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status, created_at);
+CREATE TABLE IF NOT EXISTS job_records (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_job_records_job ON job_records (job_id, id);
+"""
+
+# 이전 버전 DB 에 없을 수 있는 열 (열 이름, 정의)
+ADDED_COLUMNS = (
+    ('owner', 'TEXT'),
+    ('heartbeat_at', 'TEXT'),
+)
+
+
+class JobStore:
+    """검색 작업과 진행 상황을 저장하는 SQLite 테이블
+
+    웹 세션은 작업을 넣고 상태를 읽기만 하고, 진행 상황은 워커 스레드가 기록한다.
+    여러 스레드가 같은 연결을 쓰므로 모든 쿼리를 잠금 안에서 실행한다.
+    """
+
+    def __init__(self, db_path):
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(SCHEMA)
+            existing = {row['name'] for row in self._conn.execute('PRAGMA table_info(jobs)')}
+            for name, definition in ADDED_COLUMNS:
+                if name not in existing:
+                    self._conn.execute(f'ALTER TABLE jobs ADD COLUMN {name} {definition}')
+            self._conn.commit()
+
+    @classmethod
+    def from_config(cls, config_module):
+        """OUTPUT_SETTINGS['jobs_db'] 경로로 열기"""
+        output_settings = config_module.OUTPUT_SETTINGS
+        return cls(output_settings.get('jobs_db', os.path.join(output_settings['output_dir'], 'jobs.sqlite3')))
+
+    def submit(self, params):
+        """작업을 대기열에 넣고 작업 ID 반환"""
+        now = datetime.now()
+        job_id = f"{now.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:4]}"
+        with self._lock, self._conn:
+            self._conn.execute(
+                'INSERT INTO jobs (job_id, status, created_at, params) VALUES (?, ?, ?, ?)',
+                (job_id, QUEUED, now.isoformat(timespec='seconds'), json.dumps(params, ensure_ascii=False))
+            )
+        return job_id
+
+    def claim_next(self, owner=None):
+        """가장 오래된 대기 작업을 owner 의 실행 중 작업으로 바꾸고 반환 (없으면 None)"""
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                'SELECT * FROM jobs WHERE status = ? ORDER BY created_at, rowid LIMIT 1', (QUEUED,)
+            ).fetchone()
+            if row is None:
+                return None
+            now = datetime.now().isoformat(timespec='seconds')
+            self._conn.execute(
+                'UPDATE jobs SET status = ?, started_at = ?, owner = ?, heartbeat_at = ? WHERE job_id = ?',
+                (RUNNING, now, owner, now, row['job_id'])
+            )
+        return self._as_job(row)
+
+    def heartbeat(self, owner):
+        """owner 가 실행 중인 작업의 마지막 생존 시각을 지금으로 갱신"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                'UPDATE jobs SET heartbeat_at = ? WHERE status = ? AND owner = ?',
+                (datetime.now().isoformat(timespec='seconds'), RUNNING, owner)
+            )
+
+    def update_progress(self, job_id, done, total, message=''):
+        """진행 상황 기록"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                'UPDATE jobs SET done = ?, total = ?, message = ? WHERE job_id = ?',
+                (done, total, message, job_id)
+            )
+
+    def append_records(self, job_id, records):
+        """검색이 끝난 레코드를 바로 추가 (화면이 완료 전에도 결과를 보여줄 수 있게)"""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                'INSERT INTO job_records (job_id, record) VALUES (?, ?)',
+                [(job_id, json.dumps(record, ensure_ascii=False)) for record in records]
+            )
+
+    def records_since(self, job_id, after_id=0):
+        """after_id 이후에 추가된 레코드를 (마지막 ID, [레코드]) 로 반환"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT id, record FROM job_records WHERE job_id = ? AND id > ? ORDER BY id', (job_id, after_id)
+            ).fetchall()
+        if not rows:
+            return after_id, []
+        return rows[-1]['id'], [json.loads(row['record']) for row in rows]
+
+    def finish(self, job_id, results, result_path=None):
+        """완료 처리 (재사용한 결과까지 포함한 전체 레코드를 저장)"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                'UPDATE jobs SET status = ?, finished_at = ?, result_path = ?, results = ? WHERE job_id = ?',
+                (DONE, datetime.now().isoformat(timespec='seconds'), result_path,
+                 json.dumps(results, ensure_ascii=False), job_id)
+            )
+            # 완료된 작업은 results 에 전체 결과가 있으므로 중간 레코드는 지운다
+            self._conn.execute('DELETE FROM job_records WHERE job_id = ?', (job_id,))
+
+    def fail(self, job_id, error):
+        """실패 처리"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                'UPDATE jobs SET status = ?, finished_at = ?, error = ? WHERE job_id = ?',
+                (FAILED, datetime.now().isoformat(timespec='seconds'), str(error), job_id)
+            )
+
+    def requeue_interrupted(self, stale_seconds):
+        """stale_seconds 넘게 생존 신호가 없는 실행 중 작업을 다시 대기열로 (체크포인트에서 이어서 실행됨)
+
+        다른 러너(캐시를 비우기 전의 러너나 다른 프로세스)가 아직 실행 중인 작업은
+        생존 시각이 계속 갱신되므로 건드리지 않는다.
+        """
+        cutoff = (datetime.now() - timedelta(seconds=stale_seconds)).isoformat(timespec='seconds')
+        with self._lock, self._conn:
+            return self._conn.execute(
+                'UPDATE jobs SET status = ?, owner = NULL WHERE status = ? '
+                'AND (heartbeat_at IS NULL OR heartbeat_at < ?)',
+                (QUEUED, RUNNING, cutoff)
+            ).rowcount
+
+    def get(self, job_id):
+        """작업 하나 조회 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute('SELECT * FROM jobs WHERE job_id = ?', (job_id,)).fetchone()
+        return self._as_job(row) if row is not None else None
+
+    def queue_position(self, job_id):
+        """대기 중인 작업 앞에 있는 작업 수 (실행 중 포함)"""
+        with self._lock:
+            return self._conn.execute(
+                'SELECT COUNT(*) FROM jobs WHERE status IN (?, ?) AND created_at <= '
+                '(SELECT created_at FROM jobs WHERE job_id = ?) AND job_id != ?',
+                (QUEUED, RUNNING, job_id, job_id)
+            ).fetchone()[0]
+
+    def list_jobs(self, limit=20):
+        """최근 작업 목록 (결과 레코드 제외)"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT job_id, status, created_at, started_at, finished_at, done, total, message, error '
+                'FROM jobs ORDER BY created_at DESC LIMIT ?', (limit,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    @staticmethod
+    def _as_job(row):
+        """sqlite Row 를 dict 로 (params/results 는 JSON 해석)"""
+        job = dict(row)
+        job['params'] = json.loads(job['params'])
+        job['results'] = json.loads(job['results']) if job.get('results') else None
+        return job
+
+    def close(self):
+        """연결 닫기"""
+        with self._lock:
+            self._conn.close()
+
+
+class JobRunner:
+    """JobStore 의 대기 작업을 워커 스레드에서 하나씩 실행
+
+    Streamlit 프로세스마다 하나만 만들어(st.cache_resource) 모든 세션이 공유하므로,
+    사용자가 여러 명이거나 검색을 여러 번 눌러도 동시에 도는 검색은 workers 개로 제한된다.
+    작업 ID 를 체크포인트 저널의 실행 ID 로 쓰기 때문에 프로세스가 재시작되면
+    멈췄던 작업이 완료된 검색을 건너뛰고 이어서 실행된다.
+
+    러너마다 owner ID 를 두고 heartbeat_interval 초마다 자기 작업의 생존 시각을 갱신한다.
+    생존 신호가 heartbeat_interval 의 3배 넘게 끊긴 작업만 멈춘 것으로 보고 다시 대기열에 넣는다.
+    """
+
+    def __init__(self, config_module, store=None, workers=1, poll_interval=1.0, heartbeat_interval=30):
+        self.config = config_module
+        self.store = store or JobStore.from_config(config_module)
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.owner = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._threads = []
+        self._stop = threading.Event()
+
+    @classmethod
+    def from_config(cls, config_module):
+        """SEARCH_SETTINGS['job_workers'] 개의 워커로 생성"""
+        search_settings = config_module.SEARCH_SETTINGS
+        return cls(config_module, workers=search_settings.get('job_workers', 1),
+                   heartbeat_interval=search_settings.get('job_heartbeat_seconds', 30))
+
+    @property
+    def stale_seconds(self):
+        """이 시간 넘게 생존 신호가 없는 실행 중 작업은 멈춘 것으로 본다"""
+        return self.heartbeat_interval * 3
+
+    def start(self):
+        """멈췄던 작업을 다시 대기열에 넣고 워커와 생존 신호 스레드 시작"""
+        self.requeue_stale()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"search-job-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        thread = threading.Thread(target=self._beat, name="search-job-heartbeat", daemon=True)
+        thread.start()
+        self._threads.append(thread)
+        return self
+
+    def requeue_stale(self):
+        """생존 신호가 끊긴 실행 중 작업을 다시 대기열에 넣고 건수 반환"""
+        requeued = self.store.requeue_interrupted(self.stale_seconds)
+        if requeued:
+            print(f"중단된 작업 {requeued}건을 다시 대기열에 넣었습니다.")
+        return requeued
+
+    def submit(self, clinics, search_types, delay=None, incremental=False, resume_run_id=None):
+        """검색 작업 제출 후 작업 ID 반환"""
+        return self.store.submit({
+            'clinics': clinics,
+            'search_types': search_types,
+            'delay': delay,
+            'incremental': incremental,
+            'resume_run_id': resume_run_id,
+        })
+
+    def stop(self):
+        """워커 종료 (실행 중인 작업이 끝날 때까지 대기)"""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+
+    def _beat(self):
+        """실행 중인 작업의 생존 시각을 주기적으로 갱신하고, 다른 러너가 멈춘 작업을 이어받는다"""
+        while not self._stop.wait(self.heartbeat_interval):
+            try:
+                self.store.heartbeat(self.owner)
+                self.requeue_stale()
+            except Exception as e:
+                print(f"작업 생존 신호 기록 실패: {e}")
+
+    def _work(self):
+        """대기 작업을 꺼내 실행하는 워커 루프
+
+        DB 가 잠겨 있는 등 대기열을 읽지 못하면 기록하고 점점 길게 기다렸다 다시 시도한다
+        (예외로 워커 스레드가 조용히 끝나면 대기 작업이 영영 실행되지 않는다).
+        """
+        failures = 0
+        while not self._stop.is_set():
+            try:
+                job = self.store.claim_next(self.owner)
+            except sqlite3.Error as e:
+                failures += 1
+                backoff = min(self.poll_interval * (2 ** failures), MAX_CLAIM_BACKOFF)
+                print(f"작업 대기열을 읽지 못했습니다: {e} ({backoff:.0f}초 후 다시 시도)")
+                self._stop.wait(backoff)
+                continue
+            failures = 0
+            if job is None:
+                self._stop.wait(self.poll_interval)
+                continue
+            try:
+                self.run_job(job)
+            except Exception as e:
+                print(f"작업 {job['job_id']} 실패: {e}")
+                try:
+                    self.store.fail(job['job_id'], e)
+                except sqlite3.Error as error:
+                    print(f"작업 {job['job_id']} 실패 기록 실패: {error}")
+
+    def run_job(self, job):
+        """작업 하나 실행: 검색 → 결과 저장 → 작업 완료 기록"""
+        job_id = job['job_id']
+        params = job['params']
+        clinics = params['clinics']
+        search_types = params['search_types']
+
+        checker = create_checker(self.config)
+        if params.get('delay') is not None:
+            checker.set_delay(params['delay'])
+        run_id = params.get('resume_run_id') or job_id
+        journal = RunJournal.resume(self.config, run_id) or RunJournal.from_config(self.config, run_id)
+
+        progress = [0, 0]
+
+        def on_progress(done, total, keyword, search_type):
+            progress[:] = [done, total]
+            self.store.update_progress(job_id, done, total, f"{search_type} '{keyword}' 검색 완료")
+
+        def on_results(clinic_name, keyword, search_type, results):
+            self.store.append_records(job_id, results)
+
+        try:
+            self.store.update_progress(job_id, 0, 0, "검색 시작")
+            history = RankHistory.from_config(self.config) if params.get('incremental') else None
+            if history is not None:
+                # 증분 실행: 최근 결과가 있는 검색은 기록 DB 에서 가져온다
+                try:
+                    results = check_clinics_incremental(
+                        checker, history, clinics, search_types,
+                        self.config.SEARCH_SETTINGS.get('freshness_hours', 24),
+                        progress_callback=on_progress, journal=journal, result_callback=on_results
+                    )
+                finally:
+                    history.close()
+            else:
+                results = checker.check_clinics_ranks(clinics, search_types, progress_callback=on_progress,
+                                                      journal=journal, result_callback=on_results)
+
+            result_path = None
+            if results:
+                self.store.update_progress(job_id, *progress, "결과 저장 중")
+                result_path = checker.save_results(results, clinics, run_id=run_id)
+                journal.finish()
+                checker.save_metrics(run_id)
+            self.store.finish(job_id, results, result_path)
+        finally:
+            journal.close()
+            checker.close()
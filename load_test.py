@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# 로컬 모의 네이버 서버로 대량 검색을 돌려 처리량과 응답 시간을 재는 부하 시험
+#
+#   python load_test.py --clinics 100 --keywords-per-clinic 34 --engine thread --workers 8
+#   python load_test.py --server http://127.0.0.1:8800/search.naver   # 따로 띄운 mock_naver.py 사용
+#
+# 합성 치과 목록(픽스처의 치과 이름 + 결과에 없는 치과)으로 check_clinics_ranks 를 실행하고
+# 요청/초, 응답 시간 p50/p99, 전체 소요 시간을 보고한다. 캐시는 끄고 실행한다.
+import argparse
+import contextlib
+import io
+import json
+import math
+import random
+import sys
+import threading
+import time
+from collections import Counter
+
+from batch_cli import batch_config, parse_types
+from checker_factory import create_checker
+from fetch_guard import CircuitOpenError
+from mock_naver import MockNaverServer, add_server_arguments, server_options
+from rank_record import RankStatus
+from search_rank_checker import SEARCH_TYPES
+from serp_fixtures import FixtureCorpus
+
+# 합성 키워드 재료
+REGIONS = ['강남', '역삼', '신논현', '홍대', '합정', '잠실', '송파', '목동', '노원', '분당', '판교', '일산', '수원', '인천',
+           '부천', '대전', '대구', '부산', '광주', '울산']
+TOPICS = ['치과', '임플란트', '치아교정', '스케일링', '사랑니 발치', '라미네이트', '치아미백', '신경치료', '충치치료',
+          '소아치과', '야간진료 치과', '주말 치과', '틀니', '잇몸치료', '치과 추천']
+
+
+def parse_args(argv=None):
+    """명령행 옵션 파싱"""
+    parser = argparse.ArgumentParser(description="모의 네이버 서버 부하 시험")
+    parser.add_argument('--server', help="이미 실행 중인 모의 서버 검색 주소 (없으면 이 프로세스 안에서 띄움)")
+    add_server_arguments(parser)
+    parser.add_argument('--clinics', type=int, default=100, help="합성 치과 수 (기본: 100)")
+    parser.add_argument('--keywords-per-clinic', type=int, default=34, help="치과마다 키워드 수 (기본: 34)")
+    parser.add_argument('--keyword-pool', type=int, default=500, help="치과들이 나눠 쓰는 고유 키워드 수 (기본: 500)")
+    parser.add_argument('--types', default=','.join(SEARCH_TYPES), help="검색 유형 (쉼표로 구분, 기본: 전체)")
+    parser.add_argument('--engine', choices=['sync', 'thread', 'async'], default='thread', help="검색 엔진")
+    parser.add_argument('--workers', type=int, default=8, help="동시 요청 수 (기본: 8)")
+    parser.add_argument('--http-client', choices=['requests', 'httpx'], help="HTTP 클라이언트 (기본: config)")
+    parser.add_argument('--rps', type=float, default=200.0, help="호스트별 초당 요청 수 (토큰 버킷, 기본: 200)")
+    parser.add_argument('--max-pages', type=int, help="검색할 최대 페이지 수 (기본: config)")
+    parser.add_argument('--backoff-base', type=float, default=0.05, help="재시도 대기 기본값 (초, 기본: 0.05)")
+    parser.add_argument('--breaker-cooldown', type=float, default=2.0, help="서킷 브레이커 대기 시간 (초, 기본: 2)")
+    parser.add_argument('--json', help="결과를 JSON 으로 저장할 경로")
+    parser.add_argument('--verbose', action='store_true', help="검색 진행 로그를 stderr 로 출력")
+    return parser.parse_args(argv)
+
+
+def synthetic_roster(corpus, clinics, keywords_per_clinic, keyword_pool, seed=None):
+    """치과마다 공유 키워드 풀에서 키워드를 뽑은 합성 치과 목록
+
+    픽스처에 나오는 치과 이름을 먼저 쓰고, 모자라면 결과에 없는 치과(끝 페이지까지 훑게 됨)를 만든다.
+    """
+    rng = random.Random(seed)
+    pool = [f"{region} {topic}" for region in REGIONS for topic in TOPICS]
+    pool += [f"{keyword} {n}" for n in range(2, keyword_pool // len(pool) + 2) for keyword in pool]
+    pool = pool[:max(1, keyword_pool)]
+    names = corpus.clinics + [f"부하시험치과{n}" for n in range(1, clinics + 1)]
+    per_clinic = min(keywords_per_clinic, len(pool))
+    return [{'name': names[i], 'keywords': rng.sample(pool, per_clinic)} for i in range(clinics)]
+
+
+def load_config(args, search_url):
+    """부하 시험 설정 (config 를 복사해 모의 서버 주소, 엔진, 속도 제한만 바꾸고 캐시는 끈다)"""
+    cfg = batch_config(args.engine, args.workers)
+    cfg.SEARCH_SETTINGS.update({
+        'requests_per_second': args.rps,
+        'burst': max(1, args.workers),
+        'delay_between_requests': 1 / args.rps,
+    })
+    if args.http_client:
+        cfg.SEARCH_SETTINGS['http_client'] = args.http_client
+    if args.max_pages:
+        cfg.SEARCH_SETTINGS['max_pages'] = args.max_pages
+    cfg.FETCH_SETTINGS = dict(getattr(cfg, 'FETCH_SETTINGS', {}),
+                              backoff_base=args.backoff_base, breaker_cooldown=args.breaker_cooldown)
+    cfg.NAVER_SETTINGS = {key: search_url for key in ('blog_search_url', 'web_search_url', 'place_search_url')}
+    cfg.CACHE_SETTINGS = {'enabled': False}
+    return cfg
+
+
+def percentile(sorted_values, q):
+    """정렬된 값의 q 분위수 (nearest-rank)"""
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, math.ceil(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def run_load(checker, roster, search_types, verbose=False):
+    """검색을 실행하고 측정값 반환"""
+    latencies = []
+    statuses = Counter()
+    lock = threading.Lock()
+
+    def on_request(seconds, status):
+        with lock:
+            latencies.append(seconds)
+            statuses[status] += 1
+
+    checker.on_request = on_request
+    aborted = None
+    results = []
+    log = sys.stderr if verbose else io.StringIO()
+    started = time.perf_counter()
+    try:
+        with contextlib.redirect_stdout(log):
+            results = checker.check_clinics_ranks(roster, search_types)
+    except CircuitOpenError as e:
+        aborted = str(e)
+    wall = time.perf_counter() - started
+
+    latencies.sort()
+    ranks = Counter(
+        RankStatus.ERROR.value if r['rank'] == RankStatus.ERROR.value
+        else RankStatus.NOT_FOUND.value if r['rank'] == RankStatus.NOT_FOUND.value
+        else RankStatus.FOUND.value
+        for r in results
+    )
+    checks = len({(r['clinic_name'], r['keyword'], r['search_type']) for r in results})
+    return {
+        'wall_s': wall,
+        'checks': checks,
+        'checks_per_sec': checks / wall if wall else 0.0,
+        'requests': len(latencies),
+        'requests_per_sec': len(latencies) / wall if wall else 0.0,
+        'latency_p50_ms': (percentile(latencies, 0.5) or 0) * 1000,
+        'latency_p99_ms': (percentile(latencies, 0.99) or 0) * 1000,
+        'latency_max_ms': (latencies[-1] if latencies else 0) * 1000,
+        'status_counts': {str(status): count for status, count in sorted(statuses.items())},
+        'record_counts': dict(ranks),
+        'slowdown': checker.guard.slowdown,
+        'aborted': aborted,
+    }
+
+
+def print_report(report):
+    """부하 시험 결과 출력"""
+    print(f"전체 소요 시간: {report['wall_s']:.1f}초")
+    print(f"치과/키워드/검색 유형 검색: {report['checks']:,}건 ({report['checks_per_sec']:.1f}건/초)")
+    print(f"HTTP 요청: {report['requests']:,}건 ({report['requests_per_sec']:.1f}요청/초)")
+    print(f"응답 시간: p50 {report['latency_p50_ms']:.0f}ms, p99 {report['latency_p99_ms']:.0f}ms, "
+          f"최대 {report['latency_max_ms']:.0f}ms")
+    print(f"응답 상태: {report['status_counts']}")
+    print(f"결과 레코드: {report['record_counts']}")
+    if 'server_status_counts' in report:
+        print(f"모의 서버 응답: {report['server_status_counts']}")
+    if report['aborted']:
+        print(f"⛔ 검색 중단: {report['aborted']}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    try:
+        search_types = parse_types(args.types)
+        corpus = FixtureCorpus(args.fixtures)
+        server = None
+        if args.server:
+            search_url = args.server
+        else:
+            server = MockNaverServer.from_fixtures(args.fixtures, **server_options(args)).start()
+            search_url = server.search_url
+        checker = create_checker(load_config(args, search_url))
+    except Exception as e:
+        print(f"설정 오류: {e}", file=sys.stderr)
+        return 1
+
+    roster = synthetic_roster(corpus, args.clinics, args.keywords_per_clinic, args.keyword_pool, args.seed)
+    planned = len({(kw, t) for clinic in roster for kw in clinic['keywords'] for t in search_types})
+    print(f"🧪 {search_url} | 엔진 {args.engine} × {args.workers} | 치과 {len(roster)}곳, "
+          f"검색 {sum(len(c['keywords']) for c in roster) * len(search_types):,}건 (고유 검색어/유형 {planned:,}쌍)")
+    try:
+        report = run_load(checker, roster, search_types, args.verbose)
+    finally:
+        checker.close()
+        if server is not None:
+            server.stop()
+    if server is not None:
+        report['server_status_counts'] = {str(status): count for status, count in sorted(server.stats.items())}
+    print_report(report)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=1)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
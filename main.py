@@ -3,8 +3,14 @@
 
 import sys
 import os
+import argparse
 from datetime import datetime
-from search_rank_checker import SearchRankChecker
+from search_rank_checker import SEARCH_TYPES
+from checker_factory import create_checker
+from search_planner import build_search_plan
+from rank_history import RankHistory
+from incremental import check_clinics_incremental
+from run_journal import RunJournal
 import config
 
 def print_banner():
@@ -28,8 +34,22 @@ def check_config():
     print()
     return True
 
-def main():
+def parse_args(argv=None):
+    """명령행 옵션 파싱"""
+    parser = argparse.ArgumentParser(description="치과 거래처 검색노출 순위 체크 프로그램")
+    parser.add_argument(
+        '--incremental', action='store_true',
+        help="최근(freshness_hours 이내) 결과가 있는 검색은 재사용하고 새로 추가/변경된 부분만 검색"
+    )
+    parser.add_argument(
+        '--resume', metavar='RUN_ID',
+        help="중단된 실행을 체크포인트에서 이어서 실행 (완료된 검색은 건너뜀)"
+    )
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """메인 실행 함수"""
+    args = parse_args(argv)
     print_banner()
     
     # 설정 파일 검증
@@ -38,31 +58,55 @@ def main():
     
     # 검색 순위 체커 초기화
     try:
-        checker = SearchRankChecker(config)
+        checker = create_checker(config)
         print("✅ 검색 순위 체커가 초기화되었습니다.")
     except Exception as e:
         print(f"❌ 검색 순위 체커 초기화 실패: {e}")
         return
     
+    # 완료된 검색을 바로 기록하는 체크포인트 저널
+    if args.resume:
+        journal = RunJournal.resume(config, args.resume)
+        if journal is None:
+            print(f"❌ 이어할 실행을 찾을 수 없습니다: {args.resume}")
+            unfinished = RunJournal.list_unfinished(config)
+            if unfinished:
+                print(f"중단된 실행: {', '.join(unfinished)}")
+            checker.close()
+            return
+    else:
+        journal = RunJournal.from_config(config)
+    
     all_results = []
     
     try:
-        # 각 치과에 대해 검색 순위 체크
-        for i, clinic in enumerate(config.DENTAL_CLINICS, 1):
-            print(f"\n🔍 [{i}/{len(config.DENTAL_CLINICS)}] {clinic['name']} 검색 중...")
-            print("-" * 40)
-            
-            # 모든 검색 유형에 대한 순위 체크 (블로그, 웹, 플레이스)
-            print("📝 모든 검색 유형 순위 체크 중...")
-            search_results = checker.check_all_ranks(clinic['name'], clinic['keywords'])
-            all_results.extend(search_results)
-            
-            print(f"✅ {clinic['name']} 검색 완료")
+        # 치과들이 공유하는 키워드는 한 번만 검색
+        plan = build_search_plan(config.DENTAL_CLINICS, SEARCH_TYPES)
+        total_requests = sum(len(clinic['keywords']) for clinic in config.DENTAL_CLINICS) * len(SEARCH_TYPES)
+        print(f"🔍 고유 검색 {len(plan)}건 (치과별 검색 시 {total_requests}건)")
+        print("-" * 40)
+        
+        # 모든 검색 유형에 대한 순위 체크 (블로그, 웹, 플레이스)
+        print("📝 모든 검색 유형 순위 체크 중...")
+        history = RankHistory.from_config(config) if args.incremental else None
+        if history is not None:
+            # 증분 실행: 최근 결과가 있는 검색은 기록 DB 에서 가져온다
+            print("♻️ 증분 실행: 바뀐 부분만 검색합니다.")
+            all_results = check_clinics_incremental(
+                checker, history, config.DENTAL_CLINICS, SEARCH_TYPES,
+                config.SEARCH_SETTINGS.get('freshness_hours', 24), journal=journal
+            )
+            history.close()
+        else:
+            all_results = checker.check_clinics_ranks(config.DENTAL_CLINICS, SEARCH_TYPES, journal=journal)
+        print("✅ 모든 치과 검색 완료")
         
         # 결과 저장
         if all_results:
             print(f"\n💾 검색 결과 저장 중...")
-            filepath = checker.save_results(all_results)
+            filepath = checker.save_results(all_results, config.DENTAL_CLINICS, run_id=journal.run_id)
+            journal.finish()
+            checker.save_metrics(journal.run_id)
             
             # 결과 요약 출력
             print("\n📊 검색 결과 요약:")
@@ -96,10 +140,13 @@ def main():
     
     except KeyboardInterrupt:
         print("\n⚠️ 사용자에 의해 중단되었습니다.")
+        print(f"이어서 실행하려면: python main.py --resume {journal.run_id}")
     except Exception as e:
         print(f"\n❌ 검색 중 오류가 발생했습니다: {e}")
+        print(f"이어서 실행하려면: python main.py --resume {journal.run_id}")
     finally:
         # 리소스 정리
+        journal.close()
         checker.close()
         print("\n👋 프로그램을 종료합니다.")
 
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# 부하 시험용 로컬 네이버 검색 모의 서버
+#
+#   python mock_naver.py --port 8800 --latency-ms 150 --error-rate 0.01 --burst-every 60 --burst-length 5
+#
+# /search.naver 요청에 where(blog, 없음=웹, place)와 start 파라미터에 맞는 픽스처 페이지
+# (fixtures/serp) 를 돌려준다. config.NAVER_SETTINGS 의 검색 주소를
+# http://127.0.0.1:8800/search.naver 로 바꾸면 체커가 이 서버로 요청한다.
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+import zlib
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from serp_fixtures import EMPTY_PAGE, FIXTURE_DIR, FixtureCorpus
+from serp_specs import SERP_PAGING
+
+# where 파라미터별 검색 유형
+WHERE_TYPES = {'blog': '블로그', '': '웹', 'place': '플레이스'}
+
+
+class QuietHTTPServer(ThreadingHTTPServer):
+    """클라이언트가 먼저 연결을 끊은 경우(BrokenPipe/ConnectionReset 등)는 트레이스백을 찍지 않는 서버
+
+    부하 시험에서는 시간 초과나 중단으로 클라이언트가 응답 도중 연결을 닫는 일이 흔하다.
+    """
+
+    def handle_error(self, request, client_address):
+        if isinstance(sys.exc_info()[1], ConnectionError):
+            return
+        super().handle_error(request, client_address)
+
+
+class MockNaverServer:
+    """픽스처 페이지를 템플릿으로 검색 결과를 돌려주는 모의 서버
+
+    - latency_ms ± jitter_ms 만큼 늦게 응답한다.
+    - error_rate 비율의 요청에 503 을 돌려준다.
+    - burst_every 초마다 burst_length 초 동안 모든 요청에 429 를 돌려준다 (요청 제한 구간).
+    같은 검색 유형/페이지의 템플릿이 여러 개면 검색어마다 하나를 골라 늘 같은 페이지를 준다.
+    """
+
+    def __init__(self, corpus, host='127.0.0.1', port=0, latency_ms=0.0, jitter_ms=0.0, error_rate=0.0,
+                 burst_every=0.0, burst_length=0.0, seed=None):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.burst_every = burst_every
+        self.burst_length = burst_length
+        self.stats = Counter()
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._started = time.monotonic()
+        self._thread = None
+        self.templates = {}
+        for entry in corpus.entries:
+            key = (entry['search_type'], entry['page'])
+            self.templates.setdefault(key, []).append(corpus.read(entry).encode('utf-8'))
+        self.httpd = QuietHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+
+    @classmethod
+    def from_fixtures(cls, directory=FIXTURE_DIR, **options):
+        """픽스처 폴더로 서버 생성"""
+        corpus = FixtureCorpus(directory)
+        if not corpus.entries:
+            raise FileNotFoundError(f"픽스처가 없습니다: {directory} (python serp_fixtures.py synth 로 만드세요)")
+        return cls(corpus, **options)
+
+    @property
+    def search_url(self):
+        """NAVER_SETTINGS 에 넣을 검색 주소"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/search.naver"
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작"""
+        self._started = time.monotonic()
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='mock-naver', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """서버 종료"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def in_burst(self):
+        """지금이 429 요청 제한 구간인지"""
+        if not self.burst_every or not self.burst_length:
+            return False
+        return (time.monotonic() - self._started) % self.burst_every < self.burst_length
+
+    def respond(self, path, query):
+        """(상태 코드, 본문, 지연 시간(초))"""
+        with self._lock:
+            delay = max(0.0, self.latency_ms + self._random.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+            failed = self._random.random() < self.error_rate
+        if path != '/search.naver':
+            return 404, b'not found', 0.0
+        if self.in_burst():
+            return 429, b'too many requests', delay
+        if failed:
+            return 503, b'service unavailable', delay
+
+        params = parse_qs(query)
+        search_type = WHERE_TYPES.get(params.get('where', [''])[0])
+        keyword = params.get('query', [''])[0]
+        if search_type is None or not keyword:
+            return 400, b'bad request', delay
+        start = int(params.get('start', ['1'])[0])
+        page = (start - 1) // SERP_PAGING[search_type]['page_size'] + 1
+        templates = self.templates.get((search_type, page))
+        if not templates:
+            return 200, EMPTY_PAGE.encode('utf-8'), delay
+        return 200, templates[zlib.crc32(keyword.encode('utf-8')) % len(templates)], delay
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # 연결을 유지해 클라이언트의 연결 풀이 재사용할 수 있게 한다
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                if parts.path == '/__stats':
+                    status, body, delay = 200, json.dumps(dict(server.stats)).encode('utf-8'), 0.0
+                else:
+                    status, body, delay = server.respond(parts.path, parts.query)
+                    with server._lock:
+                        server.stats[status] += 1
+                if delay:
+                    time.sleep(delay)
+                self.send_response(status)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def add_server_arguments(parser):
+    """모의 서버 동작 옵션 (load_test.py 와 같이 쓴다)"""
+    parser.add_argument('--fixtures', default=FIXTURE_DIR, help=f"템플릿 픽스처 폴더 (기본: {FIXTURE_DIR})")
+    parser.add_argument('--latency-ms', type=float, default=100.0, help="응답 지연 (ms, 기본: 100)")
+    parser.add_argument('--jitter-ms', type=float, default=50.0, help="응답 지연 편차 (ms, 기본: 50)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="503 오류 비율 (기본: 0)")
+    parser.add_argument('--burst-every', type=float, default=0.0, help="429 요청 제한 구간 간격 (초, 0 이면 없음)")
+    parser.add_argument('--burst-length', type=float, default=0.0, help="429 요청 제한 구간 길이 (초)")
+    parser.add_argument('--seed', type=int, help="난수 시드")
+
+
+def parse_args(argv=None):
+    """명령행 옵션 파싱"""
+    parser = argparse.ArgumentParser(description="부하 시험용 네이버 검색 모의 서버")
+    add_server_arguments(parser)
+    parser.add_argument('--host', default='127.0.0.1', help="주소 (기본: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8800, help="포트 (기본: 8800)")
+    return parser.parse_args(argv)
+
+
+def server_options(args):
+    """add_server_arguments 옵션을 MockNaverServer 인자로 변환"""
+    return {
+        'latency_ms': args.latency_ms,
+        'jitter_ms': args.jitter_ms,
+        'error_rate': args.error_rate,
+        'burst_every': args.burst_every,
+        'burst_length': args.burst_length,
+        'seed': args.seed,
+    }
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    server = MockNaverServer.from_fixtures(args.fixtures, host=args.host, port=args.port, **server_options(args))
+    print(f"🧪 모의 네이버 검색 서버: {server.search_url} (Ctrl+C 로 종료)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"요청 수: {dict(server.stats)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# 여러 페이지에 걸친 검색 결과 매칭을 합치는 페이지 스캔 상태
+
+
+class PageScan:
+    """(키워드, 검색 유형) 하나를 1페이지부터 max_pages 까지 훑는 동안의 매칭 상태
+
+    paged_areas 에 속한 영역만 다음 페이지에서 이어지며, 다음 페이지 항목의 순위는
+    이전 페이지들에서 순위를 매긴 항목 수만큼 밀린다 (필수 필드가 없어 목록에서 빠진
+    항목도 센다). 관심 치과를 모두 찾았거나 결과가 끝나면 더 이상 페이지를 요청하지 않는다.
+    """
+
+    def __init__(self, paged_areas, interested, max_pages):
+        self.paged_areas = set(paged_areas)
+        self.interested = set(interested)
+        self.max_pages = max(1, max_pages)
+        self.page = 0
+        self.matched = []
+        self._offsets = {}
+        self._exhausted = set()
+
+    def add_page(self, matched_sections, ranked):
+        """page+1 번째 페이지의 항목과 매칭 결과를 합친다
+
+        ranked 는 추출 엔진이 돌려준 {검색 영역: 순위를 매긴 항목 수} 이다.
+        """
+        self.page += 1
+        if self.page == 1:
+            self.matched = [(area, dict(matches)) for area, matches in matched_sections]
+        else:
+            merged = dict(self.matched)
+            for area, matches in matched_sections:
+                if area not in merged or area not in self._offsets:
+                    continue
+                offset = self._offsets[area]
+                for clinic_name, item in matches.items():
+                    if clinic_name not in merged[area]:
+                        merged[area][clinic_name] = dict(item, rank=item['rank'] + offset)
+
+        for area in self.paged_areas:
+            count = ranked.get(area, 0)
+            if not count:
+                # 영역이 없거나 순위를 매긴 항목이 없으면 더 이어지는 결과가 없다
+                self._exhausted.add(area)
+            else:
+                self._offsets[area] = self._offsets.get(area, 0) + count
+
+    def needs_next_page(self):
+        """다음 페이지를 요청해야 하는지 (아직 못 찾은 관심 치과가 있고 결과가 남은 영역이 있을 때)"""
+        if self.page >= self.max_pages:
+            return False
+        for area, matches in self.matched:
+            if area not in self.paged_areas or area in self._exhausted:
+                continue
+            if not self.interested.issubset(matches):
+                return True
+        return False
@@ -0,0 +1,226 @@
+# 실행마다 순위 결과를 쌓아 두는 순위 기록 DB (SQLite)
+import json
+import os
+import sqlite3
+import threading
+import uuid
+from datetime import datetime
+
+import pandas as pd
+
+from rank_record import CATEGORY_COLUMNS, RankRecord, RankStatus, RESULT_COLUMNS, normalize_frame
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS runs (
+    run_id TEXT PRIMARY KEY,
+    checked_at TEXT NOT NULL,
+    result_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS ranks (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL REFERENCES runs (run_id),
+    checked_at TEXT NOT NULL,
+    clinic_name TEXT NOT NULL,
+    keyword TEXT NOT NULL,
+    search_type TEXT NOT NULL,
+    search_area TEXT NOT NULL,
+    rank INTEGER,
+    status TEXT NOT NULL,
+    title TEXT,
+    url TEXT,
+    content TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_ranks_clinic ON ranks (clinic_name, checked_at);
+CREATE INDEX IF NOT EXISTS idx_ranks_keyword ON ranks (keyword, checked_at);
+CREATE INDEX IF NOT EXISTS idx_ranks_search_type ON ranks (search_type, checked_at);
+CREATE INDEX IF NOT EXISTS idx_ranks_checked_at ON ranks (checked_at);
+CREATE INDEX IF NOT EXISTS idx_ranks_series ON ranks (clinic_name, keyword, search_type, search_area, checked_at);
+CREATE INDEX IF NOT EXISTS idx_ranks_run ON ranks (run_id);
+CREATE TABLE IF NOT EXISTS rosters (
+    run_id TEXT PRIMARY KEY REFERENCES runs (run_id),
+    clinics TEXT NOT NULL
+);
+'''
+
+
+def new_run_id(now=None):
+    """실행 시각 + 짧은 난수로 된 실행 ID (같은 초에 시작한 실행끼리도 겹치지 않게)"""
+    now = now or datetime.now()
+    return f"{now.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:4]}"
+
+
+class RankHistory:
+    """모든 실행의 순위 결과를 추가만 하는 기록 DB
+
+    치과, 키워드, 검색 유형, 시각에 인덱스가 있어 여러 달치 추이도 엑셀 파일을
+    하나씩 열지 않고 바로 조회할 수 있다.
+    """
+
+    def __init__(self, db_path):
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.executescript(SCHEMA)
+        self._conn.commit()
+
+    @classmethod
+    def from_config(cls, config_module):
+        """OUTPUT_SETTINGS['history_db'] 로 기록 DB 열기 (설정이 비어 있으면 None)"""
+        output_settings = config_module.OUTPUT_SETTINGS
+        db_path = output_settings.get(
+            'history_db', os.path.join(output_settings['output_dir'], 'rank_history.sqlite3')
+        )
+        if not db_path:
+            return None
+        return cls(db_path)
+
+    def append_run(self, results, run_id=None, checked_at=None, clinics=None, fetched_at=None):
+        """한 번의 실행 결과를 추가하고 run_id 를 반환
+
+        clinics 를 주면 실행 당시의 치과 목록도 저장한다(증분 실행의 비교 기준).
+        fetched_at 은 {(치과명, 키워드, 검색 유형): 검색 시각} 으로, 이전 결과를 재사용한
+        레코드는 실행 시각 대신 실제로 검색한 시각을 남긴다.
+        이미 있는 run_id 로 다시 저장하면(이어한 실행 재저장 등) 그 실행의 결과를 같은 트랜잭션에서 교체한다.
+        """
+        checked_at = checked_at or datetime.now()
+        run_id = run_id or new_run_id(checked_at)
+        checked_at_text = checked_at.isoformat(timespec='seconds')
+        fetched_at = fetched_at or {}
+        rows = []
+        for result in results:
+            record = result if isinstance(result, RankRecord) else RankRecord.from_dict(result)
+            record_time = fetched_at.get((record.clinic_name, record.keyword, record.search_type))
+            rows.append((
+                run_id, _as_text(record_time) if record_time else checked_at_text,
+                record.clinic_name, record.keyword, record.search_type,
+                record.search_area, record.rank, record.status.value, record.title, record.url, record.content,
+            ))
+        with self._lock, self._conn:
+            self._conn.execute('DELETE FROM ranks WHERE run_id = ?', (run_id,))
+            self._conn.execute(
+                'INSERT OR REPLACE INTO runs VALUES (?, ?, ?)', (run_id, checked_at_text, len(rows))
+            )
+            self._conn.executemany(
+                'INSERT INTO ranks (run_id, checked_at, clinic_name, keyword, search_type, search_area, '
+                'rank, status, title, url, content) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                rows
+            )
+            if clinics is not None:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO rosters VALUES (?, ?)',
+                    (run_id, json.dumps(clinics, ensure_ascii=False))
+                )
+        return run_id
+
+    def last_roster(self):
+        """가장 최근 실행에 저장된 치과 목록 (없으면 빈 목록)"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT clinics FROM rosters JOIN runs USING (run_id) ORDER BY runs.checked_at DESC LIMIT 1'
+            ).fetchone()
+        return json.loads(row[0]) if row else []
+
+    def latest_results(self, since=None):
+        """(치과, 키워드, 검색 유형)별 가장 최근 검색 결과 (since 이후 것만)"""
+        where = 'WHERE checked_at >= ?' if since is not None else ''
+        params = [_as_text(since)] if since is not None else []
+        query = f'''
+            SELECT r.run_id, r.checked_at, {', '.join('r.' + c for c in RESULT_COLUMNS)}, r.status
+            FROM ranks r
+            JOIN (
+                SELECT clinic_name, keyword, search_type, MAX(checked_at) AS latest
+                FROM ranks {where}
+                GROUP BY clinic_name, keyword, search_type
+            ) l
+            ON r.clinic_name = l.clinic_name AND r.keyword = l.keyword
+               AND r.search_type = l.search_type AND r.checked_at = l.latest
+            ORDER BY r.id
+        '''
+        with self._lock:
+            df = pd.read_sql_query(query, self._conn, params=params)
+        return _typed_history(df)
+
+    def list_runs(self):
+        """실행 목록 (최신순)"""
+        with self._lock:
+            return pd.read_sql_query('SELECT * FROM runs ORDER BY checked_at DESC', self._conn)
+
+    def load(self, clinic_name=None, keyword=None, search_type=None, run_id=None, since=None, until=None):
+        """조건에 맞는 순위 기록 조회 (rank 는 Int64, status 는 카테고리)"""
+        conditions = []
+        params = []
+        for column, value in (('clinic_name', clinic_name), ('keyword', keyword),
+                              ('search_type', search_type), ('run_id', run_id)):
+            if value is not None:
+                conditions.append(f'{column} = ?')
+                params.append(value)
+        if since is not None:
+            conditions.append('checked_at >= ?')
+            params.append(_as_text(since))
+        if until is not None:
+            conditions.append('checked_at < ?')
+            params.append(_as_text(until))
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+        query = f"SELECT run_id, checked_at, {', '.join(RESULT_COLUMNS)}, status FROM ranks{where} ORDER BY id"
+        with self._lock:
+            df = pd.read_sql_query(query, self._conn, params=params)
+        return _typed_history(df)
+
+    def load_series(self, since=None, until=None, clinic_names=None, search_type=None):
+        """추이 분석용으로 (치과, 키워드, 검색 유형, 영역, 시각, 순위, 상태) 만 조회
+
+        증분 실행이 재사용한 결과는 원래 검색 시각 그대로 여러 실행에 다시 저장되므로
+        같은 (치과, 키워드, 검색 유형, 영역, 시각) 은 한 건만 남긴다.
+        """
+        conditions = []
+        params = []
+        if since is not None:
+            conditions.append('checked_at >= ?')
+            params.append(_as_text(since))
+        if until is not None:
+            conditions.append('checked_at < ?')
+            params.append(_as_text(until))
+        if clinic_names:
+            conditions.append(f"clinic_name IN ({', '.join('?' * len(clinic_names))})")
+            params.extend(clinic_names)
+        if search_type is not None:
+            conditions.append('search_type = ?')
+            params.append(search_type)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+        query = f"SELECT {', '.join(CATEGORY_COLUMNS)}, checked_at, rank, status FROM ranks{where}"
+        with self._lock:
+            df = pd.read_sql_query(query, self._conn, params=params)
+        # SQL 의 GROUP BY 보다 카테고리 컬럼에서 중복을 지우는 편이 훨씬 빠르다
+        for column in CATEGORY_COLUMNS:
+            df[column] = df[column].astype('category')
+        df = df.drop_duplicates(CATEGORY_COLUMNS + ['checked_at'], ignore_index=True)
+        df['rank'] = df['rank'].astype('Int64')
+        df['status'] = pd.Categorical(df['status'], categories=[s.value for s in RankStatus])
+        df['checked_at'] = pd.to_datetime(df['checked_at'], format='ISO8601')
+        return df
+
+    def export_excel(self, filepath, **filters):
+        """조건에 맞는 기록을 엑셀 파일로 내보내기"""
+        df = self.load(**filters)
+        df.to_excel(filepath, sheet_name='검색순위결과', index=False)
+        return filepath
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
+
+
+def _as_text(value):
+    """datetime 또는 문자열을 checked_at 비교용 ISO 문자열로 변환"""
+    return value.isoformat(timespec='seconds') if isinstance(value, datetime) else str(value)
+
+
+def _typed_history(df):
+    """기록 조회 결과에 rank/status/시각 타입 적용"""
+    df = normalize_frame(df)
+    df['checked_at'] = pd.to_datetime(df['checked_at'])
+    return df
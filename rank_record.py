@@ -0,0 +1,131 @@
+# 검색 순위 결과 레코드와 컬럼형 결과 테이블
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional
+
+import pandas as pd
+
+# 결과 레코드 컬럼 순서 (save_results 와 화면 표시에 쓰는 기존 dict 형태)
+RESULT_COLUMNS = ['clinic_name', 'keyword', 'search_type', 'search_area', 'rank', 'title', 'url', 'content']
+
+# 값 종류가 적어 카테고리로 저장하면 메모리가 크게 줄어드는 컬럼
+CATEGORY_COLUMNS = ['clinic_name', 'keyword', 'search_type', 'search_area']
+
+
+class RankStatus(Enum):
+    """순위 체크 결과 상태"""
+    FOUND = '순위 내'
+    NOT_FOUND = '순위 밖'
+    ERROR = '오류'
+
+
+@dataclass(slots=True)
+class RankRecord:
+    """순위 결과 한 건 (rank 는 순위 내일 때만 정수, 아니면 None)"""
+    clinic_name: str
+    keyword: str
+    search_type: str
+    search_area: str
+    rank: Optional[int]
+    status: RankStatus
+    title: str = ''
+    url: str = ''
+    content: str = ''
+
+    @classmethod
+    def from_dict(cls, result):
+        """기존 dict 결과('rank' 가 정수 또는 '순위 밖'/'오류')에서 레코드 생성"""
+        rank, status = parse_rank(result['rank'])
+        return cls(
+            clinic_name=result['clinic_name'],
+            keyword=result['keyword'],
+            search_type=result['search_type'],
+            search_area=result['search_area'],
+            rank=rank,
+            status=status,
+            title=result.get('title', ''),
+            url=result.get('url', ''),
+            content=result.get('content', ''),
+        )
+
+    def to_dict(self):
+        """기존 dict 결과 형태로 변환"""
+        return {
+            'clinic_name': self.clinic_name,
+            'keyword': self.keyword,
+            'search_type': self.search_type,
+            'search_area': self.search_area,
+            'rank': self.rank if self.status is RankStatus.FOUND else self.status.value,
+            'title': self.title,
+            'url': self.url,
+            'content': self.content,
+        }
+
+
+def parse_rank(value):
+    """기존 rank 값을 (정수 순위 또는 None, 상태) 로 변환"""
+    if isinstance(value, str):
+        if value == RankStatus.ERROR.value:
+            return None, RankStatus.ERROR
+        if value.isdigit():
+            return int(value), RankStatus.FOUND
+        return None, RankStatus.NOT_FOUND
+    if value is None or pd.isna(value):
+        return None, RankStatus.NOT_FOUND
+    return int(value), RankStatus.FOUND
+
+
+def records_to_frame(results):
+    """결과(dict 또는 RankRecord) 목록을 컬럼형 DataFrame 으로 변환
+
+    rank 는 nullable 정수(Int64), status 는 RankStatus 값의 카테고리 컬럼이 된다.
+    """
+    df = pd.DataFrame(
+        [r.to_dict() if isinstance(r, RankRecord) else r for r in results],
+        columns=RESULT_COLUMNS,
+    )
+    return normalize_frame(df)
+
+
+def normalize_frame(df):
+    """기존 형태의 결과 DataFrame(엑셀에서 읽은 것 포함)에 타입을 붙인다
+
+    status 컬럼이 이미 있으면(parquet, 기록 DB) 그 값을 그대로 쓴다. 순위 밖과 오류는 rank 가
+    모두 비어 있어 rank 만으로는 구분할 수 없으므로, 비어 있는 칸만 rank 로 채운다.
+    """
+    df = df.copy()
+    raw_rank = df['rank']
+    numeric_rank = pd.to_numeric(raw_rank, errors='coerce')
+    status = pd.Series(RankStatus.NOT_FOUND.value, index=df.index)
+    status[numeric_rank.notna()] = RankStatus.FOUND.value
+    status[raw_rank.astype(str) == RankStatus.ERROR.value] = RankStatus.ERROR.value
+    if 'status' in df:
+        status = df['status'].astype(object).where(df['status'].notna(), status)
+    df['rank'] = numeric_rank.round().astype('Int64')
+    df['status'] = pd.Categorical(status, categories=[s.value for s in RankStatus])
+    for column in CATEGORY_COLUMNS:
+        if column in df:
+            df[column] = df[column].astype('category')
+    return df
+
+
+def frame_to_dicts(df):
+    """컬럼형 DataFrame 을 기존 dict 결과 목록으로 변환"""
+    legacy = df[RESULT_COLUMNS].astype(object)
+    legacy['rank'] = df['rank'].astype(object).where(
+        df['status'] == RankStatus.FOUND.value, df['status'].astype(str)
+    )
+    legacy = legacy.where(legacy.notna(), '')
+    return legacy.to_dict('records')
+
+
+def rank_summary(df):
+    """결과 요약 통계 (전체 수, 순위 내 수, 순위 밖 수, 오류 수, 평균 순위)"""
+    status_counts = df['status'].value_counts()
+    return {
+        'total': len(df),
+        'found': int(status_counts.get(RankStatus.FOUND.value, 0)),
+        'not_found': int(status_counts.get(RankStatus.NOT_FOUND.value, 0)),
+        'error': int(status_counts.get(RankStatus.ERROR.value, 0)),
+        'avg_rank': df['rank'].mean() if len(df) else None,
+    }
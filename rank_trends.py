@@ -0,0 +1,85 @@
+# 여러 실행에 걸친 순위 추이 분석 (groupby / rolling 벡터 연산)
+from rank_record import RankStatus
+
+# 하나의 순위 시계열을 구분하는 컬럼
+SERIES_KEYS = ['clinic_name', 'keyword', 'search_type', 'search_area']
+
+# 이벤트 이름
+ENTERED = '진입'
+DROPPED = '이탈'
+
+
+def prepare_series(df):
+    """RankHistory.load_series 결과에서 오류를 빼고 시계열 순서로 정렬
+
+    오류는 순위를 알 수 없으므로 추이 계산에서 제외하고, 순위 밖은 rank 가 비어 있는 점으로 남긴다.
+    """
+    df = df[df['status'] != RankStatus.ERROR.value]
+    return df.sort_values(SERIES_KEYS + ['checked_at'], kind='stable').reset_index(drop=True)
+
+
+def series_stats(df):
+    """시계열별 요약: 검색 횟수, 노출 비율, 최고/최저/중앙 순위, 변동성, 최근 순위와 직전 대비 변화
+
+    변동성은 연속된 두 검색 사이 순위 변화량의 표준편차다 (둘 다 순위 안일 때만).
+    df 는 prepare_series 로 정렬된 상태여야 한다.
+    """
+    rank = df['rank'].astype('float64')
+    change = rank - rank.groupby([df[key] for key in SERIES_KEYS], observed=True, sort=False).shift()
+    df = df.assign(rank_float=rank, change=change, found=rank.notna())
+    groups = df.groupby(SERIES_KEYS, observed=True, sort=False)
+
+    stats = groups.agg(
+        checks=('checked_at', 'size'),
+        found_ratio=('found', 'mean'),
+        best_rank=('rank_float', 'min'),
+        worst_rank=('rank_float', 'max'),
+        median_rank=('rank_float', 'median'),
+        volatility=('change', 'std'),
+        first_checked=('checked_at', 'min'),
+        last_checked=('checked_at', 'max'),
+    )
+    # 마지막 검색의 순위 (agg 의 last 는 빈 값을 건너뛰므로 tail 로 가져온다)
+    last_rows = groups.tail(1).set_index(SERIES_KEYS)
+    stats['latest_rank'] = last_rows['rank_float'].reindex(stats.index)
+    stats['latest_change'] = last_rows['change'].reindex(stats.index)
+    return stats.reset_index()
+
+
+def rolling_rank(df, window=7):
+    """시계열별 최근 window 번 검색의 순위 중앙값 (순위 밖은 건너뜀)"""
+    rolled = (
+        df.assign(rank_float=df['rank'].astype('float64'))
+        .groupby(SERIES_KEYS, observed=True, sort=False)['rank_float']
+        .rolling(window, min_periods=1)
+        .median()
+    )
+    return df.assign(rolling_rank=rolled.reset_index(level=list(range(len(SERIES_KEYS))), drop=True))
+
+
+def top_n_events(df, top_n=10):
+    """직전 검색 대비 상위 top_n 안으로 들어오거나(진입) 밖으로 밀려난(이탈) 시점
+
+    각 시계열의 첫 검색은 비교 대상이 없으므로 이벤트가 아니다.
+    """
+    in_top = df['rank'].le(top_n).fillna(False).astype(bool)
+    previous = in_top.groupby([df[key] for key in SERIES_KEYS], observed=True, sort=False).shift()
+    has_previous = previous.notna()
+    previous = previous.astype('boolean').fillna(False).astype(bool)
+    entered = has_previous & in_top & ~previous
+    dropped = has_previous & ~in_top & previous
+    events = df.loc[entered | dropped, SERIES_KEYS + ['checked_at', 'rank']].copy()
+    events['event'] = entered[entered | dropped].map({True: ENTERED, False: DROPPED})
+    return events.sort_values('checked_at', ascending=False, kind='stable').reset_index(drop=True)
+
+
+def rank_pivot(df, freq='D'):
+    """선택한 시계열들의 기간별 최고 순위 표 (행: 기간, 열: 치과/키워드/검색 유형/영역)"""
+    labels = df[SERIES_KEYS[0]].astype(str)
+    for key in SERIES_KEYS[1:]:
+        labels = labels + ' / ' + df[key].astype(str)
+    return (
+        df.assign(series=labels, period=df['checked_at'].dt.to_period(freq).dt.to_timestamp(),
+                  rank_float=df['rank'].astype('float64'))
+        .pivot_table(index='period', columns='series', values='rank_float', aggfunc='min')
+    )
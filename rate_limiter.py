@@ -0,0 +1,85 @@
+# 호스트별 토큰 버킷 요청 속도 제한
+import asyncio
+import threading
+import time
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """초당 rate 개의 토큰이 burst 개까지 쌓이는 토큰 버킷
+
+    reserve() 는 토큰을 미리 차감하고 기다려야 할 시간을 돌려주므로
+    스레드와 asyncio 양쪽에서 같은 버킷을 공유할 수 있다. slowdown 배율을 주면
+    그만큼 느린 속도로 토큰이 채워진다 (요청 제한 응답에 따른 감속).
+    """
+
+    def __init__(self, rate, burst=1):
+        if rate <= 0:
+            raise ValueError("rate 는 0보다 커야 합니다.")
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, slowdown=1.0):
+        """토큰 하나를 예약하고 사용 가능해질 때까지의 대기 시간(초)을 반환"""
+        rate = self.rate / max(1.0, slowdown)
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / rate)
+
+    def acquire(self, slowdown=1.0):
+        """토큰을 얻을 때까지 블로킹 대기"""
+        wait = self.reserve(slowdown)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, slowdown=1.0):
+        """토큰을 얻을 때까지 비동기 대기"""
+        wait = self.reserve(slowdown)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+class HostRateLimiter:
+    """요청 URL 의 호스트마다 별도의 토큰 버킷을 두는 속도 제한기"""
+
+    def __init__(self, rate, burst=1):
+        self.rate = rate
+        self.burst = burst
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls, search_settings):
+        """SEARCH_SETTINGS 로 속도 제한기 생성
+
+        requests_per_second 가 없으면 delay_between_requests 와 같은 평균 속도를 쓴다.
+        """
+        rate = search_settings.get('requests_per_second')
+        if not rate:
+            rate = 1 / max(search_settings['delay_between_requests'], 0.001)
+        return cls(rate, search_settings.get('burst', 1))
+
+    def bucket(self, url):
+        """URL 호스트의 토큰 버킷"""
+        host = urlsplit(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return bucket
+
+    def acquire(self, url, slowdown=1.0):
+        """호스트 토큰을 얻을 때까지 블로킹 대기"""
+        return self.bucket(url).acquire(slowdown)
+
+    async def acquire_async(self, url, slowdown=1.0):
+        """호스트 토큰을 얻을 때까지 비동기 대기"""
+        return await self.bucket(url).acquire_async(slowdown)
@@ -0,0 +1,132 @@
+# 순위 결과 파일 내보내기 (xlsx / csv / parquet)
+import os
+
+import pandas as pd
+
+from rank_record import normalize_frame
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None
+
+# OUTPUT_SETTINGS['export_format'] 로 선택할 수 있는 형식
+EXPORT_FORMATS = ('xlsx', 'csv', 'parquet')
+
+SHEET_NAME = '검색순위결과'
+
+# 엑셀 열 너비 최대값
+MAX_COLUMN_WIDTH = 50
+
+
+def column_widths(df):
+    """열마다 (헤더 포함) 가장 긴 값의 길이 + 2 를 벡터 연산으로 계산 (최대 50)"""
+    widths = []
+    for column in df.columns:
+        values = df[column].astype(str).str.len()
+        longest = max(len(str(column)), int(values.max()) if len(values) else 0)
+        widths.append(min(longest + 2, MAX_COLUMN_WIDTH))
+    return widths
+
+
+def write_excel_rows(df, filepath, widths):
+    """xlsxwriter constant_memory 모드로 헤더와 행을 순서대로 쓰기
+
+    constant_memory 모드는 지금 쓰는 행만 메모리에 두고 앞 행으로 돌아가지 못하므로
+    (pandas 의 to_excel 은 열 단위로 써서 첫 열 말고는 비게 된다) 직접 한 행씩 쓴다.
+    빈 값(NaN/None/pd.NA)은 빈 셀로 둔다.
+    """
+    workbook = xlsxwriter.Workbook(filepath, {'constant_memory': True})
+    try:
+        worksheet = workbook.add_worksheet(SHEET_NAME)
+        for index, width in enumerate(widths):
+            worksheet.set_column(index, index, width)
+        worksheet.write_row(0, 0, [str(column) for column in df.columns], workbook.add_format({'bold': True}))
+        values = df.astype(object).where(df.notna(), None)
+        for row, record in enumerate(values.itertuples(index=False, name=None), 1):
+            worksheet.write_row(row, 0, record)
+    finally:
+        workbook.close()
+    return filepath
+
+
+def write_excel(df, filepath):
+    """열 너비를 미리 계산해 엑셀로 저장
+
+    xlsxwriter 가 있으면 constant_memory(스트리밍) 모드로 한 행씩 순서대로 쓰고,
+    없으면 openpyxl 로 쓰되 셀을 다시 훑지 않고 계산해 둔 너비만 적용한다.
+    """
+    widths = column_widths(df)
+    if xlsxwriter is not None:
+        write_excel_rows(df, filepath, widths)
+    else:
+        from openpyxl.utils import get_column_letter
+        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
+            df.to_excel(writer, sheet_name=SHEET_NAME, index=False)
+            worksheet = writer.sheets[SHEET_NAME]
+            for index, width in enumerate(widths, 1):
+                worksheet.column_dimensions[get_column_letter(index)].width = width
+    return filepath
+
+
+def export_frame(df, base_path, export_format='xlsx'):
+    """확장자 없는 경로 base_path 에 선택한 형식으로 저장하고 파일 경로 반환"""
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"알 수 없는 저장 형식: {export_format}")
+    directory = os.path.dirname(base_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    filepath = f"{base_path}.{export_format}"
+    if export_format == 'xlsx':
+        return write_excel(df, filepath)
+    if export_format == 'csv':
+        # 엑셀에서 한글이 깨지지 않도록 BOM 을 붙인다
+        df.to_csv(filepath, index=False, encoding='utf-8-sig')
+    else:
+        # parquet 는 컬럼 타입이 하나여야 하므로 rank 를 Int64 + status 로 나눠 저장한다
+        normalize_frame(df).to_parquet(filepath, index=False)
+    return filepath
+
+
+# xlsx/csv 결과를 처음 읽을 때 만들어 두는 parquet 사이드카 폴더 (결과 파일과 같은 폴더 아래)
+SIDECAR_DIR = '.sidecar'
+
+
+def list_result_files(directory):
+    """결과 폴더의 결과 파일(xlsx/csv/parquet) 목록, 최신 파일부터"""
+    if not os.path.isdir(directory):
+        return []
+    extensions = tuple(f'.{fmt}' for fmt in EXPORT_FORMATS)
+    names = [entry.name for entry in os.scandir(directory) if entry.is_file() and entry.name.endswith(extensions)]
+    return sorted(names, reverse=True)
+
+
+def sidecar_path(filepath):
+    """결과 파일의 parquet 사이드카 경로"""
+    directory, name = os.path.split(filepath)
+    return os.path.join(directory, SIDECAR_DIR, f"{name}.parquet")
+
+
+def read_result_file(filepath):
+    """결과 파일을 타입이 붙은 DataFrame 으로 읽기
+
+    xlsx/csv 는 처음 읽을 때 parquet 사이드카를 만들고, 원본보다 새 사이드카가 있으면
+    느린 read_excel 대신 그것을 읽는다. pyarrow 가 없으면 사이드카 없이 원본을 읽는다.
+    """
+    if filepath.endswith('.parquet'):
+        return normalize_frame(pd.read_parquet(filepath))
+
+    sidecar = sidecar_path(filepath)
+    if os.path.exists(sidecar) and os.path.getmtime(sidecar) >= os.path.getmtime(filepath):
+        return pd.read_parquet(sidecar)
+
+    if filepath.endswith('.csv'):
+        df = normalize_frame(pd.read_csv(filepath, encoding='utf-8-sig'))
+    else:
+        df = normalize_frame(pd.read_excel(filepath))
+    try:
+        os.makedirs(os.path.dirname(sidecar), exist_ok=True)
+        df.to_parquet(sidecar, index=False)
+    except Exception as e:
+        print(f"parquet 사이드카 저장 실패 ({filepath}): {e}")
+    return df
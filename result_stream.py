@@ -0,0 +1,82 @@
+# 검색 중 도착하는 결과를 표 하나와 상태별 건수로 이어 붙이는 누적기
+import pandas as pd
+
+from rank_record import RankStatus, records_to_frame
+
+
+class ResultStream:
+    """새로 도착한 레코드만 변환해 조각으로 쌓고 상태별 건수와 평균 순위를 갱신
+
+    화면을 다시 그릴 때마다 전체 결과를 DataFrame 으로 다시 만들지 않도록, 지금까지의
+    조각과 건수를 들고 있다가 last_id 이후의 레코드만 받아 처리한다. 조각은 전체 표(frame)를
+    요청할 때 한 번만 이어 붙이므로, 검색 중에는 tail() 로 마지막 몇 행만 보여 주면
+    갱신 비용이 쌓인 결과 수와 관계없이 일정하다.
+    """
+
+    def __init__(self):
+        self.counts = {status.value: 0 for status in RankStatus}
+        self.last_id = 0
+        self.rows = 0
+        self._chunks = []
+        self._frame = None
+        self._rank_sum = 0
+        self._ranked = 0
+
+    @classmethod
+    def from_results(cls, results):
+        """완료된 결과 목록 전체로 생성"""
+        stream = cls()
+        stream.extend(results)
+        return stream
+
+    def extend(self, records, last_id=None):
+        """레코드(dict) 추가 (last_id 는 작업 저장소에서 마지막으로 읽은 위치)"""
+        if last_id is not None:
+            self.last_id = last_id
+        if not records:
+            return
+        chunk = records_to_frame(records)
+        for status, count in chunk['status'].value_counts().items():
+            self.counts[status] += int(count)
+        ranks = chunk['rank'].dropna()
+        self._rank_sum += int(ranks.sum())
+        self._ranked += len(ranks)
+        self.rows += len(chunk)
+        self._chunks.append(chunk)
+        self._frame = None
+
+    @property
+    def frame(self):
+        """지금까지의 전체 표 (다음 레코드가 올 때까지 이어 붙인 결과를 재사용)"""
+        if self._frame is None:
+            if not self._chunks:
+                self._frame = records_to_frame([])
+            else:
+                # 카테고리 값이 조각마다 달라 concat 후 object 로 바뀌는 컬럼은 표시용이라 그대로 둔다
+                self._frame = pd.concat(self._chunks, ignore_index=True) if len(self._chunks) > 1 \
+                    else self._chunks[0]
+                self._chunks = [self._frame]
+        return self._frame
+
+    def tail(self, rows):
+        """마지막 rows 행 (전체 표를 이어 붙이지 않고 뒤쪽 조각만 사용)"""
+        picked = []
+        count = 0
+        for chunk in reversed(self._chunks):
+            if count >= rows:
+                break
+            picked.append(chunk)
+            count += len(chunk)
+        if not picked:
+            return records_to_frame([])
+        return pd.concat(picked[::-1], ignore_index=True).tail(rows)
+
+    def summary(self):
+        """rank_summary 와 같은 형태의 요약 (전체 표를 만들지 않고 누적한 값으로 계산)"""
+        return {
+            'total': self.rows,
+            'found': self.counts[RankStatus.FOUND.value],
+            'not_found': self.counts[RankStatus.NOT_FOUND.value],
+            'error': self.counts[RankStatus.ERROR.value],
+            'avg_rank': self._rank_sum / self._ranked if self._ranked else None,
+        }
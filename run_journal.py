@@ -0,0 +1,89 @@
+# 실행 중 완료된 검색 결과를 바로 기록하는 체크포인트 저널
+import glob
+import json
+import os
+from datetime import datetime
+
+from rank_history import new_run_id
+
+
+class RunJournal:
+    """실행 하나의 완료된 (치과, 키워드, 검색 유형) 결과를 JSON Lines 파일에 추가 기록
+
+    한 줄이 치과 하나의 (키워드, 검색 유형) 결과 전체이고, 매 줄마다 디스크에 flush 하므로
+    실행이 중단돼도 그때까지의 결과는 남는다. 같은 run_id 로 다시 열면 기록된 결과를
+    check_clinics_ranks 의 reuse 형식으로 돌려줘 남은 검색만 이어서 할 수 있다.
+    """
+
+    def __init__(self, path, run_id):
+        self.path = path
+        self.run_id = run_id
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        self._file = open(path, 'a', encoding='utf-8')
+
+    @staticmethod
+    def journal_dir(config_module):
+        """체크포인트 파일을 두는 폴더"""
+        return config_module.OUTPUT_SETTINGS.get('checkpoint_dir', 'data/runs')
+
+    @classmethod
+    def from_config(cls, config_module, run_id=None):
+        """설정의 체크포인트 폴더에 새 실행(run_id 없으면 새 실행 ID) 저널 열기"""
+        run_id = run_id or new_run_id()
+        return cls(os.path.join(cls.journal_dir(config_module), f"{run_id}.jsonl"), run_id)
+
+    @classmethod
+    def resume(cls, config_module, run_id):
+        """중단된 실행의 저널 다시 열기 (없으면 None)"""
+        path = os.path.join(cls.journal_dir(config_module), f"{run_id}.jsonl")
+        if not os.path.exists(path):
+            return None
+        return cls(path, run_id)
+
+    @classmethod
+    def list_unfinished(cls, config_module):
+        """완료되지 않은(저널 파일이 남아 있는) 실행 ID 목록, 최근 것부터"""
+        paths = glob.glob(os.path.join(cls.journal_dir(config_module), '*.jsonl'))
+        return sorted((os.path.splitext(os.path.basename(path))[0] for path in paths), reverse=True)
+
+    def record(self, clinic_name, keyword, search_type, results, fetched_at=None):
+        """치과 하나의 (키워드, 검색 유형) 결과를 저널에 추가 (fetched_at 없으면 현재 시각)"""
+        entry = {
+            'clinic_name': clinic_name,
+            'keyword': keyword,
+            'search_type': search_type,
+            'fetched_at': (fetched_at or datetime.now()).isoformat(timespec='seconds'),
+            'results': results,
+        }
+        self._file.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def completed(self):
+        """기록된 결과를 ({(키워드, 검색 유형): {치과명: [결과]}}, {(치과명, 키워드, 검색 유형): 검색 시각}) 로 반환
+
+        중단 시점에 쓰다 만 마지막 줄은 건너뛴다.
+        """
+        done = {}
+        fetched_at = {}
+        with open(self.path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                pair = (entry['keyword'], entry['search_type'])
+                done.setdefault(pair, {})[entry['clinic_name']] = entry['results']
+                fetched_at[(entry['clinic_name'], *pair)] = datetime.fromisoformat(entry['fetched_at'])
+        return done, fetched_at
+
+    def finish(self):
+        """결과 저장까지 끝난 실행의 저널 삭제"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+    def close(self):
+        """파일 닫기"""
+        if not self._file.closed:
+            self._file.close()
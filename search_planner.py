@@ -0,0 +1,30 @@
+# 여러 치과 검색을 고유한 (키워드, 검색 유형) 쌍으로 묶는 검색 계획
+
+# 검색 유형 (check_all_ranks 가 검색하는 순서)
+SEARCH_TYPES = ['블로그', '웹', '플레이스']
+
+
+def ordered_search_types(search_types):
+    """선택된 검색 유형을 check_all_ranks 순서(블로그, 웹, 플레이스)로 정렬"""
+    return [t for t in SEARCH_TYPES if t in search_types]
+
+
+def iter_clinic_requests(clinics, search_types):
+    """치과별로 check_all_ranks 를 호출했을 때의 (치과명, 키워드, 검색 유형) 순서"""
+    for clinic in clinics:
+        for search_type in ordered_search_types(search_types):
+            for keyword in clinic['keywords']:
+                yield clinic['name'], keyword, search_type
+
+
+def build_search_plan(clinics, search_types):
+    """고유한 (키워드, 검색 유형) 쌍별 관심 치과 목록
+
+    {(키워드, 검색 유형): [치과명, ...]} 형태로, 처음 등장한 순서를 유지한다.
+    """
+    plan = {}
+    for clinic_name, keyword, search_type in iter_clinic_requests(clinics, search_types):
+        interested = plan.setdefault((keyword, search_type), [])
+        if clinic_name not in interested:
+            interested.append(clinic_name)
+    return plan
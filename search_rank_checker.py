@@ -1,306 +1,328 @@
-import requests
+import threading
 import time
 import re
-from bs4 import BeautifulSoup
 import pandas as pd
 from datetime import datetime
 import os
+from search_planner import SEARCH_TYPES, build_search_plan, iter_clinic_requests
+from clinic_matcher import ClinicMatcher
+from serp_cache import SerpCache
+from serp_extractor import get_extractor
+from serp_specs import SERP_PAGING
+from page_scanner import PageScan
+from fetch_guard import CircuitOpenError, FetchGuard
+from http_client import accept_encoding, create_session, http_backend, http_get, request_timeout
+from rank_history import RankHistory, new_run_id
+from result_export import export_frame
+from stage_timings import StageTimings, metrics_path
+from concurrent.futures import ThreadPoolExecutor
+
+# 네이버 검색 주소 (NAVER_SETTINGS 에 없을 때)
+DEFAULT_SEARCH_URL = "https://search.naver.com/search.naver"
+
+# 검색 유형별 (NAVER_SETTINGS 의 검색 주소 키, 쿼리 문자열)
+SEARCH_URLS = {
+    '블로그': ('blog_search_url', "where=blog&query={keyword}"),
+    '웹': ('web_search_url', "query={keyword}"),
+    '플레이스': ('place_search_url', "where=place&query={keyword}"),
+}
+
+# 추출 엔진 코드를 바꾸면 올려서 캐시된 파싱 결과를 무효화한다 (명세 변경은 자동 반영)
+PARSER_VERSION = 4
 
 class SearchRankChecker:
     def __init__(self, config_module):
         self.config = config_module
-        self.session = requests.Session()
+        self.delay = self.config.SEARCH_SETTINGS['delay_between_requests']
+        self.parser_backend = self.config.SEARCH_SETTINGS.get('parser', 'html.parser')
+        self.partial_parsing = self.config.SEARCH_SETTINGS.get('partial_parsing', True)
+        self.extractor = get_extractor(self.parser_backend, self.partial_parsing)
+        self.max_pages = self.config.SEARCH_SETTINGS.get('max_pages', 1)
+        self.prefetch_pages = self.config.SEARCH_SETTINGS.get('prefetch_pages', True)
+        self._prefetcher = None
+        self._prefetcher_lock = threading.Lock()
+        self.last_run_id = None
+        self.reused_fetched_at = {}
+        # 요청마다 (응답 시간(초), 상태 코드) 를 받는 콜백 (속도 제한 대기는 빼고 HTTP 요청만 잰다)
+        self.on_request = None
+        # 단계별(연결/다운로드/디코딩/파싱/추출/매칭/대기) 소요 시간을 검색 유형별로 누적
+        self.timings = StageTimings()
+        naver_settings = getattr(config_module, 'NAVER_SETTINGS', None) or {}
+        self.search_urls = {
+            search_type: f"{naver_settings.get(key, DEFAULT_SEARCH_URL)}?{query}"
+            for search_type, (key, query) in SEARCH_URLS.items()
+        }
+        self.http_backend = http_backend(config_module)
+        self.request_timeout = request_timeout(self.http_backend, config_module)
+        self.guard = FetchGuard.from_config(config_module)
         self.setup_session()
+        self.cache = SerpCache.from_config(config_module)
     
     def setup_session(self):
-        """세션 설정 및 헤더 설정"""
+        """세션 설정 및 헤더 설정 (SEARCH_SETTINGS['http_client'] 백엔드)"""
         headers = {
             'User-Agent': self.config.SEARCH_SETTINGS['user_agent'],
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'ko-KR,ko;q=0.8,en-US;q=0.5,en;q=0.3',
-            'Accept-Encoding': 'gzip, deflate',
-            'Connection': 'keep-alive',
+            'Accept-Encoding': accept_encoding(self.http_backend),
             'Upgrade-Insecure-Requests': '1',
         }
-        self.session.headers.update(headers)
-    
-    def check_blog_rank(self, clinic_name, keywords):
-        """네이버 블로그 검색 순위 체크 (인기글/일반글 모두)"""
-        results = []
-        for keyword in keywords:
-            print(f"블로그 검색 중: {keyword}")
-            try:
-                search_url = f"https://search.naver.com/search.naver?where=blog&query={keyword}"
-                response = self.session.get(search_url)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, 'html.parser')
-
-                     # 1. 인기글 영역
-                popular_section = soup.find(
-                    'section',
-                    class_='sc_new sp_nreview _fe_view_root _prs_ugB_bsR'
+        # HTTP/2 는 Connection 헤더를 허용하지 않는다 (연결 유지는 두 백엔드 모두 연결 풀이 맡는다)
+        if self.http_backend == 'requests':
+            headers['Connection'] = 'keep-alive'
+        self.session = create_session(self.http_backend, self.config, headers)
+
+    def search_url(self, search_type, keyword, page=1):
+        """검색 유형별 네이버 검색 URL (2페이지부터는 시작 위치 파라미터를 붙인다)"""
+        url = self.search_urls[search_type].format(keyword=keyword)
+        if page > 1:
+            paging = SERP_PAGING[search_type]
+            url += f"&{paging['page_param']}={1 + (page - 1) * paging['page_size']}"
+        return url
+
+    def parse_page(self, search_type, html):
+        """검색 유형에 맞는 파서로 결과 페이지 파싱해 (영역별 항목 목록, 영역별 순위 항목 수) 반환
+
+        캐시가 켜져 있으면 같은 본문의 페이지는 파싱하지 않고 저장된 항목 목록을 쓴다.
+        """
+        if self.cache is not None:
+            key = self.cache.parsed_key(html, search_type, f"{PARSER_VERSION}-{self.extractor.fingerprint}")
+            parsed = self.cache.get_parsed(key)
+            if parsed is not None:
+                return parsed
+
+        with self.timings.measure(search_type, 'parse'):
+            doc = self.extractor.parse(search_type, html)
+        with self.timings.measure(search_type, 'extract'):
+            parsed = self.extractor.extract_doc(search_type, doc)
+
+        if self.cache is not None:
+            self.cache.put_parsed(key, parsed)
+        return parsed
+
+    def cached_page(self, url, search_type, keyword, page=1):
+        """디스크 캐시에서 검색 결과 페이지 조회 (캐시가 꺼져 있거나 없으면 None)"""
+        if self.cache is None:
+            return None
+        return self.cache.get(self.cache.make_key(url, search_type, keyword, page))
+
+    def conditional_headers(self, cached):
+        """TTL 이 지난 캐시 항목의 조건부 재검증 헤더"""
+        headers = {}
+        if cached and cached.etag:
+            headers['If-None-Match'] = cached.etag
+        if cached and cached.last_modified:
+            headers['If-Modified-Since'] = cached.last_modified
+        return headers
+
+    def store_page(self, cached, url, search_type, keyword, status_code, text, headers, page=1):
+        """응답을 캐시에 반영하고 페이지 HTML 을 반환 (304 면 캐시 본문 재사용)"""
+        if self.cache is None:
+            return text
+        if status_code == 304 and cached:
+            self.cache.revalidated(cached.key)
+            return cached.body
+        key = self.cache.make_key(url, search_type, keyword, page)
+        self.cache.put(key, url, text, headers.get('ETag'), headers.get('Last-Modified'))
+        return text
+
+    def throttle(self, search_type, url):
+        """요청 전 속도 제한 대기 (기본 체커는 요청 뒤 polite_fetch_html 에서 쉰다)
+
+        실제로 기다리는 엔진만 대기 시간을 search_type 의 'wait' 단계에 더한다.
+        """
+
+    def download(self, url, headers=None, on_connect=None):
+        """HTTP GET 요청 (상태 코드 판단은 fetch_html 의 응답 분류에 맡긴다)"""
+        return self.timed_get(self.session, url, headers, on_connect)
+
+    def timed_get(self, session, url, headers=None, on_connect=None):
+        """세션으로 GET 요청하고 on_request 콜백에 응답 시간을 알림 (on_connect 는 새 연결 시간)"""
+        started = time.perf_counter()
+        response = http_get(session, url, headers, self.request_timeout, on_connect)
+        if self.on_request:
+            self.on_request(time.perf_counter() - started, response.status_code)
+        return response
+
+    def fetch_html(self, search_type, keyword, page=1):
+        """검색 결과 HTML 을 캐시 또는 네이버에서 가져옴
+
+        응답은 FetchGuard 가 분류해 요청 제한/일시 오류는 백오프 후 다시 요청하고,
+        차단/캡차 페이지는 순위 밖으로 파싱하지 않고 FetchError 로 알린다.
+        (HTML, 네트워크 요청 여부) 를 반환한다.
+        """
+        url = self.search_url(search_type, keyword, page)
+        cached = self.cached_page(url, search_type, keyword, page)
+        if cached and cached.fresh:
+            return cached.body, False
+
+        timings = self.timings
+
+        def on_connect(seconds):
+            timings.add(search_type, 'connect', seconds)
+
+        def on_wait(seconds):
+            timings.add(search_type, 'wait', seconds)
+
+        def request():
+            self.throttle(search_type, url)
+            with timings.measure(search_type, 'download'):
+                response = self.download(url, self.conditional_headers(cached), on_connect)
+            timings.add(search_type, 'download', nbytes=len(response.content), count=0)
+            with timings.measure(search_type, 'decode'):
+                text = response.text
+            return response.status_code, text, response.headers
+
+        status_code, text, headers = self.guard.call(url, request, on_wait)
+        html = self.store_page(cached, url, search_type, keyword, status_code, text, headers, page)
+        return html, True
+
+    def set_delay(self, delay):
+        """요청 간 지연(초) 변경 (웹 앱에서 고른 값)"""
+        self.delay = delay
+
+    def polite_fetch_html(self, search_type, keyword, page=1):
+        """요청 간 지연을 지키며 검색 결과 HTML 을 가져옴"""
+        html, fetched = self.fetch_html(search_type, keyword, page)
+
+        # 요청 간 지연 (캐시에서 가져온 경우 요청하지 않았으므로 생략, 요청 제한을 받으면 늘어남)
+        if fetched:
+            with self.timings.measure(search_type, 'wait'):
+                time.sleep(self.delay * self.guard.slowdown)
+        return html
+
+    def fetch_matched_pages(self, search_type, keyword, matcher, interested):
+        """1페이지부터 max_pages 까지 검색해 영역별 매칭 결과를 합침
+
+        관심 치과(interested)를 모두 찾거나 결과가 끝나면 바로 멈춘다. 2페이지부터는
+        현재 페이지를 파싱하는 동안 다음 페이지를 미리 받아 둔다(prefetch_pages).
+        [(검색 영역, {치과명: 항목})] 형태로 반환한다.
+        """
+        scan = PageScan(SERP_PAGING[search_type]['paged_areas'], interested, self.max_pages)
+        html = self.polite_fetch_html(search_type, keyword, 1)
+        while True:
+            page = scan.page + 1
+            # 1페이지에서 못 찾았으면 더 깊이 훑을 가능성이 높으므로 다음 페이지를 미리 요청
+            prefetch = None
+            if self.prefetch_pages and page >= 2 and page < scan.max_pages:
+                prefetch = self.prefetcher().submit(self.polite_fetch_html, search_type, keyword, page + 1)
+
+            sections, ranked = self.parse_page(search_type, html)
+            scan.add_page(self.match_sections(search_type, sections, matcher), ranked)
+
+            if not scan.needs_next_page():
+                if prefetch is not None:
+                    prefetch.cancel()
+                return scan.matched
+            if prefetch is not None:
+                html = prefetch.result()
+            else:
+                html = self.polite_fetch_html(search_type, keyword, page + 1)
+
+    def prefetcher(self):
+        """다음 페이지를 미리 받는 스레드 풀 (처음 호출 시 생성)
+
+        thread 엔진에서는 여러 워커가 동시에 처음 호출할 수 있으므로 잠금 안에서 하나만 만든다.
+        """
+        with self._prefetcher_lock:
+            if self._prefetcher is None:
+                self._prefetcher = ThreadPoolExecutor(
+                    max_workers=self.config.SEARCH_SETTINGS.get('max_concurrency', 1)
                 )
-                popular_found = False
-                if popular_section:
-                    blog_items = popular_section.select('ul.lst_view > li.bx')
-                    rank = 0
-                    for item in blog_items:
-                        rank += 1
-                        # 인기글의 제목과 요약 텍스트
-                        title_elem   = item.select_one('.title_area a.title_link')
-                        content_elem = item.select_one('.dsc_area a.dsc_link')
-                        if title_elem and content_elem:
-                            title   = title_elem.get_text(strip=True)
-                            content = content_elem.get_text(strip=True)
-                            if clinic_name in title or clinic_name in content:
-                                results.append({
-                                    'clinic_name': clinic_name,
-                                    'keyword': keyword,
-                                    'search_type': '블로그',
-                                    'search_area': '인기글',
-                                    'rank': rank,
-                                    'title': title,
-                                    'url': title_elem.get('href', ''),
-                                    'content': content[:100] + '...' if len(content) > 100 else content
-                                })
-                                popular_found = True
-                                break
-                    if not popular_found:
-                        results.append({
-                            'clinic_name': clinic_name,
-                            'keyword': keyword,
-                            'search_type': '블로그',
-                            'search_area': '인기글',
-                            'rank': '순위 밖',
-                            'title': '',
-                            'url': '',
-                            'content': ''
-                        })
-
-
-                # 2. 일반 블로그 영역
-                normal_section = soup.find('section', class_='sc_new sp_ntotal _sp_ntotal _prs_web_gen _fe_root_web_gend')
-                normal_found = False
-                if normal_section:
-                    blog_items = normal_section.select('ul.lst_total > li.bx')
-                    rank = 0
-                    for item in blog_items:
-                        rank += 1
-                        title_elem = item.select_one('a.link_tit')
-                        content_elem = item.select_one('a.api_txt_lines.total_dsc')
-                        if title_elem and content_elem:
-                            title = title_elem.get_text(strip=True)
-                            content = content_elem.get_text(strip=True)
-                            if clinic_name in title or clinic_name in content:
-                                results.append({
-                                    'clinic_name': clinic_name,
-                                    'keyword': keyword,
-                                    'search_type': '블로그',
-                                    'search_area': '일반',
-                                    'rank': rank,
-                                    'title': title,
-                                    'url': title_elem.get('href', ''),
-                                    'content': content[:100] + '...' if len(content) > 100 else content
-                                })
-                                normal_found = True
-                                break
-                    if not normal_found:
-                        results.append({
-                            'clinic_name': clinic_name,
-                            'keyword': keyword,
-                            'search_type': '블로그',
-                            'search_area': '일반',
-                            'rank': '순위 밖',
-                            'title': '',
-                            'url': '',
-                            'content': ''
-                        })
-
-                # 요청 간 지연
-                time.sleep(self.config.SEARCH_SETTINGS['delay_between_requests'])
-
-            except Exception as e:
-                print(f"블로그 검색 중 오류 발생: {e}")
+            return self._prefetcher
+
+    def match_sections(self, search_type, sections, matcher):
+        """영역별로 치과마다 처음 매칭된 항목을 찾는다
+
+        치과명 매칭은 명세의 match_fields(제목, 본문 또는 플레이스 주소)를 대상으로 하며,
+        항목마다 한 번만 스캔해 관심 있는 모든 치과를 찾는다.
+        [(검색 영역, {치과명: 항목})] 형태로 반환한다.
+        """
+        with self.timings.measure(search_type, 'match'):
+            return [
+                (search_area, matcher.first_matches(items, self.extractor.spec(search_type, search_area)['match_fields']))
+                for search_area, items in sections
+            ]
+
+    def build_results(self, clinic_name, keyword, search_type, matched_sections):
+        """매칭된 검색 결과에서 치과 순위 레코드 생성"""
+        results = []
+        for search_area, matches in matched_sections:
+            match = matches.get(clinic_name)
+            if match:
+                content = match['content']
+                limit = self.extractor.spec(search_type, search_area)['content_limit']
+                if limit is not None:
+                    content = content[:limit] + '...' if len(content) > limit else content
                 results.append({
                     'clinic_name': clinic_name,
                     'keyword': keyword,
-                    'search_type': '블로그',
-                    'search_area': '오류',
-                    'rank': '오류',
-                    'title': '',
-                    'url': '',
-                    'content': str(e)
+                    'search_type': search_type,
+                    'search_area': search_area,
+                    'rank': match['rank'],
+                    'title': match['title'],
+                    'url': match['url'],
+                    'content': content
                 })
-        return results
-
-    def check_web_rank(self, clinic_name, keywords):
-        """네이버 웹 검색 순위 체크"""
-        results = []
-        for keyword in keywords:
-            print(f"웹 검색 중: {keyword}")
-            try:
-                search_url = f"https://search.naver.com/search.naver?query={keyword}"
-                response = self.session.get(search_url)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, 'html.parser')
-
-                # 1) '웹(통합)' 결과가 들어있는 section
-                section = soup.select_one('section.sc_new.sp_ntotal')
-                # 2) 그 안의 <ul class="lst_total"> 이하 항목들
-                web_items = section.select('ul.lst_total > li.bx') if section else []
-
-                rank = 0
-                found = False
-
-                for item in web_items:
-                    # 광고/특집 블록 건너뛰기: 
-                    # (예: 별도 클래스가 붙어있다면 continue)
-                    if item.select_one('.api_sponsor') or item.select_one('.btn_save'):
-                        continue
-
-                    rank += 1
-
-                    # 제목 추출: <a class="link_tit"> 또는 <a class="link_tit" href=…>
-                    title_elem = item.select_one('a.link_tit')
-                    # 요약/본문 추출: <div class="api_txt_lines total_dsc">…
-                    content_elem = item.select_one('div.total_dsc_wrap .api_txt_lines')
-
-                    if title_elem:
-                        title   = title_elem.get_text(strip=True)
-                        url     = title_elem['href']
-                        content = content_elem.get_text(strip=True) if content_elem else ''
-
-                        # 클리닉명 포함 여부 체크
-                        if clinic_name in title or clinic_name in content:
-                            results.append({
-                                'clinic_name': clinic_name,
-                                'keyword': keyword,
-                                'search_type': '웹',
-                                'search_area': '일반',
-                                'rank': rank,
-                                'title': title,
-                                'url': url,
-                                'content': (content[:100] + '...') if len(content) > 100 else content
-                            })
-                            found = True
-                            break
-
-                if not found:
-                    results.append({
-                        'clinic_name': clinic_name,
-                        'keyword': keyword,
-                        'search_type': '웹',
-                        'search_area': '일반',
-                        'rank': '순위 밖',
-                        'title': '',
-                        'url': '',
-                        'content': ''
-                    })
-
-                time.sleep(self.config.SEARCH_SETTINGS['delay_between_requests'])
-
-            except Exception as e:
-                print(f"웹 검색 중 오류 발생: {e}")
+            else:
                 results.append({
                     'clinic_name': clinic_name,
                     'keyword': keyword,
-                    'search_type': '웹',
-                    'search_area': '오류',
-                    'rank': '오류',
+                    'search_type': search_type,
+                    'search_area': search_area,
+                    'rank': '순위 밖',
                     'title': '',
                     'url': '',
-                    'content': str(e)
+                    'content': ''
                 })
-
         return results
 
+    def error_result(self, clinic_name, keyword, search_type, error):
+        """검색 실패 레코드 생성"""
+        return {
+            'clinic_name': clinic_name,
+            'keyword': keyword,
+            'search_type': search_type,
+            'search_area': '오류',
+            'rank': '오류',
+            'title': '',
+            'url': '',
+            'content': str(error)
+        }
 
-    from bs4 import BeautifulSoup
-    import time
-
-    def check_place_rank(self, clinic_name, keywords):
-        """네이버 플레이스 검색 순위 체크"""
+    def _check_rank(self, search_type, clinic_name, keywords):
+        """한 치과의 키워드들에 대해 검색 유형 하나의 순위 체크"""
         results = []
+        matcher = ClinicMatcher([clinic_name])
         for keyword in keywords:
-            print(f"플레이스 검색 중: {keyword}")
+            print(f"{search_type} 검색 중: {keyword}")
             try:
-                search_url = f"https://search.naver.com/search.naver?where=place&query={keyword}"
-                response = self.session.get(search_url)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, 'html.parser')
-
-                # 실제 리스트 아이템
-                place_items = soup.select('ul.zPw6U > li.DWs4Q')
-                rank = 0
-                found = False
-
-                for item in place_items:
-                    # 광고 배너 제거: '광고' 레이블이 있는 경우 스킵
-                    if item.select_one('.place_ad_label_text'):
-                        continue
-
-                    rank += 1
-
-                    # 제목 요소
-                    title_a = item.select_one('div.LYTmB > a.place_bluelink')
-                    title = title_a.get_text(strip=True) if title_a else ''
-
-                    # 링크
-                    url = title_a['href'] if title_a and title_a.has_attr('href') else ''
-
-                    # 주소 요소
-                    addr_span = item.select_one('div.w32a4 span.Pb4bU')
-                    address = addr_span.get_text(strip=True) if addr_span else ''
-
-                    # 치과명 매칭
-                    if clinic_name in title or clinic_name in address:
-                        results.append({
-                            'clinic_name':   clinic_name,
-                            'keyword':       keyword,
-                            'search_type':   '플레이스',
-                            'search_area':   '일반',
-                            'rank':          rank,
-                            'title':         title,
-                            'url':           url,
-                            'content':       address,
-                        })
-                        found = True
-                        break
-
-                if not found:
-                    results.append({
-                        'clinic_name': clinic_name,
-                        'keyword':     keyword,
-                        'search_type': '플레이스',
-                        'search_area': '일반',
-                        'rank':        '순위 밖',
-                        'title':       '',
-                        'url':         '',
-                        'content':     '',
-                    })
-
-                time.sleep(self.config.SEARCH_SETTINGS['delay_between_requests'])
-
+                matched_sections = self.fetch_matched_pages(search_type, keyword, matcher, [clinic_name])
+                results.extend(self.build_results(clinic_name, keyword, search_type, matched_sections))
+            except CircuitOpenError:
+                # 차단이 계속되면 남은 키워드를 오류로 채우지 않고 멈춘다
+                raise
             except Exception as e:
-                print(f"플레이스 검색 중 오류 발생: {e}")
-                results.append({
-                    'clinic_name': clinic_name,
-                    'keyword':     keyword,
-                    'search_type': '플레이스',
-                    'search_area': '오류',
-                    'rank':        '오류',
-                    'title':       '',
-                    'url':         '',
-                    'content':     str(e),
-                })
-
+                print(f"{search_type} 검색 중 오류 발생: {e}")
+                results.append(self.error_result(clinic_name, keyword, search_type, e))
         return results
 
+    def check_blog_rank(self, clinic_name, keywords):
+        """네이버 블로그 검색 순위 체크 (인기글/일반글 모두)"""
+        return self._check_rank('블로그', clinic_name, keywords)
+
+    def check_web_rank(self, clinic_name, keywords):
+        """네이버 웹 검색 순위 체크"""
+        return self._check_rank('웹', clinic_name, keywords)
+
+    def check_place_rank(self, clinic_name, keywords):
+        """네이버 플레이스 검색 순위 체크"""
+        return self._check_rank('플레이스', clinic_name, keywords)
 
     def check_all_ranks(self, clinic_name, keywords, search_types=None):
         """모든 검색 유형에 대한 순위 체크"""
         if search_types is None:
-            search_types = ['블로그', '웹', '플레이스']
+            search_types = SEARCH_TYPES
         
         all_results = []
         
@@ -317,44 +339,168 @@ class SearchRankChecker:
             all_results.extend(place_results)
         
         return all_results
-    
-    def save_results(self, results):
-        """결과를 Excel 파일로 저장"""
+
+    def check_clinics_ranks(self, clinics, search_types=None, progress_callback=None, reuse=None, reused_at=None,
+                            journal=None, result_callback=None):
+        """여러 치과의 순위를 한 번에 체크
+
+        치과들이 공유하는 (키워드, 검색 유형) 쌍은 한 번만 검색하고, 같은
+        결과 페이지를 관심 있는 모든 치과에 매칭한다. 반환 순서는 치과별로
+        check_all_ranks 를 호출했을 때와 같다. 치과 정보에 'aliases' 목록이 있으면
+        별칭으로 노출된 결과도 해당 치과로 매칭한다.
+        reuse({(키워드, 검색 유형): {치과명: [결과]}}) 에 있는 쌍은 검색하지 않고 그 결과를 쓰며,
+        reused_at({(치과명, 키워드, 검색 유형): 검색 시각}) 은 save_results 가 기록 DB 에 남긴다.
+        journal(RunJournal) 을 주면 끝난 검색 결과를 바로 저널에 기록하고, 저널에 이미 있는
+        쌍은 다시 검색하지 않는다 (중단된 실행 이어하기).
+        progress_callback(완료 수, 전체 수, 키워드, 검색 유형) 로 진행 상황을 알린다.
+        result_callback(치과명, 키워드, 검색 유형, [결과]) 은 새로 검색한 결과가 나오는 즉시 호출된다.
+        """
+        if search_types is None:
+            search_types = SEARCH_TYPES
+
+        plan = build_search_plan(clinics, search_types)
+        reuse = dict(reuse or {})
+        self.reused_fetched_at = dict(reused_at or {})
+        if journal is not None:
+            done, done_at = journal.completed()
+            # 이전 결과 재사용분도 저널에 남겨 이어할 때 다시 찾지 않게 한다
+            for pair, by_clinic in reuse.items():
+                for clinic_name, results in by_clinic.items():
+                    if clinic_name not in done.get(pair, {}):
+                        journal.record(clinic_name, *pair, results, self.reused_fetched_at.get((clinic_name, *pair)))
+            resumed = {
+                pair: done[pair] for pair, interested in plan.items()
+                if pair not in reuse and all(clinic_name in done.get(pair, {}) for clinic_name in interested)
+            }
+            if resumed:
+                print(f"중단된 실행 {journal.run_id} 이어하기: 완료된 검색 {len(resumed)}건 건너뜀")
+            reuse.update(resumed)
+            self.reused_fetched_at.update(
+                {(clinic_name, *pair): done_at[(clinic_name, *pair)] for pair in resumed for clinic_name in resumed[pair]}
+            )
+        if reuse:
+            plan = {pair: interested for pair, interested in plan.items() if pair not in reuse}
+            print(f"이전 결과 재사용 {len(reuse)}건, 새로 검색 {len(plan)}건")
+        # 모든 치과명(별칭 포함)으로 한 번만 만드는 매처
+        matcher = ClinicMatcher(clinics)
+
+        def on_page(keyword, search_type, page):
+            # 검색이 끝날 때마다 관심 치과별 결과를 저널에 기록 (오류는 이어할 때 다시 검색)
+            if journal is None and result_callback is None:
+                return
+            for clinic_name in plan[(keyword, search_type)]:
+                if isinstance(page, Exception):
+                    results = [self.error_result(clinic_name, keyword, search_type, page)]
+                else:
+                    results = self.build_results(clinic_name, keyword, search_type, page)
+                    if journal is not None:
+                        journal.record(clinic_name, keyword, search_type, results)
+                if result_callback is not None:
+                    result_callback(clinic_name, keyword, search_type, results)
+
+        # 1. 고유 검색 쌍마다 한 번씩만 검색하고 한 번의 스캔으로 모든 치과 매칭
+        pages = self.fetch_plan(plan, matcher, progress_callback, on_page)
+
+        # 2. 매칭 결과를 치과별 레코드로 정리
+        all_results = []
+        for clinic_name, keyword, search_type in iter_clinic_requests(clinics, search_types):
+            if (keyword, search_type) in reuse:
+                all_results.extend(dict(result) for result in reuse[(keyword, search_type)][clinic_name])
+                continue
+            page = pages[(keyword, search_type)]
+            if isinstance(page, Exception):
+                all_results.append(self.error_result(clinic_name, keyword, search_type, page))
+            else:
+                all_results.extend(self.build_results(clinic_name, keyword, search_type, page))
+        return all_results
+
+    def fetch_plan(self, plan, matcher, progress_callback=None, page_callback=None):
+        """검색 계획의 고유 쌍을 순서대로 검색해 매칭 결과를 모음
+
+        {(키워드, 검색 유형): 매칭된 영역 목록 또는 예외} 를 반환한다.
+        page_callback(키워드, 검색 유형, 매칭 결과 또는 예외) 은 쌍마다 검색이 끝나는 즉시 호출된다.
+        """
+        pages = {}
+        total = len(plan)
+        for done, (keyword, search_type) in enumerate(plan, 1):
+            print(f"{search_type} 검색 중: {keyword} (관심 치과 {len(plan[(keyword, search_type)])}곳)")
+            try:
+                pages[(keyword, search_type)] = self.fetch_matched_pages(
+                    search_type, keyword, matcher, plan[(keyword, search_type)]
+                )
+            except CircuitOpenError:
+                # 차단이 계속되면 남은 검색을 오류로 채우지 않고 실행을 멈춘다
+                raise
+            except Exception as e:
+                print(f"{search_type} 검색 중 오류 발생: {e}")
+                pages[(keyword, search_type)] = e
+            if page_callback:
+                page_callback(keyword, search_type, pages[(keyword, search_type)])
+            if progress_callback:
+                progress_callback(done, total, keyword, search_type)
+        return pages
+
+    def save_results(self, results, clinics=None, run_id=None):
+        """결과를 순위 기록 DB 에 추가하고 결과 파일(Excel 등)로 저장
+
+        파일 형식은 OUTPUT_SETTINGS['export_format'](xlsx/csv/parquet) 를 따른다.
+        OUTPUT_SETTINGS['excel_export'] 가 False 면 기록 DB 에만 저장하고 DB 경로를 반환한다.
+        clinics 를 주면 실행 당시 치과 목록도 기록해 다음 증분 실행의 비교 기준으로 쓴다.
+        run_id 를 주면(이어한 실행 등) 새 실행 ID 대신 그 ID 로 기록하고 파일 이름에도 쓴다.
+        """
         if not results:
             print("저장할 결과가 없습니다.")
             return
         
-        # DataFrame 생성
-        df = pd.DataFrame(results)
+        now = datetime.now()
+        run_id = run_id or new_run_id(now)
         
-        # 파일명 생성
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{self.config.OUTPUT_SETTINGS['filename_prefix']}{timestamp}.xlsx"
-        filepath = os.path.join(self.config.OUTPUT_SETTINGS['output_dir'], filename)
+        # 순위 기록 DB 에 추가
+        history = RankHistory.from_config(self.config)
+        if history is not None:
+            self.last_run_id = history.append_run(
+                results, run_id=run_id, checked_at=now, clinics=clinics,
+                fetched_at=self.reused_fetched_at
+            )
+            history.close()
+            print(f"순위 기록이 추가되었습니다: {history.db_path} (실행 {self.last_run_id})")
+            if not self.config.OUTPUT_SETTINGS.get('excel_export', True):
+                return history.db_path
         
-        # Excel 파일로 저장
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            df.to_excel(writer, sheet_name='검색순위결과', index=False)
-            
-            # 워크시트 포맷팅
-            worksheet = writer.sheets['검색순위결과']
-            
-            # 열 너비 자동 조정
-            for column in worksheet.columns:
-                max_length = 0
-                column_letter = column[0].column_letter
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = min(max_length + 2, 50)
-                worksheet.column_dimensions[column_letter].width = adjusted_width
+        # 결과 파일 저장 (xlsx / csv / parquet)
+        df = pd.DataFrame(results)
+        filename = f"{self.config.OUTPUT_SETTINGS['filename_prefix']}{run_id}"
+        filepath = export_frame(
+            df,
+            os.path.join(self.config.OUTPUT_SETTINGS['output_dir'], filename),
+            self.config.OUTPUT_SETTINGS.get('export_format', 'xlsx'),
+        )
         
         print(f"결과가 저장되었습니다: {filepath}")
         return filepath
     
+    def save_metrics(self, run_id=None):
+        """단계별 소요 시간 요약을 OUTPUT_SETTINGS['metrics_dir'] 에 {실행 ID}.json 으로 저장
+
+        OUTPUT_SETTINGS['prometheus_file'] 이 있으면 같은 값을 Prometheus 텍스트 형식으로도 쓴다
+        (node_exporter textfile collector 가 읽도록 .prom 파일을 덮어쓴다). 저장한 JSON 경로를 반환한다.
+        """
+        run_id = run_id or self.last_run_id or new_run_id(self.timings.started_at)
+        for line in self.timings.report():
+            print(line)
+        path = metrics_path(self.config, run_id)
+        if path is not None:
+            self.timings.save_json(path, run_id)
+            print(f"단계별 소요 시간이 저장되었습니다: {path}")
+        prometheus_file = self.config.OUTPUT_SETTINGS.get('prometheus_file')
+        if prometheus_file:
+            self.timings.save_prometheus(prometheus_file, run_id)
+        return path
+
     def close(self):
         """리소스 정리"""
-        self.session.close() 
\ No newline at end of file
+        if self._prefetcher is not None:
+            self._prefetcher.shutdown(wait=True, cancel_futures=True)
+        self.session.close()
+        if self.cache is not None:
+            self.cache.close() 
\ No newline at end of file
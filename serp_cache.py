@@ -0,0 +1,182 @@
+# 검색 결과 페이지(SERP) 디스크 캐시
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict, namedtuple
+
+# 캐시에서 꺼낸 페이지. fresh 가 False 면 TTL 이 지나 재검증이 필요하다.
+CachedPage = namedtuple('CachedPage', ['key', 'body', 'etag', 'last_modified', 'fresh'])
+
+
+class SerpCache:
+    """(URL, 검색 유형, 검색어, 페이지) 로 주소를 매기는 SQLite 기반 SERP 캐시
+
+    본문은 zlib 으로 압축해 저장하고, TTL 이 지난 항목은 ETag/Last-Modified 로
+    조건부 재검증할 수 있도록 남겨 둔다. 페이지 본문의 해시로 파싱 결과(항목 목록)도
+    함께 저장해 같은 페이지는 다시 파싱하지 않는다. 전체 크기가 max_bytes 를 넘으면
+    가장 오래 사용하지 않은 항목부터 지운다(LRU).
+    """
+
+    # 메모리에 유지할 파싱 결과 수
+    MEMORY_PARSED_ENTRIES = 512
+
+    def __init__(self, cache_dir, ttl_seconds=3600, max_bytes=200 * 1024 * 1024):
+        os.makedirs(cache_dir, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._memory_parsed = OrderedDict()
+        self._conn = sqlite3.connect(os.path.join(cache_dir, 'serp_cache.sqlite3'), check_same_thread=False)
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS pages (
+                key TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_pages_accessed ON pages (accessed_at)')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS parsed (
+                key TEXT PRIMARY KEY,
+                sections BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_parsed_accessed ON parsed (accessed_at)')
+        self._conn.commit()
+
+    @classmethod
+    def from_config(cls, config_module):
+        """config 의 CACHE_SETTINGS 로 캐시 생성 (설정이 없거나 꺼져 있으면 None)"""
+        settings = getattr(config_module, 'CACHE_SETTINGS', None)
+        if not settings or not settings.get('enabled', True):
+            return None
+        return cls(
+            settings.get('cache_dir', os.path.join('data', 'cache')),
+            ttl_seconds=settings.get('ttl_seconds', 3600),
+            max_bytes=int(settings.get('max_size_mb', 200) * 1024 * 1024),
+        )
+
+    @staticmethod
+    def make_key(url, search_type, keyword, page=1):
+        """캐시 키 (URL, 검색 유형, 검색어, 페이지의 SHA-256)"""
+        raw = json.dumps([url, search_type, keyword, page], ensure_ascii=False)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key):
+        """캐시된 페이지 조회 (없으면 None)"""
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT body, etag, last_modified, fetched_at FROM pages WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute('UPDATE pages SET accessed_at = ? WHERE key = ?', (time.time(), key))
+            self._conn.commit()
+        body, etag, last_modified, fetched_at = row
+        fresh = time.time() - fetched_at < self.ttl_seconds
+        return CachedPage(key, zlib.decompress(body).decode('utf-8'), etag, last_modified, fresh)
+
+    def put(self, key, url, text, etag=None, last_modified=None):
+        """페이지 저장 후 용량 초과분을 LRU 로 정리"""
+        body = zlib.compress(text.encode('utf-8'))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (key, url, body, len(body), etag, last_modified, now, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    @staticmethod
+    def parsed_key(html, search_type, parser_version):
+        """파싱 결과 캐시 키 (페이지 본문 해시 + 검색 유형 + 파서 버전)"""
+        digest = hashlib.sha256(html.encode('utf-8')).hexdigest()
+        return f"{search_type}:{parser_version}:{digest}"
+
+    def get_parsed(self, key):
+        """캐시된 파싱 결과 ([(검색 영역, 항목 목록)], {검색 영역: 순위 항목 수}) 조회 (없으면 None)"""
+        with self._lock:
+            parsed = self._memory_parsed.get(key)
+            if parsed is not None:
+                self._memory_parsed.move_to_end(key)
+                return parsed
+            row = self._conn.execute('SELECT sections FROM parsed WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            self._conn.execute('UPDATE parsed SET accessed_at = ? WHERE key = ?', (time.time(), key))
+            self._conn.commit()
+            sections, ranked = json.loads(zlib.decompress(row[0]))
+            parsed = ([(area, items) for area, items in sections], ranked)
+            self._remember_parsed(key, parsed)
+            return parsed
+
+    def put_parsed(self, key, parsed):
+        """파싱 결과 (extract 의 반환값) 저장"""
+        blob = zlib.compress(json.dumps(parsed, ensure_ascii=False).encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO parsed VALUES (?, ?, ?, ?)', (key, blob, len(blob), time.time())
+            )
+            self._remember_parsed(key, parsed)
+            self._evict()
+            self._conn.commit()
+
+    def _remember_parsed(self, key, parsed):
+        """메모리 LRU 에 파싱 결과 보관 (잠금 안에서 호출)"""
+        self._memory_parsed[key] = parsed
+        self._memory_parsed.move_to_end(key)
+        while len(self._memory_parsed) > self.MEMORY_PARSED_ENTRIES:
+            self._memory_parsed.popitem(last=False)
+
+    def revalidated(self, key):
+        """304 응답으로 재검증된 항목의 TTL 갱신"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute('UPDATE pages SET fetched_at = ?, accessed_at = ? WHERE key = ?', (now, now, key))
+            self._conn.commit()
+
+    def _evict(self):
+        """전체 크기가 max_bytes 이하가 될 때까지 오래 안 쓴 항목 삭제 (잠금 안에서 호출)"""
+        total = self._conn.execute(
+            'SELECT (SELECT COALESCE(SUM(size), 0) FROM pages) + (SELECT COALESCE(SUM(size), 0) FROM parsed)'
+        ).fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute('''
+            SELECT 'pages', key, size, accessed_at FROM pages
+            UNION ALL
+            SELECT 'parsed', key, size, accessed_at FROM parsed
+            ORDER BY accessed_at
+        ''').fetchall()
+        for table, key, size, _ in rows:
+            self._conn.execute(f'DELETE FROM {table} WHERE key = ?', (key,))
+            if table == 'parsed':
+                self._memory_parsed.pop(key, None)
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        with self._lock:
+            self._conn.execute('DELETE FROM pages')
+            self._conn.execute('DELETE FROM parsed')
+            self._conn.commit()
+            self._memory_parsed.clear()
+
+    def close(self):
+        """DB 연결 종료"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,110 @@
+# 추출 명세(SERP_SPECS)대로 검색 결과 항목을 뽑는 추출 엔진
+import hashlib
+import json
+
+from html_backend import compile_selector, parse_html, parse_scoped
+from serp_specs import SERP_SPECS
+
+# (백엔드, 부분 파싱 여부)별로 선택자를 한 번만 컴파일한 추출 엔진
+_EXTRACTORS = {}
+
+
+def get_extractor(backend='html.parser', partial_parsing=True):
+    """프로세스 안에서 공유하는 추출 엔진"""
+    extractor = _EXTRACTORS.get((backend, partial_parsing))
+    if extractor is None:
+        extractor = _EXTRACTORS[(backend, partial_parsing)] = SerpExtractor(SERP_SPECS, backend, partial_parsing)
+    return extractor
+
+
+class SerpExtractor:
+    """검색 유형별 명세의 선택자를 미리 컴파일해 두고 결과 페이지에서 항목을 추출하는 엔진"""
+
+    def __init__(self, specs, backend='html.parser', partial_parsing=True):
+        self.specs = specs
+        self.backend = backend
+        self.partial_parsing = partial_parsing
+        # 명세가 바뀌면 파싱 결과 캐시가 무효화되도록 명세 내용의 해시를 둔다
+        self.fingerprint = hashlib.sha256(
+            json.dumps(specs, ensure_ascii=False, sort_keys=True).encode('utf-8')
+        ).hexdigest()[:12]
+        self._areas = {
+            (search_type, spec['search_area']): spec
+            for search_type, area_specs in specs.items()
+            for spec in area_specs
+        }
+        self._compiled = {
+            search_type: [self._compile(spec) for spec in area_specs]
+            for search_type, area_specs in specs.items()
+        }
+
+    def _compile(self, spec):
+        """영역 명세의 선택자 컴파일"""
+        compile_ = lambda selector: compile_selector(selector, self.backend)
+        return {
+            'search_area': spec['search_area'],
+            'container': compile_(spec['container']) if spec['container'] else None,
+            'omit_if_missing': spec['omit_if_missing'],
+            'items': compile_(spec['items']),
+            'ad_filters': [compile_(selector) for selector in spec['ad_filters']],
+            'fields': [(name, compile_(selector)) for name, selector in spec['fields'].items()],
+            'url_from': spec['url_from'],
+            'required_fields': spec['required_fields'],
+        }
+
+    def spec(self, search_type, search_area):
+        """검색 유형/영역의 명세"""
+        return self._areas[(search_type, search_area)]
+
+    def parse(self, search_type, html):
+        """결과 영역만(부분 파싱) 또는 전체 문서를 파싱"""
+        if self.partial_parsing:
+            targets = [spec['fragment'] for spec in self.specs[search_type] if spec.get('fragment')]
+            return parse_scoped(html, targets, self.backend)
+        return parse_html(html, self.backend)
+
+    def extract(self, search_type, html):
+        """결과 페이지에서 ([(검색 영역, 항목 목록)], {검색 영역: 순위를 매긴 항목 수}) 추출
+
+        항목은 {'rank', 필드..., 'url'} 이며, 결과 영역이 없고 omit_if_missing 인
+        영역은 제외된다. 필수 필드가 없어 빠진 항목도 순위는 차지하므로, 영역의 마지막
+        순위는 항목 목록이 아니라 순위를 매긴 항목 수로 알 수 있다.
+        """
+        return self.extract_doc(search_type, self.parse(search_type, html))
+
+    def extract_doc(self, search_type, doc):
+        """parse 로 파싱한 문서에서 extract 와 같은 (영역별 항목 목록, 영역별 순위 항목 수) 추출"""
+        sections = []
+        ranked = {}
+        for area in self._compiled[search_type]:
+            container = doc.select_one(area['container']) if area['container'] is not None else doc
+            if container is None:
+                if area['omit_if_missing']:
+                    continue
+                sections.append((area['search_area'], []))
+                ranked[area['search_area']] = 0
+                continue
+
+            items = []
+            rank = 0
+            for element in container.select(area['items']):
+                # 광고 항목은 순위에서 제외
+                if any(element.select_one(ad) is not None for ad in area['ad_filters']):
+                    continue
+
+                rank += 1
+
+                found = {name: element.select_one(selector) for name, selector in area['fields']}
+                if any(found[name] is None for name in area['required_fields']):
+                    continue
+
+                item = {'rank': rank}
+                for name, node in found.items():
+                    item[name] = node.text() if node is not None else ''
+                url_node = found[area['url_from']]
+                item['url'] = url_node.attr('href') if url_node is not None else ''
+                items.append(item)
+
+            sections.append((area['search_area'], items))
+            ranked[area['search_area']] = rank
+        return sections, ranked
@@ -0,0 +1,390 @@
+#!/usr/bin/env python3
+# 저장해 둔 네이버 검색 결과 페이지(픽스처) 모음: 기록, 합성, 정답 검증
+#
+#   python serp_fixtures.py record --type 블로그 --keyword 강남치과 --pages 2
+#   python serp_fixtures.py synth
+#   python serp_fixtures.py check
+#
+# 픽스처 폴더에는 페이지 HTML 과 manifest.json 이 있다. manifest 의 expected 는
+# 기준 파서(html.parser, 전체 파싱)로 구한 결과 레코드(순위, 제목, URL, 본문)이며, check 는
+# 모든 파서 백엔드가 같은 레코드를 내는지 확인한다 (파서/매처 최적화가 결과를 바꾸지 않았는지 오프라인 검증).
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+from datetime import datetime
+from html import escape
+from types import SimpleNamespace
+
+from html_backend import PARSER_BACKENDS
+from rank_record import RESULT_COLUMNS
+from search_rank_checker import SEARCH_TYPES, SearchRankChecker
+from serp_specs import SERP_PAGING
+
+FIXTURE_DIR = os.path.join('fixtures', 'serp')
+MANIFEST_FILE = 'manifest.json'
+
+# 픽스처 파일 이름에 쓰는 검색 유형 이름
+TYPE_SLUGS = {'블로그': 'blog', '웹': 'web', '플레이스': 'place'}
+
+# 정답을 만드는 기준 파서 (백엔드, 부분 파싱 여부)
+REFERENCE_PARSER = ('html.parser', False)
+
+# 저장된 페이지가 없을 때 돌려주는 빈 결과 페이지 (더 이어지는 결과가 없음)
+EMPTY_PAGE = '<html><body></body></html>'
+
+
+def fixture_config(parser='html.parser', partial_parsing=True, max_pages=1):
+    """픽스처로 검색할 때 쓰는 설정 (지연/캐시/미리 받기 없음)"""
+    return SimpleNamespace(
+        SEARCH_SETTINGS={
+            'delay_between_requests': 0,
+            'max_pages': max_pages,
+            'prefetch_pages': False,
+            'parser': parser,
+            'partial_parsing': partial_parsing,
+            'user_agent': 'serp-fixtures',
+        },
+        CACHE_SETTINGS={'enabled': False},
+    )
+
+
+class FixtureChecker(SearchRankChecker):
+    """네이버 대신 픽스처 페이지를 돌려주는 체커 (pages: {(검색 유형, 키워드, 페이지): HTML})"""
+
+    def __init__(self, config_module, pages):
+        super().__init__(config_module)
+        self.pages = pages
+
+    def polite_fetch_html(self, search_type, keyword, page=1):
+        """저장된 페이지 HTML (없으면 빈 결과 페이지)"""
+        return self.pages.get((search_type, keyword, page), EMPTY_PAGE)
+
+
+class FixtureCorpus:
+    """픽스처 폴더의 manifest 와 페이지 HTML"""
+
+    def __init__(self, directory=FIXTURE_DIR):
+        self.directory = directory
+        path = os.path.join(directory, MANIFEST_FILE)
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        else:
+            manifest = {}
+        self.clinics = manifest.get('clinics', [])
+        self.entries = manifest.get('pages', [])
+        self.expected = manifest.get('expected', {})
+
+    @staticmethod
+    def case_key(search_type, keyword):
+        """manifest 의 expected 키"""
+        return f"{search_type}|{keyword}"
+
+    def cases(self):
+        """(검색 유형, 키워드) 목록 (저장 순서)"""
+        return list(dict.fromkeys((entry['search_type'], entry['keyword']) for entry in self.entries))
+
+    def max_pages(self):
+        """픽스처에 저장된 가장 깊은 페이지"""
+        return max((entry['page'] for entry in self.entries), default=1)
+
+    def read(self, entry):
+        """페이지 HTML"""
+        with open(os.path.join(self.directory, entry['file']), 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def pages(self):
+        """{(검색 유형, 키워드, 페이지): HTML}"""
+        return {(entry['search_type'], entry['keyword'], entry['page']): self.read(entry) for entry in self.entries}
+
+    def add_page(self, search_type, keyword, page, html, source):
+        """페이지 HTML 저장 (같은 검색 유형/키워드/페이지가 있으면 교체)"""
+        number = self.cases().index((search_type, keyword)) + 1 if (search_type, keyword) in self.cases() \
+            else len(self.cases()) + 1
+        filename = f"{TYPE_SLUGS[search_type]}-{number:02d}-p{page}.html"
+        os.makedirs(self.directory, exist_ok=True)
+        with open(os.path.join(self.directory, filename), 'w', encoding='utf-8') as f:
+            f.write(html)
+        entry = {
+            'file': filename,
+            'search_type': search_type,
+            'keyword': keyword,
+            'page': page,
+            'source': source,
+            'recorded_at': datetime.now().isoformat(timespec='seconds'),
+        }
+        self.entries = [
+            e for e in self.entries
+            if (e['search_type'], e['keyword'], e['page']) != (search_type, keyword, page)
+        ] + [entry]
+
+    def result_records(self, search_type, keyword, parser='html.parser', partial_parsing=True, pages=None):
+        """픽스처로 검색한 결과 레코드 목록 (치과 목록 전체가 관심 치과)"""
+        config = fixture_config(parser, partial_parsing, self.max_pages())
+        checker = FixtureChecker(config, pages if pages is not None else self.pages())
+        try:
+            clinics = [{'name': name, 'keywords': [keyword]} for name in self.clinics]
+            with contextlib.redirect_stdout(io.StringIO()):
+                results = checker.check_clinics_ranks(clinics, [search_type])
+        finally:
+            checker.close()
+        return [{column: record[column] for column in RESULT_COLUMNS} for record in results]
+
+    def update_expected(self):
+        """기준 파서로 모든 경우의 정답 레코드를 다시 계산"""
+        parser, partial_parsing = REFERENCE_PARSER
+        pages = self.pages()
+        self.expected = {
+            self.case_key(search_type, keyword): self.result_records(search_type, keyword, parser, partial_parsing,
+                                                                     pages)
+            for search_type, keyword in self.cases()
+        }
+
+    def save(self):
+        """manifest.json 저장"""
+        os.makedirs(self.directory, exist_ok=True)
+        manifest = {'clinics': self.clinics, 'pages': self.entries, 'expected': self.expected}
+        with open(os.path.join(self.directory, MANIFEST_FILE), 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=1)
+            f.write('\n')
+
+
+# ---------------------------------------------------------------------------
+# 합성 픽스처: 네이버 결과 페이지와 같은 구조(serp_specs 의 선택자)에 광고, 다른
+# 검색 영역, 큰 인라인 스크립트/스타일을 섞어 실제 페이지와 비슷한 크기로 만든다.
+# ---------------------------------------------------------------------------
+
+SYNTH_CLINICS = [
+    '미소치과', '파미에치과', '연세바른치과', '서울플란트치과', '하얀이치과', '강남스마일치과',
+    '예치과', '365플러스치과', '튼튼치과', '오늘치과', '다인치과', '밝은미소치과', '새봄치과',
+    '리더스치과', '함께하는치과', '라온치과', '굿모닝치과', '메디움치과', '더블유치과', '온유치과',
+    '해맑은치과', '바른이치과', '서울대표치과', '유디치과', '제일치과', '참조은치과', '상쾌한치과',
+    '이음치과', '사랑니치과', '모아치과',
+]
+
+_WORDS = [
+    '임플란트', '교정', '스케일링', '충치', '신경치료', '사랑니', '발치', '라미네이트', '미백',
+    '잇몸', '치료', '후기', '비용', '가격', '상담', '추천', '야간진료', '주말진료', '친절한',
+    '원장님', '꼼꼼한', '설명', '예약', '주차', '강남역', '역삼역', '신논현', '진료', '검진',
+]
+
+
+def _sentence(rng, length):
+    return ' '.join(rng.choice(_WORDS) for _ in range(length))
+
+
+def _page_shell(rng, body, query):
+    """검색 결과 영역을 감싸는 머리말/다른 영역/스크립트"""
+    styles = '\n'.join(
+        f".c{n}{{margin:{n % 9}px;padding:{n % 7}px;color:#{rng.randrange(0x1000000):06x}}}" for n in range(600)
+    )
+    scripts = '\n'.join(
+        f"window.__nx_{n}=function(a,b){{return a&&b?'{_sentence(rng, 4)}':{n}}};" for n in range(500)
+    )
+    news = ''.join(
+        f'<li class="bx"><a class="link_tit" href="https://news.example/{n}">{escape(_sentence(rng, 6))}</a>'
+        f'<div class="news_dsc"><div class="api_txt_lines">{escape(_sentence(rng, 20))}</div></div></li>'
+        for n in range(10)
+    )
+    return (
+        f'<!doctype html><html lang="ko"><head><meta charset="utf-8"><title>{escape(query)} : 네이버 검색</title>'
+        f'<style>{styles}</style><script>{scripts}</script></head><body>'
+        f'<div id="header"><form><input name="query" value="{escape(query)}"></form>'
+        + ''.join(f'<a class="tab c{n}" href="#t{n}">탭{n}</a>' for n in range(12))
+        + f'</div><div id="main_pack">{body}'
+        f'<section class="sc_new sp_nnews"><ul class="list_news">{news}</ul></section>'
+        f'</div><div id="footer">' + _sentence(rng, 40) + '</div></body></html>'
+    )
+
+
+def _item_title(rng, clinic):
+    words = _sentence(rng, 3)
+    return f"{words} <mark>{escape(clinic)}</mark> 후기" if clinic else words
+
+
+def _blog_item(rng, n, clinic, popular):
+    dsc = escape(_sentence(rng, 35))
+    if clinic and rng.random() < 0.5:
+        dsc = f"{dsc} {escape(clinic)} 방문"
+    if popular:
+        return (
+            f'<li class="bx"><div class="user_box"><a class="name" href="https://blog.example/u{n}">작성자{n}</a>'
+            f'<span class="sub">{n}일 전</span></div>'
+            f'<div class="title_area"><a class="title_link" href="https://blog.example/p{n}">{_item_title(rng, clinic)}</a></div>'
+            f'<div class="dsc_area"><a class="dsc_link">{dsc}</a></div>'
+            f'<div class="thumb_area"><img src="https://img.example/{n}.jpg" alt=""></div></li>'
+        )
+    return (
+        f'<li class="bx"><div class="total_wrap"><div class="total_area">'
+        f'<a class="link_tit" href="https://blog.example/g{n}">{_item_title(rng, clinic)}</a>'
+        f'<div class="total_group"><a class="api_txt_lines total_dsc">{dsc}</a></div></div></div></li>'
+    )
+
+
+def _web_item(rng, n, clinic, ad):
+    sponsor = '<span class="api_sponsor">광고</span>' if ad else ''
+    return (
+        f'<li class="bx">{sponsor}<div class="total_wrap"><div class="total_source"><cite>www.site{n}.example</cite></div>'
+        f'<a class="link_tit" href="https://site{n}.example/">{_item_title(rng, clinic)}</a>'
+        f'<div class="total_dsc_wrap"><div class="api_txt_lines">{escape(_sentence(rng, 30))}</div></div></div></li>'
+    )
+
+
+def _place_item(rng, n, clinic, ad):
+    label = '<span class="place_ad_label_text">광고</span>' if ad else ''
+    name = clinic or f"{rng.choice(['한빛', '푸른', '서울', '강남', '바른'])}{rng.choice(['', '연합', '플러스'])}의원"
+    return (
+        f'<li class="DWs4Q">{label}<div class="LYTmB"><a class="place_bluelink" href="https://place.example/{n}">'
+        f'<span class="TYaxT">{escape(name)}</span></a><span class="KCMnt">치과</span></div>'
+        f'<div class="w32a4"><span class="Pb4bU">서울 강남구 테헤란로 {rng.randrange(1, 500)}</span>'
+        f'<span class="h69bs">리뷰 {rng.randrange(10, 900)}</span></div></li>'
+    )
+
+
+def synthesize_page(rng, search_type, keyword, page, placements):
+    """합성 결과 페이지 (placements: {항목 위치(0부터): 치과명})"""
+    size = SERP_PAGING[search_type]['page_size']
+    if search_type == '블로그':
+        body = ''
+        if page == 1:
+            popular = ''.join(_blog_item(rng, n, placements.get(('인기글', n)), True) for n in range(7))
+            body += (
+                '<section class="sc_new sp_nreview _fe_view_root _prs_ugB_bsR">'
+                f'<ul class="lst_view">{popular}</ul></section>'
+            )
+        general = ''.join(_blog_item(rng, n, placements.get(('일반', n)), False) for n in range(size))
+        body += (
+            '<section class="sc_new sp_ntotal _sp_ntotal _prs_web_gen _fe_root_web_gend">'
+            f'<ul class="lst_total">{general}</ul></section>'
+        )
+    elif search_type == '웹':
+        items = ''.join(_web_item(rng, n, placements.get(('일반', n)), n in (0, 1)) for n in range(size + 2))
+        body = f'<section class="sc_new sp_ntotal"><ul class="lst_total">{items}</ul></section>'
+    else:
+        items = ''.join(_place_item(rng, n, placements.get(('일반', n)), n in (0, 5)) for n in range(size + 2))
+        body = f'<div class="place_section"><ul class="zPw6U">{items}</ul></div>'
+    return _page_shell(rng, body, keyword)
+
+
+def synthesize(corpus, keywords=('강남치과', '임플란트 잘하는 곳'), pages=2, seed=20240101):
+    """검색 유형마다 keywords × pages 개의 합성 페이지를 만들어 corpus 에 추가
+
+    치과 목록의 앞쪽 절반만 결과에 흩어 넣어 나머지는 순위 밖이 되게 한다 (광고 항목에도 넣는다).
+    """
+    rng = random.Random(seed)
+    corpus.clinics = list(dict.fromkeys(corpus.clinics + SYNTH_CLINICS))
+    shown = SYNTH_CLINICS[:len(SYNTH_CLINICS) // 2]
+    for search_type in SEARCH_TYPES:
+        for keyword in keywords:
+            for page in range(1, pages + 1):
+                slots = [('일반', n) for n in range(SERP_PAGING[search_type]['page_size'])]
+                if search_type == '블로그' and page == 1:
+                    slots += [('인기글', n) for n in range(7)]
+                placements = dict(zip(rng.sample(slots, min(len(slots), 6)), rng.sample(shown, 6)))
+                html = synthesize_page(rng, search_type, keyword, page, placements)
+                corpus.add_page(search_type, keyword, page, html, 'synthetic')
+
+
+def record(corpus, config_module, search_type, keyword, pages):
+    """네이버에서 결과 페이지를 받아 corpus 에 추가 (config 의 치과 이름도 치과 목록에 넣는다)"""
+    checker = SearchRankChecker(config_module)
+    try:
+        for page in range(1, pages + 1):
+            html, _ = checker.fetch_html(search_type, keyword, page)
+            corpus.add_page(search_type, keyword, page, html, 'naver')
+            print(f"저장: {search_type} {keyword} {page}페이지 ({len(html):,}자)")
+    finally:
+        checker.close()
+    names = [clinic['name'] for clinic in getattr(config_module, 'DENTAL_CLINICS', [])]
+    corpus.clinics = list(dict.fromkeys(corpus.clinics + names))
+
+
+def mismatched_columns(expected, actual):
+    """두 레코드 목록에서 값이 다른 컬럼 이름 (레코드 수가 다르면 ['레코드 수'])"""
+    if expected is None or len(expected) != len(actual):
+        return ['레코드 수']
+    columns = {
+        column for want, got in zip(expected, actual) for column in RESULT_COLUMNS
+        if want.get(column) != got.get(column)
+    }
+    return [column for column in RESULT_COLUMNS if column in columns]
+
+
+def check(corpus):
+    """모든 파서 백엔드/부분 파싱 조합이 기준 파서와 같은 레코드를 내는지 검사 (틀린 조합 수 반환)
+
+    순위뿐 아니라 검색 영역, 제목, URL, 본문까지 비교한다.
+    """
+    pages = corpus.pages()
+    failures = 0
+    for backend in PARSER_BACKENDS:
+        for partial_parsing in (True, False):
+            label = f"{backend}{' (부분 파싱)' if partial_parsing else ''}"
+            try:
+                mismatched = []
+                for search_type, keyword in corpus.cases():
+                    columns = mismatched_columns(
+                        corpus.expected.get(corpus.case_key(search_type, keyword)),
+                        corpus.result_records(search_type, keyword, backend, partial_parsing, pages),
+                    )
+                    if columns:
+                        mismatched.append(f"{search_type}/{keyword} ({', '.join(columns)})")
+            except ImportError as e:
+                print(f"⏭️ {label}: 건너뜀 ({e})")
+                continue
+            if mismatched:
+                failures += 1
+                print(f"❌ {label}: " + ', '.join(mismatched))
+            else:
+                print(f"✅ {label}: {len(corpus.cases())}개 경우 일치")
+    return failures
+
+
+def parse_args(argv=None):
+    """명령행 옵션 파싱"""
+    parser = argparse.ArgumentParser(description="검색 결과 페이지 픽스처 관리")
+    parser.add_argument('--dir', default=FIXTURE_DIR, help=f"픽스처 폴더 (기본: {FIXTURE_DIR})")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    rec = commands.add_parser('record', help="네이버 결과 페이지를 받아 저장")
+    rec.add_argument('--type', required=True, choices=SEARCH_TYPES, help="검색 유형")
+    rec.add_argument('--keyword', required=True, help="검색 키워드")
+    rec.add_argument('--pages', type=int, default=1, help="저장할 페이지 수")
+
+    synth = commands.add_parser('synth', help="합성 결과 페이지 생성")
+    synth.add_argument('--keywords', default='강남치과,임플란트 잘하는 곳', help="키워드 (쉼표로 구분)")
+    synth.add_argument('--pages', type=int, default=2, help="키워드마다 만들 페이지 수")
+    synth.add_argument('--seed', type=int, default=20240101, help="난수 시드")
+
+    commands.add_parser('check', help="모든 파서 백엔드가 정답 순위를 내는지 검사")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    corpus = FixtureCorpus(args.dir)
+
+    if args.command == 'check':
+        if not corpus.entries:
+            print(f"❌ 픽스처가 없습니다: {args.dir}")
+            return 1
+        return 1 if check(corpus) else 0
+
+    if args.command == 'record':
+        import config
+        record(corpus, config, args.type, args.keyword, args.pages)
+    else:
+        keywords = [k.strip() for k in args.keywords.split(',') if k.strip()]
+        synthesize(corpus, keywords, args.pages, args.seed)
+    corpus.update_expected()
+    corpus.save()
+    print(f"✅ 픽스처 {len(corpus.entries)}페이지, 정답 {len(corpus.expected)}개 경우를 저장했습니다: {args.dir}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,99 @@
+# 검색 유형별 네이버 검색 결과 추출 명세
+#
+# 네이버가 클래스 이름을 바꾸면 코드가 아니라 이 명세만 고치면 된다.
+# 영역(search_area)마다 다음 항목을 정의한다.
+#   fragment        : 부분 파싱할 결과 영역 (태그, 클래스, exact, first_only)
+#   container       : 결과 영역 CSS 선택자 (None 이면 문서 전체)
+#   omit_if_missing : 결과 영역이 없으면 레코드를 만들지 않음
+#   items           : 결과 항목 CSS 선택자
+#   ad_filters      : 하나라도 있으면 광고로 보고 순위에서 제외하는 선택자
+#   fields          : 항목 안의 필드별 CSS 선택자 (텍스트 추출)
+#   url_from        : href 를 URL 로 쓸 필드
+#   required_fields : 없으면 항목을 건너뛰는 필드 (순위는 매김)
+#   match_fields    : 치과명을 찾을 필드
+#   content_limit   : 결과 레코드의 content 최대 길이 (None 이면 자르지 않음)
+
+SERP_SPECS = {
+    '블로그': [
+        {
+            'search_area': '인기글',
+            'fragment': ('section', 'sc_new sp_nreview _fe_view_root _prs_ugB_bsR', True, True),
+            'container': 'section[class="sc_new sp_nreview _fe_view_root _prs_ugB_bsR"]',
+            'omit_if_missing': True,
+            'items': 'ul.lst_view > li.bx',
+            'ad_filters': [],
+            'fields': {
+                'title': '.title_area a.title_link',
+                'content': '.dsc_area a.dsc_link',
+            },
+            'url_from': 'title',
+            'required_fields': ['title', 'content'],
+            'match_fields': ['title', 'content'],
+            'content_limit': 100,
+        },
+        {
+            'search_area': '일반',
+            'fragment': ('section', 'sc_new sp_ntotal _sp_ntotal _prs_web_gen _fe_root_web_gend', True, True),
+            'container': 'section[class="sc_new sp_ntotal _sp_ntotal _prs_web_gen _fe_root_web_gend"]',
+            'omit_if_missing': True,
+            'items': 'ul.lst_total > li.bx',
+            'ad_filters': [],
+            'fields': {
+                'title': 'a.link_tit',
+                'content': 'a.api_txt_lines.total_dsc',
+            },
+            'url_from': 'title',
+            'required_fields': ['title', 'content'],
+            'match_fields': ['title', 'content'],
+            'content_limit': 100,
+        },
+    ],
+    '웹': [
+        {
+            'search_area': '일반',
+            'fragment': ('section', 'sc_new sp_ntotal', False, True),
+            'container': 'section.sc_new.sp_ntotal',
+            'omit_if_missing': False,
+            'items': 'ul.lst_total > li.bx',
+            'ad_filters': ['.api_sponsor', '.btn_save'],
+            'fields': {
+                'title': 'a.link_tit',
+                'content': 'div.total_dsc_wrap .api_txt_lines',
+            },
+            'url_from': 'title',
+            'required_fields': ['title'],
+            'match_fields': ['title', 'content'],
+            'content_limit': 100,
+        },
+    ],
+    '플레이스': [
+        {
+            'search_area': '일반',
+            'fragment': ('ul', 'zPw6U', False, False),
+            'container': None,
+            'omit_if_missing': False,
+            'items': 'ul.zPw6U > li.DWs4Q',
+            'ad_filters': ['.place_ad_label_text'],
+            'fields': {
+                'title': 'div.LYTmB > a.place_bluelink',
+                # 플레이스는 본문 대신 주소로 매칭한다
+                'content': 'div.w32a4 span.Pb4bU',
+            },
+            'url_from': 'title',
+            'required_fields': [],
+            'match_fields': ['title', 'content'],
+            'content_limit': None,
+        },
+    ],
+}
+
+# 검색 유형별 페이지 넘김 방식 (SEARCH_SETTINGS['max_pages'] 까지 훑는다)
+#   page_param  : 시작 위치 쿼리 파라미터 (1, 1+page_size, 1+2*page_size, ...)
+#   page_size   : 한 페이지의 결과 수
+#   paged_areas : 다음 페이지로 이어지는 영역 (블로그 인기글은 1페이지에만 있다)
+
+SERP_PAGING = {
+    '블로그': {'page_param': 'start', 'page_size': 30, 'paged_areas': ['일반']},
+    '웹': {'page_param': 'start', 'page_size': 15, 'paged_areas': ['일반']},
+    '플레이스': {'page_param': 'start', 'page_size': 10, 'paged_areas': ['일반']},
+}
@@ -0,0 +1,178 @@
+# 검색 단계별 소요 시간 계측 (검색 유형별 합계, JSON 요약 / Prometheus 텍스트 내보내기)
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+import pandas as pd
+
+# 계측하는 단계 (보고 순서)
+STAGES = ('connect', 'download', 'decode', 'parse', 'extract', 'match', 'wait')
+
+STAGE_LABELS = {
+    'connect': '연결 (DNS/TCP/TLS)',
+    'download': '다운로드',
+    'decode': '디코딩',
+    'parse': '파싱',
+    'extract': '추출',
+    'match': '매칭',
+    'wait': '대기 (동시 요청/속도 제한/재시도)',
+}
+
+# Prometheus 지표 이름 앞부분
+METRIC_PREFIX = 'dental_search'
+
+
+class StageTimings:
+    """단계별 (횟수, 누적 시간, 바이트) 를 검색 유형별로 모으는 스레드 안전 누적기
+
+    체커 하나가 한 번의 실행을 맡으므로 체커마다 하나씩 두면 실행별 합계가 된다.
+    thread/async 엔진에서는 요청이 겹치므로 단계 시간의 합이 실행 시간보다 클 수 있다.
+    connect 는 새 연결을 맺을 때만 잡히며 download 시간 안에 포함된다.
+    """
+
+    def __init__(self):
+        self._totals = {}
+        self._lock = threading.Lock()
+        self.started_at = datetime.now()
+        self._started = time.perf_counter()
+
+    def add(self, search_type, stage, seconds=0.0, nbytes=0, count=1):
+        """단계 측정값 추가 (count=0 이면 바이트만 더한다)"""
+        with self._lock:
+            totals = self._totals.setdefault((search_type, stage), [0, 0.0, 0])
+            totals[0] += count
+            totals[1] += seconds
+            totals[2] += nbytes
+
+    @contextmanager
+    def measure(self, search_type, stage):
+        """with 블록의 실행 시간을 단계에 더함 (예외가 나도 잰다)"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(search_type, stage, time.perf_counter() - started)
+
+    def summary(self, run_id=None):
+        """JSON 으로 저장할 요약 (검색 유형별 단계 목록과 단계별 전체 합계)"""
+        with self._lock:
+            totals = dict(self._totals)
+        order = {stage: n for n, stage in enumerate(STAGES)}
+        rows = [
+            {
+                'search_type': search_type,
+                'stage': stage,
+                'count': count,
+                'seconds': round(seconds, 6),
+                'mean_ms': round(seconds / count * 1000, 3) if count else None,
+                'bytes': nbytes,
+            }
+            for (search_type, stage), (count, seconds, nbytes) in sorted(
+                totals.items(), key=lambda item: (item[0][0], order.get(item[0][1], len(order)))
+            )
+        ]
+        overall = {}
+        for row in rows:
+            stage = overall.setdefault(row['stage'], {'count': 0, 'seconds': 0.0, 'bytes': 0})
+            stage['count'] += row['count']
+            stage['seconds'] = round(stage['seconds'] + row['seconds'], 6)
+            stage['bytes'] += row['bytes']
+        return {
+            'run_id': run_id,
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'wall_s': round(time.perf_counter() - self._started, 3),
+            'stages': rows,
+            'totals': {stage: overall[stage] for stage in STAGES if stage in overall},
+        }
+
+    def save_json(self, path, run_id=None):
+        """요약을 JSON 파일로 저장하고 요약 반환"""
+        summary = self.summary(run_id)
+        _write_atomic(path, json.dumps(summary, ensure_ascii=False, indent=1))
+        return summary
+
+    def save_prometheus(self, path, run_id=None):
+        """요약을 Prometheus 텍스트 형식으로 저장 (node_exporter textfile collector 용, 마지막 실행 값)"""
+        _write_atomic(path, prometheus_text(self.summary(run_id)))
+
+    def report(self):
+        """콘솔에 출력할 단계별 요약 줄"""
+        summary = self.summary()
+        lines = [f"⏱️ 단계별 소요 시간 (실행 {summary['wall_s']:.1f}초, 동시 요청은 겹쳐서 합산)"]
+        for stage, totals in summary['totals'].items():
+            line = f"  {STAGE_LABELS[stage]}: {totals['seconds']:.2f}초 / {totals['count']}회"
+            if totals['bytes']:
+                line += f", {totals['bytes'] / 1024 / 1024:.1f}MB"
+            lines.append(line)
+        return lines
+
+
+def _write_atomic(path, text):
+    """임시 파일에 쓴 뒤 바꿔치기 (읽는 쪽이 반쯤 쓴 파일을 보지 않도록)"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(temp_path, path)
+
+
+def _label(value):
+    """Prometheus 라벨 값 이스케이프"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def prometheus_text(summary):
+    """요약을 Prometheus 텍스트 노출 형식으로 변환"""
+    metrics = [
+        ('stage_seconds_total', 'counter', "검색 단계별 누적 소요 시간(초)", 'seconds'),
+        ('stage_count_total', 'counter', "검색 단계별 측정 횟수", 'count'),
+        ('stage_bytes_total', 'counter', "검색 단계별 처리한 본문 크기(바이트)", 'bytes'),
+    ]
+    run = f'run_id="{_label(summary["run_id"] or "")}"'
+    lines = []
+    for name, kind, help_text, field in metrics:
+        rows = [row for row in summary['stages'] if field != 'bytes' or row['bytes']]
+        if not rows:
+            continue
+        lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+        lines.append(f"# TYPE {METRIC_PREFIX}_{name} {kind}")
+        for row in rows:
+            labels = f'{run},search_type="{_label(row["search_type"])}",stage="{row["stage"]}"'
+            lines.append(f"{METRIC_PREFIX}_{name}{{{labels}}} {row[field]}")
+    started = datetime.fromisoformat(summary['started_at']).timestamp()
+    lines += [
+        f"# HELP {METRIC_PREFIX}_run_wall_seconds 실행 전체 소요 시간(초)",
+        f"# TYPE {METRIC_PREFIX}_run_wall_seconds gauge",
+        f"{METRIC_PREFIX}_run_wall_seconds{{{run}}} {summary['wall_s']}",
+        f"# HELP {METRIC_PREFIX}_run_started_timestamp_seconds 실행 시작 시각(유닉스 시간)",
+        f"# TYPE {METRIC_PREFIX}_run_started_timestamp_seconds gauge",
+        f"{METRIC_PREFIX}_run_started_timestamp_seconds{{{run}}} {started:.0f}",
+    ]
+    return '\n'.join(lines) + '\n'
+
+
+def metrics_path(config_module, run_id):
+    """실행의 단계별 소요 시간 요약 JSON 경로 (OUTPUT_SETTINGS['metrics_dir'] 가 없으면 None)"""
+    metrics_dir = config_module.OUTPUT_SETTINGS.get('metrics_dir')
+    if not metrics_dir or not run_id:
+        return None
+    return os.path.join(metrics_dir, f"{run_id}.json")
+
+
+def load_metrics(config_module, run_id):
+    """저장된 실행 요약 (없으면 None)"""
+    path = metrics_path(config_module, run_id)
+    if path is None or not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def summary_frame(summary):
+    """요약의 검색 유형별 단계 목록을 표시용 DataFrame 으로 변환"""
+    df = pd.DataFrame(summary['stages'], columns=['search_type', 'stage', 'count', 'seconds', 'mean_ms', 'bytes'])
+    df['stage'] = pd.Categorical(df['stage'], categories=list(STAGES), ordered=True)
+    return df.sort_values(['search_type', 'stage'], kind='stable').reset_index(drop=True)
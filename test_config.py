@@ -14,18 +14,62 @@ DENTAL_CLINICS = [
 SEARCH_SETTINGS = {
     "max_pages": 5,  # 검색할 최대 페이지 수
     "delay_between_requests": 1,  # 요청 간 지연 시간 (초)
+    "prefetch_pages": True,  # 2페이지부터 현재 페이지를 파싱하는 동안 다음 페이지를 미리 요청
+    "freshness_hours": 24,  # 증분 실행 시 이 시간 안에 검색한 결과는 다시 검색하지 않음
+    "parser": "html.parser",  # HTML 파서: "html.parser", "lxml" 또는 "selectolax"(가장 빠름)
+    "partial_parsing": True,  # 결과 영역(<section>/<ul>)만 잘라서 파싱 (못 찾으면 전체 파싱)
+    "engine": "sync",  # 검색 엔진: "sync"(순차), "thread"(스레드 풀) 또는 "async"(asyncio)
+    "max_concurrency": 4,  # thread/async 엔진의 최대 동시 요청 수
+    "requests_per_second": 0.5,  # 호스트별 초당 요청 수 (thread/async 엔진의 토큰 버킷)
+    "burst": 2,  # 토큰 버킷에 쌓일 수 있는 최대 요청 수
+    "job_workers": 1,  # 웹 앱에서 동시에 실행할 검색 작업 수 (나머지는 대기열에서 기다림)
+    "job_heartbeat_seconds": 30,  # 실행 중인 작업의 생존 신호 간격 (3배 넘게 끊기면 멈춘 작업으로 보고 다시 실행)
+    "http_client": "requests",  # HTTP 클라이언트: "requests"(HTTP/1.1) 또는 "httpx"(HTTP/2 다중화, httpx[http2] 필요)
     "user_agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
 }
 
+# 요청 재시도 / 차단 대응 설정
+FETCH_SETTINGS = {
+    "connect_timeout": 10,  # 연결 제한 시간 (초)
+    "request_timeout": 30,  # 응답 대기 제한 시간 (초)
+    "pool_size": 10,  # 호스트별로 유지할 연결 수 (연결을 재사용해 TCP/TLS 핸드셰이크를 줄임)
+    "http2": True,  # httpx 클라이언트에서 HTTP/2 사용 (요청들을 연결 하나에 다중화)
+    "max_retries": 3,  # 요청 제한(429)/일시 오류(5xx, 네트워크)일 때 다시 요청하는 횟수
+    "backoff_base": 1.0,  # 재시도 대기 기본값 (초), 재시도마다 두 배 + 무작위 지터
+    "backoff_max": 60.0,  # 재시도 대기 최대값 (초)
+    "max_slowdown": 8.0,  # 요청 제한을 받을 때 요청 간격을 최대 몇 배까지 늘릴지
+    "breaker_threshold": 3,  # 요청 제한/차단/캡차가 연속 이만큼 나오면 요청을 멈춤
+    "breaker_cooldown": 300,  # 요청을 멈추는 시간 (초), 반복될 때마다 두 배
+    "breaker_max_trips": 3,  # 이 횟수를 넘게 멈추면 검색을 중단 (--resume 으로 이어서 실행)
+    "breaker_reset": None,  # 이 시간(초) 동안 요청 제한/차단이 없어야 멈춘 횟수를 0 으로 되돌림 (None: 가장 긴 대기 시간)
+}
+
+# 검색 결과 캐시 설정
+CACHE_SETTINGS = {
+    "enabled": True,  # 검색 결과 페이지 디스크 캐시 사용 여부
+    "cache_dir": "data/cache",  # 캐시 DB 저장 폴더
+    "ttl_seconds": 3600,  # 캐시 유효 시간 (초), 지나면 조건부 재요청
+    "max_size_mb": 200,  # 캐시 최대 크기 (MB), 넘으면 오래 안 쓴 페이지부터 삭제
+}
+
 # 결과 파일 설정
 OUTPUT_SETTINGS = {
     "output_dir": "data",
     "filename_prefix": "테스트_검색순위_",
-    "include_timestamp": True
+    "include_timestamp": True,
+    "history_db": "data/rank_history.sqlite3",  # 실행마다 결과를 추가하는 순위 기록 DB
+    "excel_export": True,  # 실행마다 결과 파일도 저장 (False 면 기록 DB 에만 저장)
+    "export_format": "xlsx",  # 결과 파일 형식: "xlsx", "csv" 또는 "parquet"
+    "checkpoint_dir": "data/runs",  # 실행 중 완료된 결과를 기록하는 체크포인트 폴더 (--resume 용)
+    "jobs_db": "data/jobs.sqlite3",  # 웹 앱의 백그라운드 검색 작업 대기열
+    "metrics_dir": "data/metrics",  # 실행마다 단계별 소요 시간 요약(JSON)을 저장하는 폴더
+    "prometheus_file": None,  # 예: "/var/lib/node_exporter/textfile/dental_search.prom" (Prometheus 텍스트 형식)
 }
 
 # 네이버 검색 설정
 NAVER_SETTINGS = {
-    "blog_search_url": "https://search.naver.com/search.naver",
-    "place_search_url": "https://search.naver.com/search.naver"
+    # 부하 시험 때는 mock_naver.py 모의 서버 주소로 바꾼다 (예: http://127.0.0.1:8800/search.naver)
+    "blog_search_url": "https://search.naver.com/search.naver",  # 블로그 검색 주소
+    "web_search_url": "https://search.naver.com/search.naver",  # 웹 검색 주소
+    "place_search_url": "https://search.naver.com/search.naver"  # 플레이스 검색 주소
 } 
\ No newline at end of file
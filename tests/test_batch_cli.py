@@ -0,0 +1,106 @@
+# 배치 CLI 테스트 (모의 네이버 서버 사용)
+import json
+import os
+
+import pandas as pd
+import pytest
+
+import batch_cli
+from mock_naver import MockNaverServer
+from rank_history import RankHistory
+from serp_fixtures import FIXTURE_DIR, FixtureCorpus
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, FIXTURE_DIR)
+
+
+def test_argument_helpers():
+    assert batch_cli.parse_types('웹, 블로그') == ['웹', '블로그']
+    with pytest.raises(ValueError):
+        batch_cli.parse_types('블로그,뉴스')
+    assert batch_cli.output_format('-') == 'ndjson'
+    assert batch_cli.output_format('out/results.JSONL') == 'ndjson'
+    assert batch_cli.output_format('results.parquet') == 'parquet'
+    with pytest.raises(ValueError):
+        batch_cli.output_format('results.txt')
+    assert batch_cli.batch_config(workers=4).SEARCH_SETTINGS['engine'] == 'thread'
+    assert batch_cli.batch_config('async', 4).SEARCH_SETTINGS['engine'] == 'async'
+
+
+def test_error_rate_counts_searches_not_records():
+    results = [
+        {'clinic_name': '미소치과', 'keyword': '임플란트', 'search_type': '블로그', 'rank': 3},
+        {'clinic_name': '미소치과', 'keyword': '임플란트', 'search_type': '블로그', 'rank': '순위 밖'},
+        {'clinic_name': '미소치과', 'keyword': '교정', 'search_type': '블로그', 'rank': '오류'},
+    ]
+    assert batch_cli.error_rate(results) == 0.5
+    assert batch_cli.error_rate([]) == 0.0
+
+
+@pytest.fixture
+def mock_run(tmp_path, monkeypatch):
+    """모의 서버로 검색하도록 설정을 바꾸고 (치과 목록 경로, 기록 DB 경로) 를 돌려준다"""
+    servers = []
+
+    def start(**options):
+        server = MockNaverServer.from_fixtures(FIXTURES, **options).start()
+        servers.append(server)
+        original = batch_cli.batch_config
+
+        def config(engine=None, workers=None):
+            settings = original(engine, workers)
+            settings.NAVER_SETTINGS = {name: server.search_url
+                                       for name in ('blog_search_url', 'web_search_url', 'place_search_url')}
+            settings.CACHE_SETTINGS = {'enabled': False}
+            settings.SEARCH_SETTINGS.update(delay_between_requests=0, requests_per_second=500, max_pages=2)
+            settings.FETCH_SETTINGS = dict(settings.FETCH_SETTINGS, backoff_base=0.01, breaker_cooldown=0.01,
+                                           breaker_max_trips=1)
+            settings.OUTPUT_SETTINGS = dict(settings.OUTPUT_SETTINGS, history_db=str(tmp_path / 'history.sqlite3'),
+                                            metrics_dir=None, prometheus_file=None)
+            return settings
+
+        monkeypatch.setattr(batch_cli, 'batch_config', config)
+        corpus = FixtureCorpus(FIXTURES)
+        keywords = list(dict.fromkeys(keyword for _, keyword in corpus.cases()))
+        clinics = tmp_path / 'clinics.json'
+        clinics.write_text(json.dumps([{'name': name, 'keywords': keywords} for name in corpus.clinics[:4]],
+                                      ensure_ascii=False), encoding='utf-8')
+        return str(clinics), str(tmp_path / 'history.sqlite3')
+
+    yield start
+    for server in servers:
+        server.stop()
+
+
+def test_run_streams_ndjson_and_appends_history(mock_run, capsys):
+    clinics, history_db = mock_run()
+    code = batch_cli.main(['run', '--clinics', clinics, '--types', '블로그,웹', '--workers', '2', '--quiet'])
+    out, err = capsys.readouterr()
+
+    assert code == batch_cli.EXIT_OK
+    records = [json.loads(line) for line in out.splitlines()]
+    assert records and {record['search_type'] for record in records} == {'블로그', '웹'}
+    assert '오류 비율 0.0%' in err
+    history = RankHistory(history_db)
+    assert len(history.load()) == len(records)
+    history.close()
+
+
+def test_run_writes_table_file(mock_run, tmp_path, capsys):
+    clinics, _ = mock_run()
+    out = tmp_path / 'results.csv'
+    code = batch_cli.main(['run', '--clinics', clinics, '--types', '플레이스', '--out', str(out), '--no-history',
+                           '--quiet'])
+
+    assert code == batch_cli.EXIT_OK
+    assert capsys.readouterr().out == ''
+    df = pd.read_csv(out)
+    assert set(df['search_type']) == {'플레이스'} and len(df) > 0
+
+
+def test_run_exit_codes(mock_run, tmp_path):
+    clinics, _ = mock_run(burst_every=60, burst_length=60)
+    assert batch_cli.main(['run', '--clinics', clinics, '--types', '블로그', '--no-history', '--quiet',
+                           '--out', str(tmp_path / 'blocked.jsonl')]) == batch_cli.EXIT_BLOCKED
+    assert batch_cli.main(['run', '--clinics', str(tmp_path / 'missing.json'), '--quiet']) == \
+        batch_cli.EXIT_SETUP_ERROR
@@ -0,0 +1,48 @@
+# 오프라인 벤치마크 지표와 기준값 비교 테스트
+import json
+import os
+
+import benchmark
+from benchmark import DEFAULT_THRESHOLD, EXIT_OK, EXIT_REGRESSION, bench_search_type, main
+from serp_fixtures import FIXTURE_DIR, FixtureCorpus
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, FIXTURE_DIR)
+
+
+def test_checks_count_every_clinic_keyword_pair():
+    corpus = FixtureCorpus(FIXTURES)
+    keywords = [keyword for search_type, keyword in corpus.cases() if search_type == '블로그']
+    measured = bench_search_type(corpus, corpus.pages(), '블로그', 'html.parser', True, 1)
+
+    assert measured['checks'] == len(keywords) * len(corpus.clinics)
+    assert measured['checks_per_sec'] == measured['checks'] / (measured['check_ms'] / 1000)
+
+
+def test_compare_uses_saved_threshold(tmp_path, monkeypatch):
+    measured = {'pages_per_sec': 100.0, 'checks_per_sec': 1000.0}
+    monkeypatch.setattr(benchmark, 'run_benchmark', lambda *args: {'html.parser/블로그': dict(measured)})
+    monkeypatch.setattr(benchmark, 'print_report', lambda results, baseline: None)
+    baseline = tmp_path / 'baseline.json'
+    args = ['--fixtures', FIXTURES, '--backends', 'html.parser', '--baseline', str(baseline)]
+    assert main(args + ['--save-baseline']) == EXIT_OK
+    assert json.loads(baseline.read_text(encoding='utf-8'))['threshold'] == DEFAULT_THRESHOLD
+
+    # 처리량이 기준값보다 30% 떨어짐: 저장된 허용폭(35%) 안이면 통과, 더 좁은 --threshold 면 실패
+    measured['pages_per_sec'] = 70.0
+    assert main(args) == EXIT_OK
+    assert main(args + ['--threshold', '0.2']) == EXIT_REGRESSION
+
+    saved = json.loads(baseline.read_text(encoding='utf-8'))
+    saved['threshold'] = 0.1
+    baseline.write_text(json.dumps(saved), encoding='utf-8')
+    assert main(args) == EXIT_REGRESSION
+
+
+def test_committed_baseline_covers_fixture_types():
+    with open(os.path.join(ROOT, 'data', 'benchmark_baseline.json'), 'r', encoding='utf-8') as f:
+        saved = json.load(f)
+    search_types = {search_type for search_type, _ in FixtureCorpus(FIXTURES).cases()}
+
+    assert 0 < saved['threshold'] < 1
+    assert {f"html.parser/{search_type}" for search_type in search_types} <= set(saved['results'])
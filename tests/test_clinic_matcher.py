@@ -0,0 +1,63 @@
+# Aho-Corasick 치과명 매처 테스트
+import contextlib
+import io
+import os
+
+from clinic_matcher import ClinicMatcher
+from serp_fixtures import FIXTURE_DIR, FixtureChecker, FixtureCorpus, fixture_config
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_find_names_and_aliases():
+    matcher = ClinicMatcher(['미소치과', {'name': '서울플란트치과', 'aliases': ['서울플란트']}])
+    assert matcher.find('강남 미소치과 후기') == {'미소치과'}
+    assert matcher.find('서울플란트 방문') == {'서울플란트치과'}
+    assert matcher.find('미소치과와 서울플란트치과 비교') == {'미소치과', '서울플란트치과'}
+    assert matcher.find('미소 치과') == set()
+
+
+def test_overlapping_names():
+    # 한 이름이 다른 이름의 일부여도 둘 다 찾는다 (실패 링크의 출력 합치기)
+    matcher = ClinicMatcher(['예치과', '강남예치과', '치과'])
+    assert matcher.find('강남예치과') == {'예치과', '강남예치과', '치과'}
+    assert matcher.find('강남예') == set()
+
+
+def test_first_matches_keeps_first_item_per_clinic():
+    matcher = ClinicMatcher(['미소치과', '하얀이치과'])
+    items = [
+        {'rank': 1, 'title': '임플란트 후기', 'content': '미소치과 방문'},
+        {'rank': 2, 'title': '미소치과 두 번째', 'content': ''},
+        {'rank': 3, 'title': '하얀이치과', 'content': ''},
+    ]
+    matches = matcher.first_matches(items)
+    assert {name: item['rank'] for name, item in matches.items()} == {'미소치과': 1, '하얀이치과': 3}
+    assert matcher.first_matches(items, fields=('title',))['미소치과']['rank'] == 2
+
+
+def test_fields_are_not_joined_into_a_match():
+    # 제목 끝과 본문 앞이 이어져 이름이 되지 않는다
+    matcher = ClinicMatcher(['미소치과'])
+    assert matcher.first_matches([{'title': '미소', 'content': '치과'}]) == {}
+
+
+def test_roster_matcher_finds_clinics_by_alias():
+    # 여러 치과 실행은 치과 목록 전체(별칭 포함)로 만든 매처 하나로 각 페이지를 한 번씩 매칭한다
+    corpus = FixtureCorpus(os.path.join(ROOT, FIXTURE_DIR))
+    checker = FixtureChecker(fixture_config(max_pages=corpus.max_pages()), corpus.pages())
+    keywords = ['강남치과']
+    clinics = [
+        {'name': '미소치과 본점', 'aliases': ['미소치과'], 'keywords': keywords},
+        {'name': '파미에치과', 'keywords': keywords},
+    ]
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = checker.check_clinics_ranks(clinics, ['블로그'])
+        by_name = checker.check_blog_rank('미소치과', keywords)
+    checker.close()
+
+    aliased = [r for r in results if r['clinic_name'] == '미소치과 본점']
+    assert [(r['search_area'], r['rank'], r['url']) for r in aliased] == \
+        [(r['search_area'], r['rank'], r['url']) for r in by_name]
+    assert any(isinstance(r['rank'], int) for r in aliased)
+    assert {r['clinic_name'] for r in results} == {'미소치과 본점', '파미에치과'}
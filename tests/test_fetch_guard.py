@@ -0,0 +1,67 @@
+# FetchGuard 서킷 브레이커 테스트
+import threading
+import time
+
+import pytest
+
+from fetch_guard import CircuitOpenError, FetchError, FetchGuard, ResponseKind
+
+PAGE = '<html>' + 'x' * 60_000 + '</html>'
+
+
+def burst_server(every, length):
+    """every 초마다 length 초 동안 429 를 돌려주는 가짜 요청 함수"""
+    started = time.monotonic()
+
+    def request():
+        time.sleep(0.002)
+        if (time.monotonic() - started) % every < length:
+            return 429, '', {}
+        return 200, PAGE, {}
+    return request
+
+
+def test_repeated_bursts_abort_under_concurrent_requests():
+    # 차단 구간 사이에 정상 응답이 섞여 와도 멈춘 횟수가 쌓여 실행을 멈춰야 한다
+    guard = FetchGuard(max_retries=1, backoff_base=0.001, breaker_threshold=3,
+                       breaker_cooldown=0.02, breaker_max_trips=3)
+    request = burst_server(every=0.1, length=0.03)
+    aborted = []
+    deadline = time.monotonic() + 5
+
+    def worker():
+        while time.monotonic() < deadline:
+            try:
+                guard.call('http://example.test/', request)
+            except CircuitOpenError:
+                aborted.append(True)
+                return
+            except FetchError:
+                pass
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(aborted) == len(threads)
+
+
+def test_ok_inside_reset_window_keeps_trips():
+    guard = FetchGuard(breaker_threshold=1, breaker_cooldown=0.01, breaker_max_trips=1, breaker_reset=0.5)
+    guard.record(ResponseKind.THROTTLED)
+    time.sleep(0.02)
+    guard.record(ResponseKind.OK)
+    time.sleep(0.03)
+    guard.record(ResponseKind.THROTTLED)
+    with pytest.raises(CircuitOpenError):
+        guard.pause()
+
+
+def test_trips_reset_after_quiet_period():
+    guard = FetchGuard(breaker_threshold=1, breaker_cooldown=0.01, breaker_max_trips=1, breaker_reset=0.05)
+    guard.record(ResponseKind.THROTTLED)
+    time.sleep(0.08)
+    guard.record(ResponseKind.OK)
+    guard.record(ResponseKind.THROTTLED)
+    assert guard.pause() > 0
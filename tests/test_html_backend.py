@@ -0,0 +1,44 @@
+# 결과 영역 원문 조각 찾기 테스트
+from html_backend import find_elements, parse_scoped
+
+SECTION = '<section class="sc_new sp_ntotal"><ul><li>결과</li></ul></section>'
+
+
+def test_find_elements_matches_classes():
+    html = f'<div>{SECTION}<section class="sc_new">다른 영역</section></div>'
+    assert find_elements(html, 'section', 'sp_ntotal') == [SECTION]
+    assert find_elements(html, 'section', 'sc_new', exact=True) == ['<section class="sc_new">다른 영역</section>']
+    assert find_elements(html, 'section', 'sc_new', first_only=False) == [
+        SECTION, '<section class="sc_new">다른 영역</section>'
+    ]
+    assert find_elements(html, 'section', 'sp_nreview') == []
+
+
+def test_find_elements_nested_and_unclosed():
+    nested = '<div class="a"><div class="b">안</div>밖</div>'
+    assert find_elements(f'<body>{nested}</body>', 'div', 'a') == [nested]
+    assert find_elements('<div class="a"><div>안</div>', 'div', 'a') is None
+
+
+def test_find_elements_skips_script_and_comment_bodies():
+    html = (
+        '<html><head><script>var t = \'<section class="sc_new sp_ntotal">가짜</section>\';'
+        'document.write("</section>");</script>'
+        '<!-- <section class="sc_new sp_ntotal">주석</section> --></head>'
+        f'<body>{SECTION}</body></html>'
+    )
+    assert find_elements(html, 'section', 'sp_ntotal') == [SECTION]
+
+    # 영역 안의 스크립트 문자열에 있는 닫는 태그는 짝으로 세지 않는다
+    inner = '<section class="sp_ntotal"><script>s = "</section>";</script><ul><li>결과</li></ul></section>'
+    assert find_elements(f'<body>{inner}</body>', 'section', 'sp_ntotal') == [inner]
+
+
+def test_find_elements_unclosed_comment_hides_rest():
+    assert find_elements(f'<body><!-- {SECTION}</body>', 'section', 'sp_ntotal') == []
+
+
+def test_parse_scoped_falls_back_to_full_document():
+    html = f'<body><p class="x">본문</p>{SECTION}</body>'
+    assert parse_scoped(html, [('section', 'sp_ntotal', False, True)]).select_one('p') is None
+    assert parse_scoped(html, [('section', 'sp_nreview', False, True)]).select_one('p').text() == '본문'
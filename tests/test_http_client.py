@@ -0,0 +1,57 @@
+# Accept-Encoding 에 넣은 압축 방식을 각 백엔드가 실제로 푸는지 테스트
+import gzip
+import io
+import zlib
+
+import pytest
+
+from http_client import accept_encoding
+
+BODY = '<html>검색 결과</html>'.encode('utf-8') * 100
+
+
+def compress(encoding, data):
+    if encoding == 'gzip':
+        return gzip.compress(data)
+    if encoding == 'deflate':
+        return zlib.compress(data)
+    if encoding == 'br':
+        # 백엔드가 brotlicffi 로 br 을 풀 수도 있으니 압축도 있는 쪽으로
+        try:
+            import brotli
+        except ImportError:
+            brotli = pytest.importorskip('brotlicffi')
+        return brotli.compress(data)
+    # zstd 는 압축 모듈이 없으면(디코더만 있는 환경) 건너뛴다
+    try:
+        from compression import zstd
+        return zstd.compress(data)
+    except ImportError:
+        zstandard = pytest.importorskip('zstandard')
+        return zstandard.ZstdCompressor().compress(data)
+
+
+def advertised(backend):
+    return accept_encoding(backend).split(', ')
+
+
+def test_gzip_is_always_advertised():
+    for backend in ('requests', 'httpx'):
+        assert advertised(backend)[:2] == ['gzip', 'deflate']
+
+
+@pytest.mark.parametrize('encoding', advertised('requests'))
+def test_requests_decodes_advertised_encoding(encoding):
+    from urllib3.response import HTTPResponse
+    response = HTTPResponse(body=io.BytesIO(compress(encoding, BODY)), headers={'Content-Encoding': encoding},
+                            preload_content=False)
+    assert response.read(decode_content=True) == BODY
+
+
+def test_httpx_decodes_advertised_encodings():
+    httpx = pytest.importorskip('httpx')
+    for encoding in advertised('httpx'):
+        def handler(request, encoding=encoding):
+            return httpx.Response(200, content=compress(encoding, BODY), headers={'Content-Encoding': encoding})
+        with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+            assert client.get('http://example.test/').content == BODY
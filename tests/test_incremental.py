@@ -0,0 +1,74 @@
+# 증분 실행(최근 결과 재사용) 테스트
+import contextlib
+import io
+from datetime import datetime, timedelta
+
+from incremental import check_clinics_incremental, find_reusable
+from rank_history import RankHistory
+from rank_record import RankStatus
+from serp_fixtures import FixtureChecker, fixture_config
+
+NOW = datetime(2024, 5, 2, 9, 0, 0)
+
+
+def record(clinic, keyword, rank, search_type='블로그'):
+    return {'clinic_name': clinic, 'keyword': keyword, 'search_type': search_type, 'search_area': '일반',
+            'rank': rank, 'title': '', 'url': '', 'content': ''}
+
+
+def history_with(tmp_path, results, checked_at, clinics):
+    history = RankHistory(str(tmp_path / 'history.sqlite3'))
+    history.append_run(results, checked_at=checked_at, clinics=clinics)
+    return history
+
+
+def test_fresh_error_free_pairs_are_reused(tmp_path):
+    clinics = [{'name': '미소치과', 'keywords': ['임플란트', '교정']}, {'name': '하얀이치과', 'keywords': ['임플란트']}]
+    checked_at = NOW - timedelta(hours=2)
+    history = history_with(tmp_path, [
+        record('미소치과', '임플란트', 3), record('하얀이치과', '임플란트', RankStatus.NOT_FOUND.value),
+        record('미소치과', '교정', RankStatus.ERROR.value),
+    ], checked_at, clinics)
+
+    reuse, reused_at = find_reusable(history, clinics, ['블로그'], freshness_hours=24, now=NOW)
+    history.close()
+
+    # 오류로 끝난 쌍은 다시 검색한다
+    assert list(reuse) == [('임플란트', '블로그')]
+    assert reuse[('임플란트', '블로그')]['미소치과'][0]['rank'] == 3
+    assert reused_at == {('미소치과', '임플란트', '블로그'): checked_at, ('하얀이치과', '임플란트', '블로그'): checked_at}
+
+
+def test_stale_new_and_changed_clinics_are_searched_again(tmp_path):
+    previous = [{'name': '미소치과', 'keywords': ['임플란트']}]
+    history = history_with(tmp_path, [record('미소치과', '임플란트', 3)], NOW - timedelta(hours=2), previous)
+
+    assert find_reusable(history, previous, ['블로그'], freshness_hours=1, now=NOW) == ({}, {})
+    # 같은 쌍에 관심 있는 새 치과가 생기면 그 쌍 전체를 다시 검색한다
+    added = previous + [{'name': '하얀이치과', 'keywords': ['임플란트']}]
+    assert find_reusable(history, added, ['블로그'], freshness_hours=24, now=NOW) == ({}, {})
+    # 별칭이 바뀌면 매칭 결과가 달라질 수 있다
+    aliased = [{'name': '미소치과', 'aliases': ['미소'], 'keywords': ['임플란트']}]
+    assert find_reusable(history, aliased, ['블로그'], freshness_hours=24, now=NOW) == ({}, {})
+    history.close()
+
+
+def test_incremental_run_fetches_only_missing_pairs(tmp_path):
+    clinics = [{'name': '미소치과', 'keywords': ['임플란트', '교정']}]
+    history = history_with(tmp_path, [record('미소치과', '임플란트', 3)], datetime.now() - timedelta(hours=1), clinics)
+    requested = []
+
+    class Checker(FixtureChecker):
+        def polite_fetch_html(self, search_type, keyword, page=1):
+            requested.append((search_type, keyword))
+            return super().polite_fetch_html(search_type, keyword, page)
+
+    checker = Checker(fixture_config(), {})
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = check_clinics_incremental(checker, history, clinics, ['블로그'])
+    checker.close()
+    history.close()
+
+    assert requested == [('블로그', '교정')]
+    assert [r for r in results if r['keyword'] == '임플란트'] == [record('미소치과', '임플란트', 3)]
+    assert ('미소치과', '임플란트', '블로그') in checker.reused_fetched_at
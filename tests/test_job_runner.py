@@ -0,0 +1,98 @@
+# 백그라운드 작업 큐 테스트
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+
+from job_runner import QUEUED, RUNNING, SCHEMA, JobRunner, JobStore
+from serp_fixtures import fixture_config
+from threaded_search_rank_checker import ThreadedSearchRankChecker
+
+
+def make_store(tmp_path):
+    return JobStore(str(tmp_path / 'jobs.sqlite3'))
+
+
+def set_heartbeat(store, job_id, seconds_ago):
+    at = (datetime.now() - timedelta(seconds=seconds_ago)).isoformat(timespec='seconds')
+    with store._conn:
+        store._conn.execute('UPDATE jobs SET heartbeat_at = ? WHERE job_id = ?', (at, job_id))
+
+
+def test_claim_in_submit_order(tmp_path):
+    store = make_store(tmp_path)
+    first = store.submit({'n': 1})
+    second = store.submit({'n': 2})
+    assert store.queue_position(second) == 1
+    job = store.claim_next('owner-a')
+    assert (job['job_id'], job['params']) == (first, {'n': 1})
+    assert store.get(first)['status'] == RUNNING and store.get(first)['owner'] == 'owner-a'
+
+
+def test_requeue_only_stale_running_jobs(tmp_path):
+    store = make_store(tmp_path)
+    live, stale, queued = store.submit({}), store.submit({}), store.submit({})
+    store.claim_next('live-runner')
+    store.claim_next('dead-runner')
+    set_heartbeat(store, stale, 600)
+
+    assert store.requeue_interrupted(90) == 1
+    assert [store.get(job_id)['status'] for job_id in (live, stale, queued)] == [RUNNING, QUEUED, QUEUED]
+    assert store.get(stale)['owner'] is None
+
+    # 살아 있는 러너의 생존 신호는 자기 작업만 갱신한다
+    set_heartbeat(store, live, 600)
+    store.heartbeat('live-runner')
+    assert store.requeue_interrupted(90) == 0
+
+
+def test_old_database_gets_heartbeat_columns(tmp_path):
+    path = str(tmp_path / 'jobs.sqlite3')
+    conn = sqlite3.connect(path)
+    conn.executescript(SCHEMA.replace(',\n    owner TEXT,\n    heartbeat_at TEXT', ''))
+    conn.execute("INSERT INTO jobs (job_id, status, created_at, params) VALUES ('old', 'running', '2020-01-01', '{}')")
+    conn.commit()
+    conn.close()
+
+    store = JobStore(path)
+    assert store.get('old')['heartbeat_at'] is None
+    # 생존 시각이 없는 이전 작업은 멈춘 것으로 본다
+    assert store.requeue_interrupted(90) == 1
+
+
+class LockedStore:
+    """처음 몇 번은 database is locked 로 실패하는 대기열"""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.claims = 0
+        self.recovered = threading.Event()
+
+    def claim_next(self, owner=None):
+        self.claims += 1
+        if self.claims <= self.failures:
+            raise sqlite3.OperationalError('database is locked')
+        self.recovered.set()
+        return None
+
+
+def test_worker_survives_locked_database():
+    store = LockedStore(failures=2)
+    runner = JobRunner(fixture_config(), store=store, poll_interval=0.01)
+    worker = threading.Thread(target=runner._work)
+    worker.start()
+    try:
+        assert store.recovered.wait(5)
+        assert worker.is_alive()
+    finally:
+        runner._stop.set()
+        worker.join()
+
+
+def test_delay_sets_token_bucket_rate():
+    checker = ThreadedSearchRankChecker(fixture_config())
+    try:
+        checker.set_delay(4)
+        assert checker.delay == 4
+        assert checker.rate_limiter.rate == 0.25
+    finally:
+        checker.close()
@@ -0,0 +1,30 @@
+# 모의 네이버 서버 테스트
+import os
+import socket
+import struct
+import time
+import urllib.request
+
+from mock_naver import MockNaverServer
+from serp_fixtures import FIXTURE_DIR
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_client_disconnect_is_not_logged(capsys):
+    server = MockNaverServer.from_fixtures(os.path.join(ROOT, FIXTURE_DIR), latency_ms=50).start()
+    try:
+        host, port = server.httpd.server_address[:2]
+        for _ in range(3):
+            client = socket.create_connection((host, port))
+            client.sendall(b'GET /search.naver?where=blog&query=test HTTP/1.1\r\nHost: x\r\n\r\n')
+            # 응답을 기다리지 않고 RST 로 바로 끊는다
+            client.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack('ii', 1, 0))
+            client.close()
+        time.sleep(0.3)
+
+        with urllib.request.urlopen(f"{server.search_url}?where=blog&query=test") as response:
+            assert response.status == 200
+    finally:
+        server.stop()
+    assert 'Traceback' not in capsys.readouterr().err
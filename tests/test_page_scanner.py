@@ -0,0 +1,93 @@
+# 여러 페이지 순위 합치기 테스트
+import contextlib
+import io
+import os
+
+from page_scanner import PageScan
+from rank_record import RankStatus
+from serp_fixtures import FIXTURE_DIR, FixtureChecker, FixtureCorpus, fixture_config
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def item(rank, title):
+    return {'rank': rank, 'title': title}
+
+
+def test_next_page_offset_counts_ranked_items():
+    scan = PageScan(['일반'], ['가나치과', '다라치과'], max_pages=3)
+    # 1페이지: 10개 항목에 순위를 매겼고, 마지막 항목은 필수 필드가 없어 목록에서 빠졌다
+    scan.add_page([('일반', {'가나치과': item(2, '가나치과')})], {'일반': 10})
+    assert scan.needs_next_page()
+
+    scan.add_page([('일반', {'다라치과': item(4, '다라치과')})], {'일반': 10})
+    assert dict(scan.matched)['일반'] == {'가나치과': item(2, '가나치과'), '다라치과': item(14, '다라치과')}
+    assert not scan.needs_next_page()
+
+
+def test_first_page_match_is_kept():
+    scan = PageScan(['일반'], ['가나치과', '다라치과'], max_pages=3)
+    scan.add_page([('일반', {'가나치과': item(5, '가나치과')})], {'일반': 10})
+    scan.add_page([('일반', {'가나치과': item(1, '가나치과')})], {'일반': 10})
+    assert dict(scan.matched)['일반']['가나치과']['rank'] == 5
+
+
+def test_page_with_only_dropped_items_is_not_exhausted():
+    scan = PageScan(['일반'], ['가나치과'], max_pages=3)
+    # 모든 항목이 목록에서 빠졌어도 순위를 매긴 항목이 있으면 다음 페이지가 있다
+    scan.add_page([('일반', {})], {'일반': 10})
+    assert scan.needs_next_page()
+
+    scan.add_page([('일반', {})], {'일반': 0})
+    assert not scan.needs_next_page()
+
+
+def test_unpaged_area_and_max_pages():
+    scan = PageScan(['일반'], ['가나치과'], max_pages=1)
+    scan.add_page([('인기글', {}), ('일반', {})], {'인기글': 7, '일반': 10})
+    assert not scan.needs_next_page()
+
+    scan = PageScan(['일반'], ['가나치과'], max_pages=2)
+    scan.add_page([('인기글', {}), ('일반', {'가나치과': item(1, '가나치과')})], {'인기글': 7, '일반': 10})
+    assert not scan.needs_next_page()
+
+
+class CountingChecker(FixtureChecker):
+    """요청한 페이지 번호를 세는 픽스처 체커"""
+
+    def __init__(self, config_module, pages):
+        super().__init__(config_module, pages)
+        self.requested = []
+
+    def polite_fetch_html(self, search_type, keyword, page=1):
+        self.requested.append(page)
+        return super().polite_fetch_html(search_type, keyword, page)
+
+
+def blog_general_rank(clinic_name, max_pages, prefetch=False):
+    """픽스처 '강남치과' 블로그 검색의 일반 영역 순위와 요청한 페이지 번호"""
+    corpus = FixtureCorpus(os.path.join(ROOT, FIXTURE_DIR))
+    config = fixture_config(max_pages=max_pages)
+    config.SEARCH_SETTINGS['prefetch_pages'] = prefetch
+    checker = CountingChecker(config, corpus.pages())
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = checker.check_blog_rank(clinic_name, ['강남치과'])
+    checker.close()
+    rank = next(r['rank'] for r in results if r['search_area'] == '일반')
+    return rank, sorted(checker.requested)
+
+
+def test_checker_stops_once_clinic_is_found():
+    # 1페이지에 있으면 max_pages 가 남아도 다음 페이지를 요청하지 않는다
+    assert blog_general_rank('튼튼치과', max_pages=2) == (9, [1])
+
+
+def test_checker_continues_to_next_page_with_offset_rank():
+    # 1페이지 일반 영역 30건 뒤 2페이지 6번째
+    assert blog_general_rank('다인치과', max_pages=2) == (36, [1, 2])
+    assert blog_general_rank('다인치과', max_pages=1) == (RankStatus.NOT_FOUND.value, [1])
+
+
+def test_prefetch_gives_same_ranks():
+    assert blog_general_rank('다인치과', max_pages=3, prefetch=True)[0] == 36
+    assert blog_general_rank('모아치과', max_pages=3, prefetch=True) == (RankStatus.NOT_FOUND.value, [1, 2, 3])
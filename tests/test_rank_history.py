@@ -0,0 +1,55 @@
+# 순위 기록 DB 테스트
+from datetime import datetime, timedelta
+
+from rank_history import RankHistory
+from rank_record import RankStatus
+
+
+def record(clinic, keyword, rank, search_type='블로그'):
+    return {'clinic_name': clinic, 'keyword': keyword, 'search_type': search_type, 'search_area': '일반',
+            'rank': rank, 'title': '', 'url': '', 'content': ''}
+
+
+def test_append_and_query(tmp_path):
+    history = RankHistory(str(tmp_path / 'history.sqlite3'))
+    first = datetime(2024, 5, 1, 9, 0, 0)
+    history.append_run([record('A치과', '임플란트', 3), record('B치과', '임플란트', RankStatus.NOT_FOUND.value)],
+                       run_id='run1', checked_at=first, clinics=[{'name': 'A치과'}, {'name': 'B치과'}])
+    history.append_run([record('A치과', '임플란트', 1)], run_id='run2',
+                       checked_at=first + timedelta(days=1), clinics=[{'name': 'A치과'}])
+
+    assert list(history.list_runs()['run_id']) == ['run2', 'run1']
+    assert history.last_roster() == [{'name': 'A치과'}]
+
+    latest = history.latest_results().set_index('clinic_name')
+    assert latest.loc['A치과', 'run_id'] == 'run2'
+    assert latest.loc['A치과', 'rank'] == 1
+    assert latest.loc['B치과', 'status'] == RankStatus.NOT_FOUND.value
+    assert len(history.latest_results(since=first + timedelta(hours=1))) == 1
+
+    assert list(history.load(clinic_name='A치과')['rank']) == [3, 1]
+    history.close()
+
+
+def test_runs_in_same_second_get_distinct_ids(tmp_path):
+    history = RankHistory(str(tmp_path / 'history.sqlite3'))
+    checked_at = datetime(2024, 5, 1, 9, 0, 0)
+    first = history.append_run([record('A치과', '임플란트', 3)], checked_at=checked_at)
+    second = history.append_run([record('A치과', '임플란트', 4)], checked_at=checked_at)
+
+    assert first != second
+    assert len(history.list_runs()) == 2
+    assert len(history.load()) == 2
+    history.close()
+
+
+def test_same_run_id_replaces_ranks(tmp_path):
+    history = RankHistory(str(tmp_path / 'history.sqlite3'))
+    results = [record('A치과', '임플란트', 3), record('A치과', '교정', 5)]
+    history.append_run(results, run_id='run1')
+    history.append_run(results, run_id='run1')
+
+    runs = history.list_runs()
+    assert list(runs['result_count']) == [2]
+    assert len(history.load(run_id='run1')) == 2
+    history.close()
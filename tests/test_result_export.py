@@ -0,0 +1,34 @@
+# 결과 파일 저장 → 읽기 왕복 테스트
+import pandas as pd
+import pytest
+
+from rank_record import RankStatus, frame_to_dicts, normalize_frame
+from result_export import EXPORT_FORMATS, export_frame, read_result_file
+
+RESULTS = [
+    {'clinic_name': '가나치과', 'keyword': '강남 임플란트', 'search_type': '블로그', 'search_area': '블로그',
+     'rank': 3, 'title': '제목', 'url': 'https://blog.naver.com/a/1', 'content': '본문'},
+    {'clinic_name': '가나치과', 'keyword': '강남 임플란트', 'search_type': '웹', 'search_area': '웹문서',
+     'rank': RankStatus.NOT_FOUND.value, 'title': '', 'url': '', 'content': ''},
+    {'clinic_name': '다라치과', 'keyword': '강남 임플란트', 'search_type': '플레이스', 'search_area': '플레이스',
+     'rank': RankStatus.ERROR.value, 'title': '', 'url': '', 'content': '연결 실패'},
+]
+
+
+@pytest.mark.parametrize('export_format', EXPORT_FORMATS)
+def test_round_trip_keeps_status(tmp_path, export_format):
+    filepath = export_frame(pd.DataFrame(RESULTS), str(tmp_path / 'result'), export_format)
+
+    df = read_result_file(filepath)
+    assert list(df['status']) == [s.value for s in (RankStatus.FOUND, RankStatus.NOT_FOUND, RankStatus.ERROR)]
+    assert frame_to_dicts(df) == RESULTS
+
+    # 두 번째 읽기는 parquet 사이드카(또는 parquet 원본)를 거친다
+    assert frame_to_dicts(read_result_file(filepath)) == RESULTS
+
+
+def test_normalize_frame_keeps_existing_status():
+    df = normalize_frame(pd.DataFrame(RESULTS))
+    again = normalize_frame(df)
+    assert again['status'].tolist() == df['status'].tolist()
+    assert again['rank'].tolist() == df['rank'].tolist()
@@ -0,0 +1,44 @@
+# 검색 중 결과 누적기 테스트
+from rank_record import RankStatus, frame_to_dicts, rank_summary, records_to_frame
+from result_stream import ResultStream
+
+
+def record(n, rank):
+    return {'clinic_name': f'치과{n % 3}', 'keyword': f'키워드{n}', 'search_type': '블로그', 'search_area': '일반',
+            'rank': rank, 'title': '', 'url': '', 'content': ''}
+
+
+RECORDS = [record(n, [n + 1, RankStatus.NOT_FOUND.value, RankStatus.ERROR.value][n % 3]) for n in range(25)]
+
+
+def test_chunks_match_one_frame():
+    stream = ResultStream()
+    for start in range(0, len(RECORDS), 4):
+        stream.extend(RECORDS[start:start + 4], last_id=start + 4)
+
+    assert stream.last_id == 28
+    assert stream.rows == len(RECORDS)
+    assert stream.summary() == rank_summary(records_to_frame(RECORDS))
+    assert frame_to_dicts(stream.frame) == RECORDS
+    # 추가가 없으면 이어 붙인 표를 다시 쓴다
+    assert stream.frame is stream.frame
+
+
+def test_tail_uses_last_rows_only():
+    stream = ResultStream()
+    for start in range(0, len(RECORDS), 4):
+        stream.extend(RECORDS[start:start + 4])
+    assert frame_to_dicts(stream.tail(6)) == RECORDS[-6:]
+    assert frame_to_dicts(stream.tail(100)) == RECORDS
+    assert stream._frame is None
+
+    stream.extend(RECORDS[:2])
+    assert frame_to_dicts(stream.frame) == RECORDS + RECORDS[:2]
+
+
+def test_empty_stream():
+    stream = ResultStream()
+    stream.extend([], last_id=3)
+    assert stream.last_id == 3
+    assert stream.summary()['avg_rank'] is None
+    assert stream.frame.empty and stream.tail(5).empty
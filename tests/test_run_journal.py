@@ -0,0 +1,85 @@
+# 체크포인트 저널로 중단된 실행 이어하기 테스트
+import contextlib
+import io
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from run_journal import RunJournal
+from serp_fixtures import FIXTURE_DIR, FixtureChecker, FixtureCorpus, fixture_config
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def journal_config(tmp_path):
+    return SimpleNamespace(OUTPUT_SETTINGS={'checkpoint_dir': str(tmp_path / 'runs')})
+
+
+def test_resume_reads_completed_entries_and_skips_partial_line(tmp_path):
+    config = journal_config(tmp_path)
+    journal = RunJournal.from_config(config)
+    results = [{'clinic_name': '미소치과', 'keyword': '임플란트', 'search_type': '블로그', 'rank': 3}]
+    journal.record('미소치과', '임플란트', '블로그', results)
+    journal.close()
+    # 기록 중에 중단돼 끝나지 않은 줄
+    with open(journal.path, 'a', encoding='utf-8') as f:
+        f.write('{"clinic_name": "하얀')
+
+    assert RunJournal.list_unfinished(config) == [journal.run_id]
+    assert RunJournal.resume(config, 'missing') is None
+    resumed = RunJournal.resume(config, journal.run_id)
+    done, fetched_at = resumed.completed()
+    assert done == {('임플란트', '블로그'): {'미소치과': results}}
+    assert set(fetched_at) == {('미소치과', '임플란트', '블로그')}
+
+    resumed.finish()
+    assert RunJournal.list_unfinished(config) == []
+
+
+class InterruptingChecker(FixtureChecker):
+    """fail_after 번째 검색에서 중단되는 픽스처 체커 (요청한 쌍을 기록)"""
+
+    def __init__(self, config_module, pages, fail_after=None):
+        super().__init__(config_module, pages)
+        self.fail_after = fail_after
+        self.requested = []
+
+    def polite_fetch_html(self, search_type, keyword, page=1):
+        if page == 1:
+            if len(self.requested) == self.fail_after:
+                raise KeyboardInterrupt
+            self.requested.append((keyword, search_type))
+        return super().polite_fetch_html(search_type, keyword, page)
+
+
+def test_interrupted_run_resumes_remaining_pairs(tmp_path):
+    corpus = FixtureCorpus(os.path.join(ROOT, FIXTURE_DIR))
+    keywords = list(dict.fromkeys(keyword for _, keyword in corpus.cases()))
+    clinics = [{'name': name, 'keywords': keywords} for name in corpus.clinics[:3]]
+    search_config = fixture_config(max_pages=corpus.max_pages())
+    config = journal_config(tmp_path)
+
+    journal = RunJournal.from_config(config)
+    first = InterruptingChecker(search_config, corpus.pages(), fail_after=2)
+    with contextlib.redirect_stdout(io.StringIO()), pytest.raises(KeyboardInterrupt):
+        first.check_clinics_ranks(clinics, journal=journal)
+    first.close()
+    journal.close()
+
+    journal = RunJournal.resume(config, journal.run_id)
+    second = InterruptingChecker(search_config, corpus.pages())
+    uninterrupted = InterruptingChecker(search_config, corpus.pages())
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = second.check_clinics_ranks(clinics, journal=journal)
+        expected = uninterrupted.check_clinics_ranks(clinics)
+    second.close()
+    uninterrupted.close()
+    journal.finish()
+
+    assert results == expected
+    # 중단 전에 끝난 두 쌍은 다시 검색하지 않는다
+    assert second.requested == uninterrupted.requested[2:]
+    assert set(second.reused_fetched_at) == {
+        (clinic['name'], *pair) for clinic in clinics for pair in first.requested
+    }
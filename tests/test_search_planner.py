@@ -0,0 +1,59 @@
+# 여러 치과 검색 계획(공유 검색 쌍 한 번만 검색) 테스트
+import contextlib
+import io
+import os
+
+from search_planner import build_search_plan, iter_clinic_requests
+from serp_fixtures import FIXTURE_DIR, FixtureChecker, FixtureCorpus, fixture_config
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_shared_pairs_are_planned_once_in_first_seen_order():
+    clinics = [
+        {'name': '미소치과', 'keywords': ['임플란트', '강남치과']},
+        {'name': '하얀이치과', 'keywords': ['강남치과', '교정']},
+        {'name': '미소치과', 'keywords': ['임플란트']},
+    ]
+    plan = build_search_plan(clinics, ['플레이스', '블로그'])
+
+    assert list(plan) == [
+        ('임플란트', '블로그'), ('강남치과', '블로그'), ('임플란트', '플레이스'), ('강남치과', '플레이스'),
+        ('교정', '블로그'), ('교정', '플레이스'),
+    ]
+    assert plan[('강남치과', '블로그')] == ['미소치과', '하얀이치과']
+    # 같은 치과가 두 번 나와도 관심 치과에는 한 번만
+    assert plan[('임플란트', '블로그')] == ['미소치과']
+    assert len(list(iter_clinic_requests(clinics, ['블로그']))) == 5
+
+
+class CountingChecker(FixtureChecker):
+    """요청한 (검색 유형, 키워드, 페이지) 를 세는 픽스처 체커"""
+
+    def __init__(self, config_module, pages):
+        super().__init__(config_module, pages)
+        self.requested = []
+
+    def polite_fetch_html(self, search_type, keyword, page=1):
+        self.requested.append((search_type, keyword, page))
+        return super().polite_fetch_html(search_type, keyword, page)
+
+
+def test_multi_clinic_run_fetches_each_pair_once_and_matches_per_clinic_checks():
+    corpus = FixtureCorpus(os.path.join(ROOT, FIXTURE_DIR))
+    keywords = list(dict.fromkeys(keyword for _, keyword in corpus.cases()))
+    clinics = [{'name': name, 'keywords': keywords} for name in corpus.clinics[:5]]
+    config = fixture_config(max_pages=corpus.max_pages())
+
+    shared = CountingChecker(config, corpus.pages())
+    single = CountingChecker(config, corpus.pages())
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = shared.check_clinics_ranks(clinics)
+        expected = [record for clinic in clinics for record in single.check_all_ranks(clinic['name'], keywords)]
+    shared.close()
+    single.close()
+
+    assert results == expected
+    assert len(shared.requested) == len(set(shared.requested))
+    assert {(search_type, keyword) for search_type, keyword, _ in shared.requested} == set(corpus.cases())
+    assert len(single.requested) > len(shared.requested)
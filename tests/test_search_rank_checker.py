@@ -0,0 +1,60 @@
+# 동기 SearchRankChecker 검색 흐름 테스트
+import pytest
+
+from fetch_guard import CircuitOpenError
+from search_rank_checker import SearchRankChecker
+from threaded_search_rank_checker import ThreadedSearchRankChecker
+from serp_fixtures import fixture_config
+
+
+class Response:
+    def __init__(self, status_code, text=''):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode('utf-8')
+        self.headers = {}
+
+
+def throttled_checker():
+    """모든 요청에 429 를 받는 체커와 요청 URL 목록"""
+    config = fixture_config()
+    config.FETCH_SETTINGS = {'max_retries': 0, 'breaker_threshold': 1, 'breaker_cooldown': 0,
+                             'breaker_max_trips': 1}
+    checker = SearchRankChecker(config)
+    calls = []
+
+    def get(url, **kwargs):
+        calls.append(url)
+        return Response(429)
+
+    checker.session.get = get
+    return checker, calls
+
+
+@pytest.mark.parametrize('method', ['check_blog_rank', 'check_web_rank', 'check_place_rank', 'check_all_ranks'])
+def test_circuit_open_stops_sync_check(method):
+    checker, calls = throttled_checker()
+    keywords = [f'키워드{n}' for n in range(10)]
+    try:
+        with pytest.raises(CircuitOpenError):
+            getattr(checker, method)('미소치과', keywords)
+    finally:
+        checker.close()
+    # 서킷이 열린 뒤 남은 키워드는 요청하지 않는다
+    assert len(calls) == 2
+
+
+def wait_count(checker):
+    return checker.timings.summary()['totals'].get('wait', {}).get('count', 0)
+
+
+@pytest.mark.parametrize('engine, waits', [(SearchRankChecker, 0), (ThreadedSearchRankChecker, 1)])
+def test_wait_recorded_only_when_engine_throttles(engine, waits):
+    checker = engine(fixture_config())
+    checker.cache = None
+    checker.download = lambda url, headers=None, on_connect=None: Response(200, '<html></html>')
+    try:
+        checker.fetch_html('블로그', '임플란트')
+    finally:
+        checker.close()
+    assert wait_count(checker) == waits
@@ -0,0 +1,97 @@
+# SERP 디스크 캐시(TTL, 조건부 재검증, LRU 정리) 테스트
+import zlib
+
+import pytest
+
+import serp_cache
+from search_rank_checker import SearchRankChecker
+from serp_cache import SerpCache
+from serp_fixtures import fixture_config
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(serp_cache.time, 'time', clock)
+    return clock
+
+
+def page(n):
+    # 압축해도 크기가 거의 같도록 페이지마다 다른 숫자 나열
+    return ''.join(str(n * 7919 + i * i) for i in range(200))
+
+
+def test_ttl_expiry_and_revalidation(tmp_path, clock):
+    cache = SerpCache(str(tmp_path), ttl_seconds=60)
+    key = cache.make_key('https://search.example/?q=a', '블로그', 'a')
+    cache.put(key, 'https://search.example/?q=a', '<html>a</html>', etag='"v1"', last_modified='Wed, 01 May 2024')
+
+    cached = cache.get(key)
+    assert cached.fresh and cached.body == '<html>a</html>' and cached.etag == '"v1"'
+
+    clock.now += 61
+    assert not cache.get(key).fresh
+    cache.revalidated(key)
+    assert cache.get(key).fresh
+    assert cache.get(cache.make_key('https://search.example/?q=a', '블로그', 'a', page=2)) is None
+    cache.close()
+
+
+def test_lru_evicts_least_recently_used(tmp_path, clock):
+    size = max(len(zlib.compress(page(n).encode('utf-8'))) for n in range(4))
+    cache = SerpCache(str(tmp_path), max_bytes=size * 3)
+    keys = [cache.make_key(f'https://search.example/?q={n}', '웹', str(n)) for n in range(4)]
+    for n in range(3):
+        clock.now += 1
+        cache.put(keys[n], f'https://search.example/?q={n}', page(n))
+
+    # 가장 먼저 넣은 항목을 다시 읽으면 두 번째 항목이 가장 오래 안 쓴 항목이 된다
+    clock.now += 1
+    assert cache.get(keys[0]) is not None
+    clock.now += 1
+    cache.put(keys[3], 'https://search.example/?q=3', page(3))
+
+    assert cache.get(keys[1]) is None
+    assert all(cache.get(keys[n]) is not None for n in (0, 2, 3))
+    cache.close()
+
+
+class Response:
+    def __init__(self, status_code, text='', headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode('utf-8')
+        self.headers = headers or {}
+
+
+def test_checker_revalidates_stale_page_with_etag(tmp_path, clock):
+    config = fixture_config()
+    config.CACHE_SETTINGS = {'enabled': True, 'cache_dir': str(tmp_path), 'ttl_seconds': 60}
+    checker = SearchRankChecker(config)
+    sent = []
+    responses = [Response(200, '<html>처음</html>', {'ETag': '"v1"'}), Response(304)]
+
+    def download(url, headers=None, on_connect=None):
+        sent.append(headers)
+        return responses.pop(0)
+
+    checker.download = download
+    try:
+        assert checker.fetch_html('블로그', '임플란트') == ('<html>처음</html>', True)
+        # TTL 안에서는 요청하지 않는다
+        assert checker.fetch_html('블로그', '임플란트') == ('<html>처음</html>', False)
+        clock.now += 61
+        assert checker.fetch_html('블로그', '임플란트') == ('<html>처음</html>', True)
+        # 304 로 재검증한 뒤에는 다시 신선하다
+        assert checker.fetch_html('블로그', '임플란트') == ('<html>처음</html>', False)
+    finally:
+        checker.close()
+    assert sent == [{}, {'If-None-Match': '"v1"'}]
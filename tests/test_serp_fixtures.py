@@ -0,0 +1,12 @@
+# 저장된 픽스처로 모든 파서 백엔드의 결과 레코드를 비교
+import os
+
+from serp_fixtures import FIXTURE_DIR, FixtureCorpus, check
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_all_backends_match_expected_records():
+    corpus = FixtureCorpus(os.path.join(ROOT, FIXTURE_DIR))
+    assert corpus.entries
+    assert check(corpus) == 0
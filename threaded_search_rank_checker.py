@@ -0,0 +1,106 @@
+# 스레드 풀 기반 동시 요청 검색 순위 체커
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from search_rank_checker import SearchRankChecker
+from rate_limiter import HostRateLimiter
+from fetch_guard import CircuitOpenError
+from http_client import create_session
+
+
+class ThreadedSearchRankChecker(SearchRankChecker):
+    """검색 유형(블로그/웹/플레이스)과 치과별 검색을 스레드 풀에서 동시에 실행하는 체커
+
+    requests 백엔드는 워커마다 세션을 하나씩 쓰고, httpx 백엔드는 HTTP/2 연결 하나에
+    모든 워커의 요청을 다중화하도록 세션을 공유한다. 모든 워커가 호스트별 토큰 버킷
+    하나를 공유한다. 결과는 완료 순서와 관계없이 check_all_ranks 순서로 정리된다.
+    """
+
+    def __init__(self, config_module):
+        super().__init__(config_module)
+        self.max_workers = self.config.SEARCH_SETTINGS.get('max_concurrency', 4)
+        self.rate_limiter = HostRateLimiter.from_settings(self.config.SEARCH_SETTINGS)
+        self._local = threading.local()
+        self._worker_sessions = []
+        self._sessions_lock = threading.Lock()
+
+    def worker_session(self):
+        """현재 워커 스레드의 세션 (처음 호출 시 생성, httpx 는 공유 세션)"""
+        if self.http_backend == 'httpx':
+            return self.session
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = create_session(self.http_backend, self.config, dict(self.session.headers))
+            self._local.session = session
+            with self._sessions_lock:
+                self._worker_sessions.append(session)
+        return session
+
+    def set_delay(self, delay):
+        """요청 간 지연을 같은 평균 속도의 호스트별 토큰 버킷으로 적용 (이 엔진은 고정 지연을 쓰지 않는다)"""
+        super().set_delay(delay)
+        self.rate_limiter = HostRateLimiter(1 / max(delay, 0.001), self.rate_limiter.burst)
+
+    def throttle(self, search_type, url):
+        """호스트별 토큰 버킷 대기 (요청 제한을 받으면 버킷도 느려짐)"""
+        with self.timings.measure(search_type, 'wait'):
+            self.rate_limiter.acquire(url, self.guard.slowdown)
+
+    def download(self, url, headers=None, on_connect=None):
+        """워커 세션으로 HTTP GET 요청"""
+        return self.timed_get(self.worker_session(), url, headers, on_connect)
+
+    def polite_fetch_html(self, search_type, keyword, page=1):
+        """검색 결과 HTML 을 가져옴 (고정 지연 대신 throttle 의 토큰 버킷 대기)"""
+        html, _ = self.fetch_html(search_type, keyword, page)
+        return html
+
+    def check_all_ranks(self, clinic_name, keywords, search_types=None):
+        """모든 검색 유형에 대한 순위 체크 (검색 유형과 키워드를 동시에 요청)"""
+        clinic = {'name': clinic_name, 'keywords': keywords}
+        return self.check_clinics_ranks([clinic], search_types)
+
+    def fetch_plan(self, plan, matcher, progress_callback=None, page_callback=None):
+        """검색 계획의 고유 쌍을 스레드 풀에서 동시에 검색해 매칭 결과를 모음"""
+        pages = {}
+        total = len(plan)
+
+        def fetch_one(keyword, search_type):
+            print(f"{search_type} 검색 중: {keyword} (관심 치과 {len(plan[(keyword, search_type)])}곳)")
+            return self.fetch_matched_pages(search_type, keyword, matcher, plan[(keyword, search_type)])
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(fetch_one, keyword, search_type): (keyword, search_type)
+                for keyword, search_type in plan
+            }
+            # 콜백은 호출한 스레드에서만 실행된다
+            try:
+                for done, future in enumerate(as_completed(futures), 1):
+                    keyword, search_type = futures[future]
+                    try:
+                        pages[(keyword, search_type)] = future.result()
+                    except CircuitOpenError:
+                        raise
+                    except Exception as e:
+                        print(f"{search_type} 검색 중 오류 발생: {e}")
+                        pages[(keyword, search_type)] = e
+                    if page_callback:
+                        page_callback(keyword, search_type, pages[(keyword, search_type)])
+                    if progress_callback:
+                        progress_callback(done, total, keyword, search_type)
+            except BaseException:
+                # 차단 중단, 콜백 예외, 인터럽트면 아직 시작하지 않은 검색을 취소하고 빠져나간다
+                for pending in futures:
+                    pending.cancel()
+                raise
+
+        return pages
+
+    def close(self):
+        """리소스 정리"""
+        with self._sessions_lock:
+            for session in self._worker_sessions:
+                session.close()
+            self._worker_sessions = []
+        super().close()
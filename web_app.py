@@ -1,10 +1,19 @@
 import streamlit as st
 import pandas as pd
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 import json
-from search_rank_checker import SearchRankChecker
+from checker_factory import create_checker
+from search_rank_checker import SEARCH_TYPES
+from rank_record import RankStatus, rank_summary, records_to_frame
+from result_export import list_result_files, read_result_file
+from rank_history import RankHistory
+from rank_trends import prepare_series, rank_pivot, rolling_rank, series_stats, top_n_events
+from run_journal import RunJournal
+from job_runner import JobRunner, QUEUED, RUNNING, DONE, FAILED, ACTIVE_STATUSES
+from result_stream import ResultStream
+from stage_timings import STAGE_LABELS, load_metrics, summary_frame
 import config
 
 # 페이지 설정
@@ -15,11 +24,21 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# 작업 상태 표시 이름
+JOB_STATUS_LABELS = {QUEUED: '대기 중', RUNNING: '실행 중', DONE: '완료', FAILED: '실패'}
+
 # 웹 배포를 위한 설정
-def get_search_checker():
-    """검색 체커를 생성"""
+@st.cache_resource
+def create_job_runner():
+    """모든 세션이 공유하는 백그라운드 검색 작업 실행기 (프로세스당 하나)"""
+    # 설정이 잘못됐으면 작업을 받기 전에 알 수 있도록 체커를 한 번 만들어 본다
+    create_checker(config).close()
+    return JobRunner.from_config(config).start()
+
+def get_job_runner():
+    """작업 실행기 가져오기"""
     try:
-        return SearchRankChecker(config)
+        return create_job_runner()
     except Exception as e:
         st.error(f"검색 체커 초기화 오류: {e}")
         return None
@@ -177,7 +196,7 @@ def main():
     # 메뉴 선택
     menu = st.sidebar.selectbox(
         "메뉴 선택",
-        ["🔍 검색 실행", "🏥 치과 관리", "📊 이전 결과"]
+        ["🔍 검색 실행", "🏥 치과 관리", "📊 이전 결과", "📈 순위 추이"]
     )
     
     if menu == "🔍 검색 실행":
@@ -186,6 +205,8 @@ def main():
         clinic_management()
     elif menu == "📊 이전 결과":
         show_previous_results()
+    elif menu == "📈 순위 추이":
+        show_rank_trends()
 
 def search_page():
     """검색 페이지"""
@@ -195,13 +216,31 @@ def search_page():
         
         # 검색 설정
         st.subheader("검색 설정")
-        delay = st.slider("요청 간 지연시간 (초)", 1, 5, 2)
+        delay = st.slider("요청 간 지연시간 (초)", 1, 5, 2,
+                          help="thread/async 엔진에서는 호스트별 평균 요청 간격(초당 1/지연 건)으로 적용됩니다.")
+        incremental = st.checkbox(
+            "바뀐 부분만 검색 (증분)",
+            value=False,
+            help=f"최근 {config.SEARCH_SETTINGS.get('freshness_hours', 24)}시간 안에 검색한 결과는 다시 검색하지 않고 재사용합니다."
+        )
+        # 대기열에서 실행 중인 작업의 저널은 제외
+        runner = get_job_runner()
+        active = {job['job_id'] for job in runner.store.list_jobs() if job['status'] in ACTIVE_STATUSES} if runner else set()
+        unfinished = [run_id for run_id in RunJournal.list_unfinished(config) if run_id not in active]
+        resume_run_id = None
+        if unfinished:
+            resume_choice = st.selectbox(
+                "중단된 실행 이어하기",
+                ["새로 검색"] + unfinished,
+                help="중단된 실행에서 이미 끝난 검색은 건너뛰고 남은 검색만 합니다."
+            )
+            resume_run_id = None if resume_choice == "새로 검색" else resume_choice
         
         # 검색 유형 선택
         st.subheader("🔍 검색 유형")
         search_types = st.multiselect(
             "검색할 유형 선택 (복수 선택 가능)",
-            ["블로그", "웹", "플레이스"],
+            SEARCH_TYPES,
             default=["블로그"]  # 기본값: 블로그만
         )
         
@@ -227,10 +266,10 @@ def search_page():
         # 실행 버튼
         st.markdown("---")
         if st.button("🚀 검색 시작", type="primary", use_container_width=True):
-            st.session_state.run_search = True
-            st.session_state.delay = delay
-            st.session_state.selected_clinics = selected_clinics if clinics else []
-            st.session_state.search_types = search_types
+            job_id = submit_search_job(delay, selected_clinics if clinics else [], search_types,
+                                       incremental, resume_run_id)
+            if job_id is not None:
+                st.session_state.job_id = job_id
     
     # 메인 영역
     col1, col2 = st.columns([2, 1])
@@ -238,53 +277,143 @@ def search_page():
     with col1:
         st.header("📊 검색 결과")
         
-        # 검색 실행
-        if 'run_search' in st.session_state and st.session_state.run_search:
-            run_search_process(st.session_state.delay, st.session_state.selected_clinics, st.session_state.search_types)
-            st.session_state.run_search = False
+        # 검색은 백그라운드 작업으로 돌고 여기서는 진행 상황만 표시
+        job_active = False
+        if 'job_id' in st.session_state:
+            job_active = show_search_job(st.session_state.job_id)
+        show_recent_jobs()
     
     with col2:
         st.header("📈 통계")
         show_statistics()
+    
+    # 작업이 끝날 때까지 1초마다 다시 그려 진행 상황 갱신
+    if job_active:
+        time.sleep(1)
+        st.rerun()
+
+# 이전 결과 표 한 페이지에 보여줄 행 수
+RESULT_PAGE_SIZE = 500
+
+@st.cache_data(show_spinner=False, max_entries=20)
+def load_result_file(file_path, mtime):
+    """결과 파일을 타입이 붙은 표로 읽기 (경로 + 수정 시각별로 캐시)"""
+    return read_result_file(file_path)
+
+@st.cache_data(show_spinner=False, max_entries=5)
+def result_file_csv(file_path, mtime):
+    """다운로드용 CSV (다시 그릴 때마다 만들지 않도록 캐시)"""
+    return load_result_file(file_path, mtime).to_csv(index=False)
+
+@st.cache_data(show_spinner=False, max_entries=50)
+def load_history_run(history_db, run_id):
+    """기록 DB 의 실행 하나 읽기 (실행 결과는 추가만 되므로 실행 ID 별로 캐시)"""
+    history = RankHistory(history_db)
+    try:
+        return history.load(run_id=run_id)
+    finally:
+        history.close()
+
+@st.cache_data(show_spinner=False, max_entries=5)
+def history_run_csv(history_db, run_id):
+    """기록 DB 실행 하나의 다운로드용 CSV (다시 그릴 때마다 만들지 않도록 캐시)"""
+    return load_history_run(history_db, run_id).to_csv(index=False)
+
+@st.cache_data(show_spinner=False)
+def load_history_runs(history_db, mtime):
+    """기록 DB 의 실행 목록 (DB 수정 시각별로 캐시)"""
+    history = RankHistory(history_db)
+    try:
+        return history.list_runs()
+    finally:
+        history.close()
+
+def show_result_page(df, key):
+    """요약 통계와 결과 표를 페이지 단위로 표시"""
+    # 통계 정보
+    summary = rank_summary(df)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("총 결과", summary['total'])
+    with col2:
+        st.metric("순위 내 결과", summary['found'])
+    with col3:
+        if summary['total'] > 0:
+            avg_rank = summary['avg_rank']
+            st.metric("평균 순위", f"{avg_rank:.1f}" if not pd.isna(avg_rank) else "N/A")
+    
+    # 결과 테이블 (큰 파일은 한 페이지씩만 화면에 보낸다)
+    pages = max(1, -(-len(df) // RESULT_PAGE_SIZE))
+    page = 1
+    if pages > 1:
+        page = st.number_input(f"페이지 (전체 {pages})", min_value=1, max_value=pages, value=1, key=f"{key}_page")
+    start = (page - 1) * RESULT_PAGE_SIZE
+    st.dataframe(df.iloc[start:start + RESULT_PAGE_SIZE], use_container_width=True)
+
+def history_db_path():
+    """순위 기록 DB 경로 (아직 기록이 없으면 None)"""
+    history_db = config.OUTPUT_SETTINGS.get(
+        'history_db', os.path.join(config.OUTPUT_SETTINGS['output_dir'], 'rank_history.sqlite3')
+    )
+    if not history_db or not os.path.exists(history_db):
+        return None
+    return history_db
+
+def show_history_runs():
+    """순위 기록 DB 의 실행별 결과 보기"""
+    history_db = history_db_path()
+    if history_db is None:
+        st.info("저장된 순위 기록이 없습니다.")
+        return
+    
+    runs = load_history_runs(history_db, os.path.getmtime(history_db))
+    if runs.empty:
+        st.info("저장된 순위 기록이 없습니다.")
+        return
+    
+    labels = {row.run_id: f"{row.checked_at} ({row.result_count}건)" for row in runs.itertuples()}
+    run_id = st.selectbox("실행 선택", list(labels), format_func=labels.get)
+    df = load_history_run(history_db, run_id)
+    
+    st.subheader(f"📋 {labels[run_id]}")
+    show_result_page(df, f"history_{run_id}")
+    
+    # 다운로드 버튼
+    st.download_button(
+        label="📄 CSV 다운로드",
+        data=history_run_csv(history_db, run_id),
+        file_name=f"{config.OUTPUT_SETTINGS['filename_prefix']}{run_id}.csv",
+        mime="text/csv"
+    )
 
 def show_previous_results():
     """이전 결과 보기"""
     st.header("📊 이전 검색 결과")
     
-    # data 폴더에서 Excel 파일 찾기
-    if os.path.exists('data'):
-        excel_files = [f for f in os.listdir('data') if f.endswith('.xlsx')]
-        excel_files.sort(reverse=True)  # 최신 파일부터
+    source = st.radio("결과 보기", ["🗄️ 순위 기록", "📄 결과 파일"], horizontal=True)
+    if source == "🗄️ 순위 기록":
+        show_history_runs()
+        return
+    
+    # 결과 폴더에서 결과 파일(xlsx/csv/parquet) 찾기
+    output_dir = config.OUTPUT_SETTINGS['output_dir']
+    if os.path.exists(output_dir):
+        result_files = list_result_files(output_dir)  # 최신 파일부터
         
-        if excel_files:
-            selected_file = st.selectbox("결과 파일 선택", excel_files)
+        if result_files:
+            selected_file = st.selectbox("결과 파일 선택", result_files)
             if selected_file:
-                file_path = os.path.join('data', selected_file)
+                file_path = os.path.join(output_dir, selected_file)
                 try:
-                    df = pd.read_excel(file_path)
+                    df = load_result_file(file_path, os.path.getmtime(file_path))
                     st.subheader(f"📋 {selected_file}")
-                    
-                    # 통계 정보
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("총 결과", len(df))
-                    with col2:
-                        found_results = len(df[df['rank'] != '순위 밖'])
-                        st.metric("순위 내 결과", found_results)
-                    with col3:
-                        if len(df) > 0:
-                            avg_rank = df[df['rank'].apply(lambda x: isinstance(x, int))]['rank'].mean()
-                            st.metric("평균 순위", f"{avg_rank:.1f}" if not pd.isna(avg_rank) else "N/A")
-                    
-                    # 결과 테이블
-                    st.dataframe(df, use_container_width=True)
+                    show_result_page(df, f"file_{selected_file}")
                     
                     # 다운로드 버튼
-                    csv = df.to_csv(index=False)
                     st.download_button(
                         label="📄 CSV 다운로드",
-                        data=csv,
-                        file_name=selected_file.replace('.xlsx', '.csv'),
+                        data=result_file_csv(file_path, os.path.getmtime(file_path)),
+                        file_name=os.path.splitext(selected_file)[0] + '.csv',
                         mime="text/csv"
                     )
                     
@@ -295,125 +424,229 @@ def show_previous_results():
     else:
         st.info("결과 폴더가 없습니다.")
 
-def run_search_process(delay, selected_clinic_names=None, search_types=None):
-    """검색 프로세스 실행"""
+# 추이 화면의 시계열 요약 표 컬럼 이름
+TREND_STAT_LABELS = {
+    'clinic_name': '치과', 'keyword': '키워드', 'search_type': '검색 유형', 'search_area': '영역',
+    'checks': '검색 수', 'found_ratio': '노출 비율', 'best_rank': '최고', 'worst_rank': '최저',
+    'median_rank': '중앙값', 'volatility': '변동성', 'latest_rank': '최근 순위', 'latest_change': '직전 대비',
+}
+
+@st.cache_data(show_spinner="순위 기록을 불러오는 중...", max_entries=8)
+def load_trend_series(history_db, mtime, since):
+    """추이 분석용 시계열 (DB 수정 시각과 시작일별로 캐시)"""
+    history = RankHistory(history_db)
+    try:
+        return prepare_series(history.load_series(since=since))
+    finally:
+        history.close()
+
+def show_rank_trends():
+    """여러 실행에 걸친 치과/키워드/검색 유형별 순위 추이"""
+    st.header("📈 순위 추이")
+    
+    history_db = history_db_path()
+    if history_db is None:
+        st.info("저장된 순위 기록이 없습니다.")
+        return
+    
+    # 기간과 필터
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        days = st.selectbox("기간", [30, 90, 180, 365], index=1, format_func=lambda d: f"최근 {d}일")
+    with col2:
+        top_n = st.number_input("상위 N위 기준", min_value=1, max_value=100, value=10)
+    with col3:
+        window = st.slider("이동 중앙값 (검색 횟수)", 1, 30, 7)
+    
+    since = (datetime.now() - timedelta(days=days)).date().isoformat()
+    df = load_trend_series(history_db, os.path.getmtime(history_db), since)
+    if df.empty:
+        st.info("선택한 기간에 순위 기록이 없습니다.")
+        return
+    
+    clinic_names = sorted(df['clinic_name'].unique())
+    search_types = sorted(df['search_type'].unique())
+    selected_clinics = st.multiselect("치과", clinic_names, default=clinic_names[:10])
+    selected_types = st.multiselect("검색 유형", search_types, default=search_types)
+    df = df[df['clinic_name'].isin(selected_clinics) & df['search_type'].isin(selected_types)]
+    if df.empty:
+        st.info("선택한 조건의 순위 기록이 없습니다.")
+        return
+    
+    stats = series_stats(df)
+    events = top_n_events(df, top_n)
+    
+    # 요약
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("시계열 수", len(stats))
+    col2.metric("평균 노출 비율", f"{stats['found_ratio'].mean():.0%}")
+    col3.metric(f"상위 {top_n}위 진입", int((events['event'] == '진입').sum()))
+    col4.metric(f"상위 {top_n}위 이탈", int((events['event'] == '이탈').sum()))
+    
+    # 시계열별 요약 표
+    st.subheader("📋 키워드별 순위 요약")
+    st.dataframe(
+        stats[list(TREND_STAT_LABELS)].rename(columns=TREND_STAT_LABELS),
+        use_container_width=True, hide_index=True,
+        column_config={'노출 비율': st.column_config.ProgressColumn(min_value=0, max_value=1, format="%.2f")},
+    )
+    
+    # 선택한 치과의 순위 변화 (이동 중앙값)
+    st.subheader("📉 순위 변화")
+    chart_clinic = st.selectbox("그래프로 볼 치과", selected_clinics)
+    clinic_df = df[df['clinic_name'] == chart_clinic]
+    keywords = sorted(clinic_df['keyword'].unique())
+    chart_keywords = st.multiselect("키워드", keywords, default=keywords[:5])
+    chart_df = rolling_rank(clinic_df[clinic_df['keyword'].isin(chart_keywords)], window)
+    if not chart_df.empty:
+        st.line_chart(rank_pivot(chart_df.assign(rank=chart_df['rolling_rank'])))
+        st.caption("순위는 낮을수록 좋습니다. 순위 밖인 검색은 이동 중앙값 계산에서 빠집니다.")
+    
+    # 상위 N위 진입/이탈
+    st.subheader(f"🔔 상위 {top_n}위 진입/이탈")
+    if events.empty:
+        st.info("진입/이탈 이벤트가 없습니다.")
+    else:
+        st.dataframe(
+            events.head(RESULT_PAGE_SIZE).rename(columns={**TREND_STAT_LABELS, 'checked_at': '검색 시각',
+                                                          'rank': '순위', 'event': '이벤트'}),
+            use_container_width=True, hide_index=True,
+        )
+
+def submit_search_job(delay, selected_clinic_names=None, search_types=None, incremental=False, resume_run_id=None):
+    """검색 작업을 백그라운드 대기열에 넣고 작업 ID 반환 (입력이 잘못되면 None)
+
+    검색은 작업 실행기의 워커 스레드에서 돌고, 화면은 작업 테이블의 진행 상황만 읽는다.
+    끝난 검색은 체크포인트 저널에 바로 기록되므로 서버가 재시작돼도 이어서 실행된다.
+    """
     clinics = load_clinics()
     if not clinics:
         st.error("설정된 치과가 없습니다. '🏥 치과 관리' 메뉴에서 치과를 추가해주세요.")
-        return
+        return None
     
     # 선택된 치과만 필터링
     if selected_clinic_names is not None:
         clinics = [clinic for clinic in clinics if clinic['name'] in selected_clinic_names]
     if not clinics:
         st.warning("선택된 치과가 없습니다.")
-        return
+        return None
     
     # 검색 유형 확인
     if not search_types:
         st.warning("검색할 유형을 선택해주세요.")
-        return
+        return None
     
-    # 진행 상황 표시
-    progress_bar = st.progress(0)
-    status_text = st.empty()
+    runner = get_job_runner()
+    if runner is None:
+        return None
+    return runner.submit(clinics, search_types, delay, incremental, resume_run_id)
+
+def show_search_job(job_id):
+    """작업 진행 상황 또는 결과 표시 (아직 끝나지 않았으면 True 반환)"""
+    runner = get_job_runner()
+    job = runner.store.get(job_id) if runner is not None else None
+    if job is None:
+        st.warning("검색 작업을 찾을 수 없습니다.")
+        return False
     
-    try:
-        # 검색 순위 체커 초기화
-        status_text.text("🔧 검색 순위 체커 초기화 중...")
-        checker = get_search_checker()
-        if checker is None:
-            st.error("검색 체커 초기화에 실패했습니다.")
-            return
-            
-        progress_bar.progress(10)
-        
-        all_results = []
-        total_clinics = len(clinics)
-        
-        # 각 치과에 대해 검색
-        for i, clinic in enumerate(clinics):
-            progress = 10 + (i / total_clinics) * 80
-            progress_bar.progress(int(progress))
-            
-            # 치과 카드 표시
-            with st.container():
-                st.markdown(f"""
-                <div class="clinic-card">
-                    <h3>🏥 {clinic['name']}</h3>
-                    <p><strong>주소:</strong> {clinic['address']}</p>
-                    <p><strong>키워드:</strong> {', '.join(clinic['keywords'])}</p>
-                    <p><strong>검색 유형:</strong> {', '.join(search_types)}</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            status_text.text(f"🔍 {clinic['name']} 검색 중... ({', '.join(search_types)})")
-            
-            # 선택된 검색 유형에 따라 검색 수행
-            search_results = checker.check_all_ranks(clinic['name'], clinic['keywords'], search_types)
-            all_results.extend(search_results)
-            
-            # 실시간 결과 표시
-            if search_results:
-                df_temp = pd.DataFrame(search_results)
-                st.dataframe(df_temp, use_container_width=True)
-            
-            time.sleep(delay)
-        
-        # 결과 저장
-        progress_bar.progress(90)
-        status_text.text("💾 결과 저장 중...")
-        
-        if all_results:
-            filepath = checker.save_results(all_results)
-            progress_bar.progress(100)
-            status_text.text("✅ 검색 완료!")
-            
-            # 성공 메시지
-            st.success(f"검색이 완료되었습니다! 결과 파일: {filepath}")
-            
-            # 결과 요약 표시
-            show_search_summary(all_results)
-            
-            # 세션에 결과 저장
-            st.session_state.search_results = all_results
-            st.session_state.result_filepath = filepath
-        
+    if job['status'] == QUEUED:
+        st.info(f"⏳ 대기 중... (앞선 작업 {runner.store.queue_position(job_id)}건)")
+        return True
+    
+    if job['status'] == RUNNING:
+        # 진행 상황 표시
+        done, total = job['done'], job['total']
+        st.progress(int(10 + (done / total) * 80) if total else 10)
+        if total:
+            st.text(f"🔍 [{done}/{total}] {job['message']}")
         else:
-            st.warning("검색 결과가 없습니다.")
-        
-        # 리소스 정리
-        checker.close()
+            st.text(f"🔍 {job['message'] or '검색 준비 중...'}")
         
-    except Exception as e:
-        st.error(f"검색 중 오류가 발생했습니다: {str(e)}")
-        progress_bar.progress(0)
-        status_text.text("❌ 오류 발생")
-
-def show_search_summary(results):
-    """검색 결과 요약 표시"""
-    st.subheader("📋 검색 결과 요약")
+        # 지금까지 도착한 결과만 이어 붙여 표 하나로 표시
+        stream = get_result_stream(job_id)
+        last_id, records = runner.store.records_since(job_id, stream.last_id)
+        stream.extend(records, last_id)
+        show_result_stream(stream)
+        return True
     
-    if not results:
-        st.info("검색 결과가 없습니다.")
-        return
+    if job['status'] == FAILED:
+        st.error(f"검색 중 오류가 발생했습니다: {job['error']}")
+        return False
     
-    df = pd.DataFrame(results)
+    # 완료: 재사용한 결과까지 포함한 전체 결과로 한 번만 표를 만든다
+    stream = get_result_stream(job_id, job['results'] or [])
+    if not stream.rows:
+        st.warning("검색 결과가 없습니다.")
+        return False
     
-    # 통계 정보
-    col1, col2, col3 = st.columns(3)
+    st.progress(100)
     
-    with col1:
-        st.metric("총 검색 결과", len(results))
+    # 성공 메시지
+    st.success(f"검색이 완료되었습니다! 결과 파일: {job['result_path']}")
     
-    with col2:
-        found_results = len(df[df['rank'] != '순위 밖'])
-        st.metric("순위 내 결과", found_results)
+    # 결과 요약 표시
+    show_search_summary(stream)
     
-    with col3:
-        if len(results) > 0:
-            avg_rank = df[df['rank'].apply(lambda x: isinstance(x, int))]['rank'].mean()
-            st.metric("평균 순위", f"{avg_rank:.1f}" if not pd.isna(avg_rank) else "N/A")
+    # 세션에 결과 저장
+    if st.session_state.get('search_results_job') != job_id:
+        st.session_state.search_results = job['results']
+        st.session_state.search_frame = stream.frame
+        st.session_state.search_results_job = job_id
+        st.session_state.search_run_id = job['params'].get('resume_run_id') or job_id
+        st.session_state.result_filepath = job['result_path']
+    return False
+
+# 검색 중에 표시할 최근 결과 행 수 (1초마다 다시 그리는 비용을 결과 수와 관계없이 일정하게)
+STREAM_TAIL_ROWS = 200
+
+def get_result_stream(job_id, final_results=None):
+    """세션에 보관한 작업의 결과 누적기 (final_results 를 주면 완료 결과로 한 번만 교체)"""
+    key = (job_id, final_results is not None)
+    if st.session_state.get('result_stream_key') != key:
+        st.session_state.result_stream = (
+            ResultStream.from_results(final_results) if final_results is not None else ResultStream()
+        )
+        st.session_state.result_stream_key = key
+    return st.session_state.result_stream
+
+def show_result_counters(summary):
+    """상태별 건수 표시"""
+    col1, col2, col3, col4 = st.columns(4)
+    col1.metric("총 검색 결과", summary['total'])
+    col2.metric("순위 내", summary['found'])
+    col3.metric("순위 밖", summary['not_found'])
+    col4.metric("오류", summary['error'])
+
+def show_result_stream(stream):
+    """검색 중 결과: 상태별 건수와 최근 결과 표 (전체 표는 검색이 끝난 뒤 한 번만 그린다)"""
+    show_result_counters(stream.summary())
+    if stream.rows > STREAM_TAIL_ROWS:
+        st.caption(f"최근 {STREAM_TAIL_ROWS}건만 표시합니다. 검색이 끝나면 전체 결과를 보여 줍니다.")
+    st.dataframe(stream.tail(STREAM_TAIL_ROWS), use_container_width=True, hide_index=True)
+
+def show_recent_jobs():
+    """최근 검색 작업 목록"""
+    runner = get_job_runner()
+    jobs = runner.store.list_jobs() if runner is not None else []
+    if not jobs:
+        return
+    with st.expander("🗂️ 최근 검색 작업"):
+        df = pd.DataFrame(jobs)[['job_id', 'status', 'created_at', 'finished_at', 'done', 'total', 'error']]
+        df['status'] = df['status'].map(JOB_STATUS_LABELS)
+        df.columns = ['작업 ID', '상태', '요청 시각', '완료 시각', '완료', '전체', '오류']
+        st.dataframe(df, use_container_width=True, hide_index=True)
+
+def show_search_summary(stream):
+    """검색 결과 요약 표시 (ResultStream 의 표와 건수를 그대로 사용)"""
+    st.subheader("📋 검색 결과 요약")
+    
+    df = stream.frame
+    summary = stream.summary()
+    
+    # 통계 정보
+    show_result_counters(summary)
+    if summary['found']:
+        st.metric("평균 순위", f"{summary['avg_rank']:.1f}")
     
     # 검색 유형별 통계
     st.subheader("🔍 검색 유형별 결과")
@@ -437,8 +670,9 @@ def show_search_summary(results):
 def show_statistics():
     """통계 정보 표시"""
     if 'search_results' in st.session_state:
-        results = st.session_state.search_results
-        df = pd.DataFrame(results)
+        df = st.session_state.get('search_frame')
+        if df is None:
+            df = records_to_frame(st.session_state.search_results)
         
         # 치과별 결과 수
         st.subheader("🏥 치과별 결과")
@@ -455,12 +689,35 @@ def show_statistics():
         keyword_counts = df['keyword'].value_counts()
         st.bar_chart(keyword_counts)
         
-        # 순위 분포
+        # 순위 분포 (순위 밖/오류는 상태별로 따로 센다)
         st.subheader("📈 순위 분포")
-        rank_counts = df['rank'].value_counts()
-        st.bar_chart(rank_counts)
+        rank_counts = df['rank'].value_counts().sort_index()
+        rank_counts.index = rank_counts.index.astype(str)
+        status_counts = df.loc[df['status'] != RankStatus.FOUND.value, 'status'].value_counts()
+        st.bar_chart(pd.concat([rank_counts, status_counts[status_counts > 0]]))
+        
+        show_stage_timings(st.session_state.get('search_run_id'))
     else:
         st.info("검색을 실행하면 통계가 표시됩니다.")
 
+def show_stage_timings(run_id):
+    """실행의 단계별 소요 시간 (검색 유형별 누적 시간 차트와 표)"""
+    summary = load_metrics(config, run_id)
+    if not summary or not summary['stages']:
+        return
+    
+    st.subheader("⏱️ 단계별 소요 시간")
+    st.caption(f"실행 {summary['wall_s']:.1f}초 · 동시 요청은 겹쳐서 합산하므로 합계가 실행 시간보다 클 수 있습니다.")
+    df = summary_frame(summary)
+    df['stage'] = df['stage'].map(STAGE_LABELS)
+    st.bar_chart(df.pivot_table(index='stage', columns='search_type', values='seconds', aggfunc='sum', observed=True))
+    st.dataframe(
+        df.rename(columns={
+            'search_type': '검색 유형', 'stage': '단계', 'count': '횟수',
+            'seconds': '누적(초)', 'mean_ms': '평균(ms)', 'bytes': '바이트',
+        }),
+        use_container_width=True, hide_index=True,
+    )
+
 if __name__ == "__main__":
     main() 
\ No newline at end of file